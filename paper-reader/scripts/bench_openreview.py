@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for OpenReviewFetcher against openreview_stub.py.
+
+Starts the stand-in server in-process (synthetic venue, or recorded fixtures),
+points a fetcher at it, and measures search, review-fetch and bulk-export
+latency and throughput, with request counts, so caching and concurrency
+changes can be compared without touching openreview.net.
+
+Usage:
+    python bench_openreview.py [--submissions 2000] [--latency 0.05] [-o results.json]
+                               [--fixtures DIR --venue V] [--baseline previous.json]
+
+Cases:
+    search_cold        title search, empty venue cache (downloads the venue)
+    search_disk        title search in a new fetcher, venue cache on disk
+    search_warm        repeated title searches in one fetcher
+    reviews_cold       get_reviews() per forum, nothing memoised
+    reviews_warm       the same forums again (forum snapshots memoised)
+    forum              get_forum() per forum, fresh fetcher
+    export_jobs1       export_forums() with 1 job
+    export_jobsN       export_forums() with --jobs
+
+Exit codes: 0=ok, 1=regressions against --baseline, 2=setup failure
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Dict, Any
+
+try:
+    from . import openreview_api as api
+    from . import openreview_export as export
+    from . import openreview_stub as stub
+except ImportError:
+    import openreview_api as api
+    import openreview_export as export
+    import openreview_stub as stub
+
+DEFAULT_VENUE = "ICLR.cc/2024/Conference"
+REGRESSION = 0.8  # ops/s below this fraction of the baseline is a regression
+
+
+def measure(case: str, ops: List[Callable[[], Any]], server, per_op: bool = True) -> Dict[str, Any]:
+    """Run ops in order; wall time, per-op latency and requests served."""
+    requests = server.requests
+    times = []
+    start = time.perf_counter()
+    for op in ops:
+        t = time.perf_counter()
+        op()
+        times.append(time.perf_counter() - t)
+    total = time.perf_counter() - start
+    row = {"case": case, "ops": len(ops), "seconds": round(total, 4),
+           "ops_per_s": round(len(ops) / total, 2) if total else None,
+           "requests": server.requests - requests}
+    if per_op and times:
+        times.sort()
+        row.update(mean_ms=round(statistics.mean(times) * 1000, 3),
+                   p50_ms=round(times[len(times) // 2] * 1000, 3),
+                   p95_ms=round(times[min(len(times) - 1, int(len(times) * 0.95))] * 1000, 3))
+    p50 = f"{row['p50_ms']:>9.2f} ms p50" if "p50_ms" in row else f"{total:>9.2f} s total"
+    print(f"{case:<14} {row['ops']:>5} ops  {row['ops_per_s'] or 0:>9.1f} ops/s  {p50}  "
+          f"{row['requests']:>6} requests", file=sys.stderr)
+    return row
+
+
+def run(args) -> List[Dict[str, Any]]:
+    fixtures = Path(args.fixtures) if args.fixtures else None
+    stores = stub.load_stores(fixtures, 0 if fixtures else args.submissions, [args.venue])
+    server = stub.start_server(stores, latency=args.latency, jitter=args.jitter,
+                               error_rate=args.error_rate)
+    urls = server.baseurls
+
+    submissions = [n for n in stores["v2"].by_invitation.get(f"{args.venue}/-/Submission", [])]
+    if not submissions:
+        server.shutdown()
+        raise SystemExit(f"ERROR: no submissions for {args.venue} in the corpus")
+    rng = random.Random(0)
+    titles = [stores["v2"].notes[f]["content"]["title"]["value"]
+              for f in rng.sample(submissions, min(args.queries, len(submissions)))]
+    forums = rng.sample(submissions, min(args.forums, len(submissions)))
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        def fetcher(**kw):
+            return api.OpenReviewFetcher(cache_dir=tmp, baseurl_v2=urls["v2"],
+                                         baseurl_v1=urls["v1"], **kw)
+
+        f = fetcher()
+        results.append(measure("search_cold", [lambda: f.search_paper(titles[0], venue=args.venue)],
+                               server))
+        results.append(measure("search_disk", [lambda: fetcher().search_paper(titles[0], venue=args.venue)],
+                               server))
+        results.append(measure("search_warm", [lambda t=t: f.search_paper(t, venue=args.venue)
+                                               for t in titles], server))
+
+        f = fetcher()
+        results.append(measure("reviews_cold", [lambda x=x: f.get_reviews(x) for x in forums], server))
+        results.append(measure("reviews_warm", [lambda x=x: f.get_reviews(x) for x in forums], server))
+        f = fetcher()
+        results.append(measure("forum", [lambda x=x: f.get_forum(x) for x in forums], server))
+
+        for jobs in (1, args.jobs):
+            out = Path(tmp) / f"export-{jobs}"
+            f = fetcher(forum_cache_size=0)
+            row = measure(f"export_jobs{'N' if jobs > 1 else 1}",
+                          [lambda: export.export_forums(f, forums, str(out), jobs=jobs, verbose=False)],
+                          server, per_op=False)
+            row.update(jobs=jobs, forums=len(forums),
+                       forums_per_s=round(len(forums) / row["seconds"], 2) if row["seconds"] else None)
+            results.append(row)
+
+    server.shutdown()
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]]) -> List[str]:
+    before = {r["case"]: r for r in baseline if r.get("ops_per_s")}
+    found = []
+    for r in results:
+        old = before.get(r["case"])
+        if old and r.get("ops_per_s") and r["ops_per_s"] < old["ops_per_s"] * REGRESSION:
+            found.append(f"{r['case']}: {r['ops_per_s']:.2f} ops/s (baseline {old['ops_per_s']:.2f})")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline OpenReviewFetcher benchmark")
+    parser.add_argument("--venue", default=DEFAULT_VENUE, help="Venue to benchmark")
+    parser.add_argument("--fixtures", help="Recorded fixtures (openreview_stub.py --record) instead of synthetic data")
+    parser.add_argument("--submissions", type=int, default=2000, help="Synthetic venue size")
+    parser.add_argument("--queries", type=int, default=50, help="Title searches in search_warm")
+    parser.add_argument("--forums", type=int, default=100, help="Forums for review fetch and export")
+    parser.add_argument("--jobs", "-j", type=int, default=8, help="Jobs for export_jobsN")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of failing requests")
+    parser.add_argument("--out", "-o", help="Write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare ops/s against")
+    args = parser.parse_args()
+
+    if not api.OPENREVIEW_AVAILABLE:
+        print("ERROR: openreview-py is not installed (pip install openreview-py)", file=sys.stderr)
+        sys.exit(2)
+
+    results = run(args)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "venue": args.venue,
+            "corpus": args.fixtures or f"synthetic:{args.submissions}",
+            "latency": args.latency,
+            "error_rate": args.error_rate,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline)
+        for line in regressions:
+            print(f"REGRESSION: {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Paper ingest: PDF → Markdown, section index and OpenReview reviews in one call.
+
+The title is read from the PDF's first page with PyMuPDF (a few ms), so the
+OpenReview lookup starts immediately and runs while the pdf skill's pdf2md.py
+converts the PDF with Marker (minutes). Without a readable title the lookup
+falls back to the converted Markdown's first heading, after conversion.
+
+Usage:
+    python ingest_paper.py paper.pdf [-o paper.md] [--venue ICLR.cc/2024/Conference] [--year 2024]
+    python ingest_paper.py papers/ -o notes/ -j 2 [--summary bundles.json]
+    python ingest_paper.py paper.pdf --title "Exact Paper Title" --route
+
+    from scripts.ingest_paper import ingest
+    bundle = ingest("paper.pdf")
+    bundle["markdown"], bundle["index"], bundle["reviews"]
+
+Writes next to the Markdown: <stem>.index.json (section index, from pdf2md),
+<stem>.openreview.md and <stem>.reviews.json when reviews are found.
+
+pdf2md.py is looked up in $PDF_SKILL_SCRIPTS, the sibling pdf/scripts
+directory, then ~/.claude/skills/pdf/scripts and ~/.codex/skills/pdf/scripts.
+
+Exit codes: as pdf2md.py (0=ok, 1=txt fallback, 2=failure, 3=degraded pages;
+batch mode: the worst over all files). Review lookup failures only warn.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+
+def find_pdf_scripts() -> Optional[Path]:
+    """Directory holding the pdf skill's pdf2md.py, or None."""
+    candidates = [os.environ.get("PDF_SKILL_SCRIPTS")]
+    here = Path(__file__).resolve().parent
+    candidates += [here.parent.parent / "pdf" / "scripts",
+                   Path.home() / ".claude" / "skills" / "pdf" / "scripts",
+                   Path.home() / ".codex" / "skills" / "pdf" / "scripts"]
+    for candidate in candidates:
+        if candidate and (Path(candidate) / "pdf2md.py").is_file():
+            return Path(candidate)
+    return None
+
+
+# pdf2md imports its sibling modules (md_index, pdf_cache, ...) by name, so its
+# directory goes on sys.path; done at import so process-pool workers see it too
+PDF_SCRIPTS = find_pdf_scripts()
+if PDF_SCRIPTS and str(PDF_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(PDF_SCRIPTS))
+try:
+    import pdf2md
+    import md_index
+    PDF2MD_AVAILABLE = True
+except ImportError:
+    PDF2MD_AVAILABLE = False
+
+try:
+    import fitz  # PyMuPDF
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
+try:
+    from .openreview_api import OpenReviewFetcher, OPENREVIEW_AVAILABLE, format_reviews_markdown
+except ImportError:
+    from openreview_api import OpenReviewFetcher, OPENREVIEW_AVAILABLE, format_reviews_markdown
+
+REVIEW_JOBS = 4
+TITLE_MIN_CHARS = 10
+TITLE_MAX_CHARS = 300
+_FOOTNOTE_MARKS = re.compile(r"[\*∗†‡§¶]+|\s\d$")
+
+
+def _clean_title(text: str) -> Optional[str]:
+    text = _FOOTNOTE_MARKS.sub("", " ".join(text.split())).strip(" .,:;")
+    return text if TITLE_MIN_CHARS <= len(text) <= TITLE_MAX_CHARS else None
+
+
+def extract_title(pdf: Path) -> Optional[str]:
+    """
+    Paper title from the first page: the run of largest-font lines in its
+    top half (rotated text such as the arXiv stamp ignored), else the PDF
+    metadata title. None without PyMuPDF or when nothing title-like is found.
+    """
+    if not FITZ_AVAILABLE:
+        return None
+    try:
+        with fitz.open(str(pdf)) as doc:
+            if not doc.page_count:
+                return None
+            page = doc[0]
+            lines = []
+            for block in page.get_text("dict")["blocks"]:
+                for line in block.get("lines", []):
+                    if abs(line["dir"][1]) > 0.1:
+                        continue
+                    spans = [s for s in line["spans"] if s["text"].strip()]
+                    if spans and line["bbox"][1] < page.rect.height / 2:
+                        lines.append((line["bbox"][1], max(s["size"] for s in spans),
+                                      " ".join(s["text"].strip() for s in spans)))
+            meta = (doc.metadata or {}).get("title") or ""
+    except Exception:
+        return None
+
+    if lines:
+        biggest = max(size for _, size, _ in lines)
+        title, last_y = [], None
+        for y, size, text in sorted(lines):
+            if size < biggest - 0.5:
+                continue
+            if last_y is not None and y - last_y > 2.5 * biggest:
+                break  # a second large run further down, not part of the title
+            title.append(text)
+            last_y = y
+        found = _clean_title(" ".join(title))
+        if found:
+            return found
+    if meta and not re.search(r"\.(pdf|dvi|tex|docx?)$|^Microsoft Word", meta, re.I):
+        return _clean_title(meta)
+    return None
+
+
+def lookup_reviews(fetcher, title: str, venue: Optional[str] = None,
+                   year: Optional[int] = None) -> Dict[str, Any]:
+    """get_reviews_by_title() that reports failures in the result instead of raising."""
+    start = time.monotonic()
+    try:
+        result = fetcher.get_reviews_by_title(title, venue, year)
+    except Exception as e:
+        result = {"success": False, "error": f"{type(e).__name__}: {e}", "paper": None, "reviews": []}
+    result["seconds"] = round(time.monotonic() - start, 2)
+    return result
+
+
+def _first_heading(markdown: Optional[str]) -> Optional[str]:
+    if not markdown or Path(markdown).suffix != ".md" or not Path(markdown).exists():
+        return None
+    try:
+        headings = list(md_index.iter_headings(md_index.load_index(Path(markdown))["headings"]))
+    except (OSError, ValueError, KeyError):
+        return None
+    return _clean_title(headings[0]["title"]) if headings else None
+
+
+def _bundle(pdf: Path, title: Optional[str], converted: Dict[str, Any],
+            reviews: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Collect the results for one PDF and write the review files next to its Markdown."""
+    bundle = {
+        "pdf": str(pdf),
+        "title": title,
+        "markdown": converted.get("output"),
+        "index": converted.get("index"),
+        "engine": converted.get("engine"),
+        "exit_code": converted.get("exit_code", 2),
+        "convert_seconds": converted.get("seconds"),
+        "reviews": reviews,
+    }
+    if converted.get("degraded_pages"):
+        bundle["degraded_pages"] = converted["degraded_pages"]
+    if reviews and reviews.get("success") and bundle["markdown"]:
+        base = Path(bundle["markdown"]).with_suffix("")
+        summary = base.with_name(base.name + ".openreview.md")
+        summary.write_text(format_reviews_markdown(reviews), encoding="utf-8")
+        raw = base.with_name(base.name + ".reviews.json")
+        raw.write_text(json.dumps(reviews, indent=2, ensure_ascii=False, default=str) + "\n",
+                       encoding="utf-8")
+        bundle["reviews_markdown"] = str(summary)
+    return bundle
+
+
+def ingest_batch(pdfs: List[Path], outputs: List[Path], *,
+                 titles: Optional[List[Optional[str]]] = None,
+                 venue: Optional[str] = None,
+                 year: Optional[int] = None,
+                 reviews: bool = True,
+                 jobs: int = 1,
+                 review_jobs: int = REVIEW_JOBS,
+                 fetcher=None,
+                 convert_opts: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Ingest PDFs with shared pools: conversions in `jobs` processes (in this
+    process when jobs <= 1 or for a single PDF, whose page chunks then run
+    `jobs` at a time unless convert_opts sets chunk_jobs), review lookups in
+    `review_jobs` threads on one OpenReviewFetcher, so venue submission lists
+    are downloaded once for all.
+
+    Each PDF's lookup is submitted as soon as its title is read and overlaps
+    with the conversions. Returns one bundle per PDF, in input order.
+    """
+    if not PDF2MD_AVAILABLE:
+        raise ImportError("pdf2md.py not found: install the pdf skill next to paper-reader "
+                          "or set PDF_SKILL_SCRIPTS")
+    convert_opts = dict(convert_opts or {})
+    titles = list(titles) if titles else [None] * len(pdfs)
+    titles = [t or extract_title(pdf) for t, pdf in zip(titles, pdfs)]
+
+    if reviews and fetcher is None:
+        if OPENREVIEW_AVAILABLE:
+            fetcher = OpenReviewFetcher(max_workers=review_jobs)
+        else:
+            print("WARN: openreview-py is not installed, skipping reviews (pip install openreview-py)",
+                  file=sys.stderr)
+            reviews = False
+
+    lookups = ThreadPoolExecutor(max_workers=max(1, review_jobs)) if reviews else None
+    converter = None
+    if jobs > 1 and len(pdfs) > 1:
+        # spawn, not fork: the lookup threads may hold locks (imports, sockets) at fork time
+        converter = ProcessPoolExecutor(max_workers=min(jobs, len(pdfs)),
+                                        mp_context=multiprocessing.get_context("spawn"))
+    convert_opts.setdefault("chunk_jobs", 1 if converter else max(1, jobs))
+    try:
+        pending: List[Optional[Future]] = []
+        for title in titles:
+            pending.append(lookups.submit(lookup_reviews, fetcher, title, venue, year)
+                           if lookups and title else None)
+
+        jobs_args = [(pdf, out, convert_opts) for pdf, out in zip(pdfs, outputs)]
+        if converter:
+            converted = converter.map(pdf2md._convert_job, jobs_args)
+        else:
+            converted = (pdf2md._convert_job(job) for job in jobs_args)
+
+        bundles = []
+        for pdf, title, lookup, result in zip(pdfs, titles, pending, converted):
+            if lookup is None and lookups:
+                # no title on the first page: look up the Markdown's first heading instead
+                title = _first_heading(result.get("output"))
+                lookup = lookups.submit(lookup_reviews, fetcher, title, venue, year) if title else None
+            found = lookup.result() if lookup else None
+            if reviews and not title:
+                print(f"WARN: no title found in {pdf.name}, skipping reviews (use --title)", file=sys.stderr)
+            bundles.append(_bundle(pdf, title, result, found))
+        return bundles
+    finally:
+        if converter:
+            converter.shutdown()
+        if lookups:
+            lookups.shutdown()
+
+
+def ingest(pdf, output=None, *, title: Optional[str] = None, venue: Optional[str] = None,
+           year: Optional[int] = None, reviews: bool = True, fetcher=None, **convert_opts) -> Dict[str, Any]:
+    """
+    Ingest one PDF: the OpenReview lookup runs in a thread while pdf2md
+    converts in this one. convert_opts go to pdf2md.convert_one (pages,
+    route, force, ...). Returns the bundle: pdf, title, markdown, index,
+    engine, exit_code, convert_seconds, reviews (get_reviews_by_title result).
+    """
+    pdf = Path(pdf)
+    output = Path(output) if output else pdf.with_suffix(".md")
+    return ingest_batch([pdf], [output], titles=[title], venue=venue, year=year, reviews=reviews,
+                        fetcher=fetcher, convert_opts=convert_opts)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF → Markdown + section index + OpenReview reviews")
+    parser.add_argument("pdf", nargs="+", help="Input PDF path(s), directories or glob patterns")
+    parser.add_argument("--output", "-o",
+                        help="Output path (default: same dir, .md extension); output directory in batch mode "
+                             "(input subfolders are mirrored)")
+    parser.add_argument("--title", help="Paper title for the review lookup (single PDF; default: from page 1)")
+    parser.add_argument("--venue", help="OpenReview venue filter, e.g. ICLR.cc/2024/Conference")
+    parser.add_argument("--year", type=int, help="OpenReview year filter")
+    parser.add_argument("--no-reviews", action="store_true", help="Convert only")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Parallel conversions: files in batch mode, page chunks of a single PDF "
+                             "(default: by CPU cores and RAM)")
+    parser.add_argument("--review-jobs", type=int, default=REVIEW_JOBS, help="Concurrent review lookups")
+    parser.add_argument("--recursive", "-r", action="store_true", help="Search directories recursively")
+    parser.add_argument("--pages", help="Page range, e.g. '0,5-10,20'")
+    parser.add_argument("--route", action="store_true", help="pdf2md --route (Marker only where needed)")
+    parser.add_argument("--no-images", action="store_true", help="Skip image extraction")
+    parser.add_argument("--force", action="store_true", help="Overwrite existing output")
+    parser.add_argument("--summary", help="Write all bundles as JSON to this file")
+    args = parser.parse_args()
+
+    if not PDF2MD_AVAILABLE:
+        print("ERROR: pdf2md.py not found (install the pdf skill next to paper-reader "
+              "or set PDF_SKILL_SCRIPTS)", file=sys.stderr)
+        sys.exit(2)
+
+    pdfs = pdf2md.collect_pdfs(args.pdf, recursive=args.recursive)
+    if not pdfs:
+        print("ERROR: no PDF files found", file=sys.stderr)
+        sys.exit(2)
+    if args.title and len(pdfs) > 1:
+        print("ERROR: --title needs a single PDF", file=sys.stderr)
+        sys.exit(2)
+
+    if len(pdfs) == 1 and not (args.output and Path(args.output).is_dir()):
+        outputs = [Path(args.output) if args.output else pdfs[0].with_suffix(".md")]
+    else:
+        try:
+            outputs = pdf2md.batch_outputs(pdfs, Path(args.output).resolve() if args.output else None)
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(2)
+    jobs = args.jobs if args.jobs is not None else pdf2md.default_jobs()
+
+    bundles = ingest_batch(
+        pdfs, outputs, titles=[args.title] if args.title else None, venue=args.venue, year=args.year,
+        reviews=not args.no_reviews, jobs=jobs, review_jobs=args.review_jobs,
+        convert_opts={"pages": args.pages, "route": args.route, "no_images": args.no_images,
+                      "force": args.force})
+
+    for b in bundles:
+        r = b["reviews"]
+        if r is None:
+            status = "no lookup"
+        elif r.get("success"):
+            status = f"{len(r['reviews'])} reviews ({r['paper']['venue']}, {r['seconds']}s)"
+        else:
+            status = f"no reviews: {r.get('error')}"
+        print(f"{'OK' if b['exit_code'] in (0, 3) else 'WARN'}: {Path(b['pdf']).name} → "
+              f"{b['markdown']} [{b['engine']}, {b['convert_seconds']}s]; {status}")
+    if args.summary:
+        Path(args.summary).write_text(json.dumps(bundles, indent=2, ensure_ascii=False, default=str) + "\n",
+                                      encoding="utf-8")
+    sys.exit(pdf2md.worst_exit_code(b["exit_code"] for b in bundles))
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,9 @@ Usage:
     # Method 2: Search by paper title
     result = fetcher.get_reviews_by_title("Attention Is All You Need")
 
+    # Paper, reviews and discussions from a single forum fetch
+    forum = fetcher.get_forum("LzPWWPAdY4")
+
     # Format for display
     print(format_reviews_markdown(result))
 
@@ -23,25 +26,202 @@ Note:
     For best results, use Google search: site:openreview.net [paper title]
     Then extract forum ID from URL and use get_reviews() directly.
 
+    Title search downloads a venue's whole submission list once and keeps it
+    in an on-disk cache ($OPENREVIEW_CACHE_DIR, default ~/.cache/openreview).
+    Cached lists are reused for OPENREVIEW_CACHE_TTL_HOURS (default 24) and then
+    refreshed incrementally with only the submissions created since.
+
+    fetcher.stats counts API calls (latency, HTTP requests, notes), cache hits
+    and API v1 fallbacks; configure_logging() emits the same events as log
+    lines or JSON.
+
 Requirements:
     pip install openreview-py
 """
 
+import gzip
+import heapq
+import json
+import logging
+import math
+import os
 import re
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple, Callable
+from dataclasses import dataclass, asdict, field
+
+from importlib.util import find_spec
+
+# openreview-py (and requests under it) take ~0.3s to import: check they exist
+# here, import them on first API call
+OPENREVIEW_AVAILABLE = find_spec("openreview") is not None
+REQUESTS_AVAILABLE = find_spec("requests") is not None
+
+# Same variables openreview-py reads; point them at openreview_stub.py to work offline
+API_V2_URL = os.environ.get('OPENREVIEW_API_BASEURL_V2') or 'https://api2.openreview.net'
+API_V1_URL = os.environ.get('OPENREVIEW_BASEURL') or 'https://api.openreview.net'
+
+_CLIENTS: Dict[Tuple, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_client(api: int, baseurl: str, username: Optional[str], password: Optional[str]):
+    """OpenReview client for (api, baseurl, credentials), created once per process."""
+    key = (api, baseurl, username, password)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            import openreview
+            if api == 2:
+                client = openreview.api.OpenReviewClient(baseurl=baseurl, username=username,
+                                                         password=password)
+            else:
+                client = openreview.Client(baseurl=baseurl, username=username, password=password)
+            session = getattr(client, 'session', None)
+            if session is not None:
+                session.hooks['response'].append(_count_request)
+            _CLIENTS[key] = client
+        return client
+
+
+# HTTP requests made by the API call running in this thread (see OpenReviewFetcher._timed)
+_CALL = threading.local()
+
 
-try:
-    import openreview
-    OPENREVIEW_AVAILABLE = True
-except ImportError:
-    OPENREVIEW_AVAILABLE = False
+def _count_request(response, *args, **kwargs):
+    """requests response hook: count pages fetched for the current API call."""
+    if getattr(_CALL, 'requests', None) is not None:
+        _CALL.requests += 1
+
+
+logger = logging.getLogger("openreview_api")
+
+
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per log line: time, level, message and the event's fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, 'event', None) or {})
+        return json.dumps(entry, ensure_ascii=False, default=str)
 
-try:
-    import requests  # noqa: F401
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+
+def configure_logging(level: str = "INFO", json_format: bool = False, stream=None) -> logging.Handler:
+    """
+    Send fetcher log events to stderr (or stream).
+
+    INFO shows failures and v1 fallbacks; DEBUG adds every API call and lookup
+    with its latency. json_format=True writes one JSON object per event.
+    """
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonLogFormatter() if json_format
+                         else logging.Formatter("%(levelname)s: %(message)s"))
+    for old in [h for h in logger.handlers if getattr(h, '_openreview_api', False)]:
+        logger.removeHandler(old)
+    handler._openreview_api = True
+    logger.addHandler(handler)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+    return handler
+
+
+class FetcherStats:
+    """
+    Counters for one OpenReviewFetcher, safe to update from worker threads.
+
+    calls:     per operation ("api" calls and public "lookup" methods): count,
+               errors, total/max seconds, HTTP requests and notes fetched
+    notes:     notes fetched per venue and per forum
+    cache:     hits / misses per cache ("venue", "index", "forum")
+    fallbacks: lookups answered by API v1 because API v2 failed or found nothing
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls: Dict[str, Dict[str, Any]] = {}
+            self.notes_by_venue: Dict[str, int] = {}
+            self.notes_by_forum: Dict[str, int] = {}
+            self.cache: Dict[str, Dict[str, int]] = {}
+            self.fallbacks: Dict[str, int] = {}
+
+    def record_call(self, event: Dict[str, Any]):
+        key = f"{event['kind']}.{event['op']}"
+        seconds = event.get('seconds', 0.0)
+        notes = event.get('notes', 0)
+        with self._lock:
+            c = self.calls.setdefault(key, {"count": 0, "errors": 0, "seconds": 0.0,
+                                            "max_seconds": 0.0, "requests": 0, "notes": 0})
+            c["count"] += 1
+            c["errors"] += 'error' in event
+            c["seconds"] += seconds
+            c["max_seconds"] = max(c["max_seconds"], seconds)
+            c["requests"] += event.get('requests', 0)
+            c["notes"] += notes
+            if notes and event.get('venue'):
+                self.notes_by_venue[event['venue']] = self.notes_by_venue.get(event['venue'], 0) + notes
+            if notes and event.get('forum'):
+                self.notes_by_forum[event['forum']] = self.notes_by_forum.get(event['forum'], 0) + notes
+
+    def record_cache(self, name: str, hit: bool):
+        with self._lock:
+            c = self.cache.setdefault(name, {"hits": 0, "misses": 0})
+            c["hits" if hit else "misses"] += 1
+
+    def record_fallback(self, lookup: str):
+        with self._lock:
+            self.fallbacks[lookup] = self.fallbacks.get(lookup, 0) + 1
+
+    def hit_rate(self, name: str) -> Optional[float]:
+        c = self.cache.get(name)
+        total = c["hits"] + c["misses"] if c else 0
+        return c["hits"] / total if total else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = {}
+            for key, c in self.calls.items():
+                calls[key] = dict(c, seconds=round(c["seconds"], 4), max_seconds=round(c["max_seconds"], 4),
+                                  mean_ms=round(c["seconds"] / c["count"] * 1000, 2))
+            return {
+                "calls": calls,
+                "notes_by_venue": dict(self.notes_by_venue),
+                "notes_by_forum": dict(self.notes_by_forum),
+                "cache": {name: dict(c, hit_rate=self.hit_rate(name)) for name, c in self.cache.items()},
+                "fallbacks": dict(self.fallbacks),
+            }
+
+    def summary(self) -> str:
+        """Plain-text table of the counters."""
+        d = self.to_dict()
+        lines = [f"{'call':<28} {'count':>6} {'errors':>6} {'requests':>8} {'notes':>7} "
+                 f"{'mean ms':>9} {'max ms':>9} {'total s':>8}"]
+        for key, c in sorted(d["calls"].items(), key=lambda kv: -kv[1]["seconds"]):
+            lines.append(f"{key:<28} {c['count']:>6} {c['errors']:>6} {c['requests']:>8} {c['notes']:>7} "
+                         f"{c['mean_ms']:>9.1f} {c['max_seconds'] * 1000:>9.1f} {c['seconds']:>8.2f}")
+        for name, c in sorted(d["cache"].items()):
+            lines.append(f"cache {name}: {c['hits']} hits, {c['misses']} misses")
+        for lookup, n in sorted(d["fallbacks"].items()):
+            lines.append(f"fallback to API v1 ({lookup}): {n}")
+        for venue, n in sorted(d["notes_by_venue"].items()):
+            lines.append(f"notes from {venue}: {n}")
+        if d["notes_by_forum"]:
+            lines.append(f"notes from {len(d['notes_by_forum'])} forums: {sum(d['notes_by_forum'].values())}")
+        return "\n".join(lines)
 
 
 @dataclass
@@ -59,41 +239,437 @@ class PaperInfo:
         return asdict(self)
 
 
-@dataclass
+def _content_value(content: Optional[Dict[str, Any]], keys: Tuple[str, ...]) -> Any:
+    """First non-empty of content[key] for keys, API v2 {'value': ...} unwrapped."""
+    val = None
+    for key in keys:
+        val = (content or {}).get(key)
+        if isinstance(val, dict):
+            val = val.get('value', '')
+        if val:
+            return val
+    return val
+
+
+def _note_text(content: Optional[Dict[str, Any]]) -> str:
+    """Readable text of a comment note: its string fields, values unwrapped."""
+    parts = []
+    for key, val in (content or {}).items():
+        if isinstance(val, dict):
+            val = val.get('value')
+        if isinstance(val, str) and val.strip():
+            parts.append(val if key in ('comment', 'rebuttal', 'response') else f"{key}: {val}")
+    return "\n\n".join(parts)
+
+
+# Review field -> content keys tried in order, per API version
+REVIEW_KEYS = {
+    2: {
+        'rating': ('rating', 'recommendation'),
+        'confidence': ('confidence',),
+        'summary': ('summary', 'summary_of_the_paper'),
+        'strengths': ('strengths', 'strengths_and_contributions'),
+        'weaknesses': ('weaknesses', 'weaknesses_and_limitations'),
+        'questions': ('questions', 'questions_for_authors'),
+        'limitations': ('limitations',),
+        'soundness': ('soundness',),
+        'presentation': ('presentation',),
+        'contribution': ('contribution',),
+        'recommendation': ('recommendation', 'decision'),
+    },
+    1: {
+        'rating': ('rating', 'recommendation'),
+        'confidence': ('confidence',),
+        'summary': ('review', 'summary'),
+        'strengths': ('strengths',),
+        'weaknesses': ('weaknesses',),
+        'questions': ('questions',),
+        'limitations': ('limitations',),
+        'soundness': ('soundness',),
+        'presentation': ('presentation',),
+        'contribution': ('contribution',),
+        'recommendation': ('recommendation', 'decision'),
+    },
+}
+
+
+class _ContentField:
+    """Review field read from the note content on access, unless set explicitly."""
+    __slots__ = ('name',)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        if obj._values and self.name in obj._values:
+            return obj._values[self.name]
+        return _content_value(obj._content, REVIEW_KEYS[obj._api][self.name])
+
+    def __set__(self, obj, value):
+        if obj._values is None:
+            obj._values = {}
+        obj._values[self.name] = value
+
+
 class ReviewInfo:
-    """Review information from OpenReview."""
-    review_id: str
-    forum_id: str
-    reviewer: str  # Anonymous ID like "Reviewer_1"
-    rating: Optional[str] = None
-    confidence: Optional[str] = None
-    summary: Optional[str] = None
-    strengths: Optional[str] = None
-    weaknesses: Optional[str] = None
-    questions: Optional[str] = None
-    limitations: Optional[str] = None
-    soundness: Optional[str] = None
-    presentation: Optional[str] = None
-    contribution: Optional[str] = None
-    recommendation: Optional[str] = None
-    raw_content: Optional[Dict[str, Any]] = None
+    """
+    Review information from OpenReview.
+
+    Holds a reference to the review note's content (shared, not copied) and
+    reads rating, summary etc. from it on access, so venue-sized review lists
+    cost little more than the notes themselves.
+    """
+    FIELDS = ('review_id', 'forum_id', 'reviewer') + tuple(REVIEW_KEYS[2])
+    __slots__ = ('review_id', 'forum_id', 'reviewer', '_content', '_api', '_values')
+
+    rating = _ContentField()
+    confidence = _ContentField()
+    summary = _ContentField()
+    strengths = _ContentField()
+    weaknesses = _ContentField()
+    questions = _ContentField()
+    limitations = _ContentField()
+    soundness = _ContentField()
+    presentation = _ContentField()
+    contribution = _ContentField()
+    recommendation = _ContentField()
+
+    def __init__(self, review_id: str, forum_id: str, reviewer: str,
+                 raw_content: Optional[Dict[str, Any]] = None, api: int = 2, **values):
+        unknown = set(values) - set(REVIEW_KEYS[2])
+        if unknown:
+            raise TypeError(f"unknown review fields: {', '.join(sorted(unknown))}")
+        self.review_id = review_id
+        self.forum_id = forum_id
+        self.reviewer = reviewer  # Anonymous ID like "Reviewer_1"
+        self._content = raw_content
+        self._api = api
+        self._values = values or None
+
+    @property
+    def raw_content(self) -> Optional[Dict[str, Any]]:
+        return self._content
+
+    def to_dict(self, raw: bool = True) -> Dict[str, Any]:
+        row = {name: getattr(self, name) for name in self.FIELDS}
+        if raw:
+            row['raw_content'] = self._content
+        return row
+
+    def to_json(self, raw: bool = False) -> str:
+        return json.dumps(self.to_dict(raw), ensure_ascii=False, default=str)
+
+    def to_markdown(self) -> str:
+        return "\n".join(_review_markdown(self.to_dict(raw=False)))
+
+    def __eq__(self, other):
+        if not isinstance(other, ReviewInfo):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"ReviewInfo(review_id={self.review_id!r}, reviewer={self.reviewer!r}, rating={self.rating!r})"
+
+
+class DiscussionInfo:
+    """Discussion/comment information from OpenReview; text joined on first access."""
+    FIELDS = ('comment_id', 'forum_id', 'author', 'content', 'reply_to', 'timestamp')
+    __slots__ = ('comment_id', 'forum_id', 'author', 'reply_to', 'timestamp', '_content', '_text')
+
+    def __init__(self, comment_id: str, forum_id: str, author: str, content: Optional[str] = None,
+                 reply_to: Optional[str] = None, timestamp: Optional[str] = None,
+                 raw_content: Optional[Dict[str, Any]] = None):
+        self.comment_id = comment_id
+        self.forum_id = forum_id
+        self.author = author
+        self.reply_to = reply_to
+        self.timestamp = timestamp
+        self._content = raw_content
+        self._text = content
+
+    @property
+    def content(self) -> str:
+        if self._text is None:
+            self._text = _note_text(self._content)
+        return self._text
+
+    @property
+    def raw_content(self) -> Optional[Dict[str, Any]]:
+        return self._content
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, default=str)
+
+    def to_markdown(self) -> str:
+        reply = f" (reply to {self.reply_to})" if self.reply_to and self.reply_to != self.forum_id else ""
+        return f"#### {self.author}{reply}\n\n{self.content}\n"
+
+    def __eq__(self, other):
+        if not isinstance(other, DiscussionInfo):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"DiscussionInfo(comment_id={self.comment_id!r}, author={self.author!r})"
 
 
 @dataclass
-class DiscussionInfo:
-    """Discussion/comment information from OpenReview."""
-    comment_id: str
+class ForumInfo:
+    """Paper, reviews and discussions built from one snapshot of a forum."""
     forum_id: str
-    author: str
-    content: str
-    reply_to: Optional[str] = None
-    timestamp: Optional[str] = None
+    paper: Optional[PaperInfo] = None
+    reviews: List[ReviewInfo] = field(default_factory=list)
+    discussions: List[DiscussionInfo] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "forum_id": self.forum_id,
+            "paper": self.paper.to_dict() if self.paper else None,
+            "reviews": [r.to_dict() for r in self.reviews],
+            "discussions": [d.to_dict() for d in self.discussions],
+        }
+
+
+CACHE_FORMAT = 1
+DEFAULT_CACHE_TTL_HOURS = 24
+FULL_REFRESH_DAYS = 7  # re-download whole venues this often to pick up edits and decisions
+FORUM_CACHE_SIZE = 256  # forum snapshots kept in memory
+FORUM_CACHE_TTL = 600   # seconds before a forum snapshot is fetched again
+
+
+def default_cache_dir() -> Path:
+    if os.environ.get("OPENREVIEW_CACHE_DIR"):
+        return Path(os.environ["OPENREVIEW_CACHE_DIR"]).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "openreview"
+
+
+class VenueCache:
+    """
+    On-disk cache of venue submission lists.
+
+    One gzipped JSON file per venue holds compact rows of
+    [forum_id, title, authors, decision, cdate] plus the fetch times and the
+    newest cdate seen, which drives incremental refresh.
+    """
+
+    def __init__(self, root: Optional[Path] = None, ttl_hours: Optional[float] = None):
+        self.root = Path(root) if root else default_cache_dir()
+        if ttl_hours is None:
+            ttl_hours = float(os.environ.get("OPENREVIEW_CACHE_TTL_HOURS", DEFAULT_CACHE_TTL_HOURS))
+        self.ttl = ttl_hours * 3600
+        (self.root / "venues").mkdir(parents=True, exist_ok=True)
+
+    def path(self, venue: str) -> Path:
+        return self.root / "venues" / (re.sub(r"[^\w.-]+", "_", venue) + ".json.gz")
+
+    def load(self, venue: str) -> Optional[Dict[str, Any]]:
+        try:
+            with gzip.open(self.path(venue), "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("format") == CACHE_FORMAT else None
+
+    def save(self, venue: str, entry: Dict[str, Any]) -> None:
+        """Atomic replace so concurrent fetchers never read a torn file."""
+        path = self.path(venue)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as f:
+            json.dump({**entry, "format": CACHE_FORMAT, "venue": venue}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry.get("fetched", 0) < self.ttl
+
+
+class ForumCache:
+    """Thread-safe in-memory LRU of forum note snapshots, each valid for ttl seconds."""
+
+    def __init__(self, size: int = FORUM_CACHE_SIZE, ttl: float = FORUM_CACHE_TTL):
+        self.size = size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, List]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[List]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if time.time() - item[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def put(self, key, notes: List) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), notes)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+TITLE_STOPWORDS = frozenset({'a', 'an', 'the', 'of', 'for', 'and', 'or', 'in', 'on', 'to', 'with',
+                             'via', 'by', 'from', 'at', 'as', 'is', 'are'})
+CONFIDENT_MATCH = 0.9  # similarity at which title search stops looking further
+TITLE_MATCH_MIN = 0.8  # similarity at which a title is accepted without checking every word
+WORD_MATCH_MIN = 0.6   # trigram Dice for a misspelled or inflected word to count as present
+MAX_IN_FLIGHT = 4      # concurrent API requests per lookup
+HEDGE_DELAY = 2.0      # seconds before a slow API v2 lookup is backed up by API v1
+
+# LaTeX markup that only styles its argument: drop the command, keep the text
+_LATEX_STYLE_RE = re.compile(
+    r"\\(?:text(?:bf|it|sc|tt|rm|sf)?|math(?:bf|it|rm|cal|bb|frak|sf|tt)?|emph|bm|boldsymbol|"
+    r"operatorname|mbox|hbox|left|right|bf|it|rm|sc|tt|cal)\b")
+_LATEX_CMD_RE = re.compile(r"\\([a-zA-Z]+)")  # \alpha -> alpha
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase ASCII words of a title, without accents, punctuation or LaTeX markup."""
+    text = unicodedata.normalize("NFKD", title or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = _LATEX_CMD_RE.sub(r" \1 ", _LATEX_STYLE_RE.sub(" ", text))
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text.lower()).split())
+
+
+def title_tokens(normalized: str) -> List[str]:
+    return [t for t in normalized.split() if t not in TITLE_STOPWORDS]
+
+
+def _trigrams(text: str) -> set:
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def title_similarity(title1: str, title2: str) -> float:
+    """Mean of word Jaccard and character-trigram Dice over normalized titles."""
+    n1, n2 = normalize_title(title1), normalize_title(title2)
+    return _similarity(set(title_tokens(n1)), n1, set(title_tokens(n2)), n2)
+
+
+def _similarity(tokens1: set, norm1: str, tokens2: set, norm2: str) -> float:
+    if not tokens1 or not tokens2:
+        return 0.0
+    jaccard = len(tokens1 & tokens2) / len(tokens1 | tokens2)
+    g1, g2 = _trigrams(" ".join(sorted(tokens1))), _trigrams(" ".join(sorted(tokens2)))
+    dice = 2 * len(g1 & g2) / (len(g1) + len(g2))
+    return (jaccard + dice) / 2
+
+
+def titles_match(query: str, title: str) -> bool:
+    """
+    Whether title is the paper the query names.
+
+    Near-identical titles pass on similarity alone; otherwise every query word
+    must appear in title (up to a typo or plural), so titles that merely share
+    a prefix ("Benchmark Paper: Prose" vs "Benchmark Paper: Math") do not.
+    """
+    if title_similarity(query, title) >= TITLE_MATCH_MIN:
+        return True
+    words = set(title_tokens(normalize_title(query)))
+    found = [_trigrams(w) for w in title_tokens(normalize_title(title))]
+    if not words or not found:
+        return False
+    for word in words:
+        grams = _trigrams(word)
+        if not any(2 * len(grams & g) / (len(grams) + len(g)) >= WORD_MATCH_MIN for g in found):
+            return False
+    return True
+
+
+class TitleIndex:
+    """
+    Inverted index over paper titles for fuzzy top-k lookup.
+
+    Words map to the titles containing them; a character-trigram index over the
+    vocabulary maps misspelled or hyphenated query words to indexed ones.
+    Candidates are gathered rarest word first, weighted by IDF, and the best
+    few are re-ranked with title_similarity().
+    """
+
+    FUZZY_MIN = WORD_MATCH_MIN  # trigram Dice for a query word to stand in for a vocabulary word
+    RERANK = 5        # re-rank this many candidates per requested result
+
+    def __init__(self, titles: List[str]):
+        self.norm: List[str] = []
+        self.tokens: List[frozenset] = []
+        self.postings: Dict[str, List[int]] = {}
+        for doc, title in enumerate(titles):
+            norm = normalize_title(title)
+            tokens = frozenset(title_tokens(norm))
+            self.norm.append(norm)
+            self.tokens.append(tokens)
+            for token in tokens:
+                self.postings.setdefault(token, []).append(doc)
+
+        self.vocab_grams: Dict[str, List[str]] = {}
+        for token in self.postings:
+            for gram in _trigrams(token):
+                self.vocab_grams.setdefault(gram, []).append(token)
+
+    def __len__(self) -> int:
+        return len(self.norm)
+
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        """Vocabulary words standing for a query word, with match weights."""
+        if token in self.postings:
+            return [(token, 1.0)]
+        grams = _trigrams(token)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for word in self.vocab_grams.get(gram, ()):
+                shared[word] = shared.get(word, 0) + 1
+        matches = []
+        for word, n in shared.items():
+            dice = 2 * n / (len(grams) + len(word))  # a padded word has len(word) trigrams
+            if dice >= self.FUZZY_MIN:
+                matches.append((word, dice))
+        return heapq.nlargest(3, matches, key=lambda m: m[1])
+
+    def search(self, query: str, k: int = 10, min_score: float = 0.3) -> List[Tuple[float, int]]:
+        """
+        Top-k titles for a query.
+
+        Returns:
+            (similarity, position in the indexed title list) pairs, best first.
+            Titles containing the whole normalized query are always kept.
+        """
+        qnorm = normalize_title(query)
+        qtokens = set(title_tokens(qnorm))
+        if not qtokens or not self.norm:
+            return []
+
+        matched = [m for token in qtokens for m in self._expand(token)]
+        matched.sort(key=lambda m: len(self.postings[m[0]]))
+        common = max(50, len(self.norm) // 10)
+
+        scores: Dict[int, float] = {}
+        for word, weight in matched:
+            docs = self.postings[word]
+            idf = weight * math.log(1 + len(self.norm) / len(docs))
+            if len(docs) > common and scores:
+                # very common word: only re-weight titles already in play
+                for doc in docs:
+                    if doc in scores:
+                        scores[doc] += idf
+            else:
+                for doc in docs:
+                    scores[doc] = scores.get(doc, 0.0) + idf
+
+        ranked = []
+        for doc in heapq.nlargest(k * self.RERANK, scores, key=scores.get):
+            score = _similarity(qtokens, qnorm, self.tokens[doc], self.norm[doc])
+            if score >= min_score or qnorm in self.norm[doc]:
+                ranked.append((score, doc))
+        ranked.sort(reverse=True)
+        return ranked[:k]
 
 
 class OpenReviewFetcher:
@@ -122,13 +698,31 @@ class OpenReviewFetcher:
         "coling": "COLING",
     }
 
-    def __init__(self, username: Optional[str] = None, password: Optional[str] = None):
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True,
+        max_workers: int = MAX_IN_FLIGHT,
+        forum_cache_size: int = FORUM_CACHE_SIZE,
+        baseurl_v2: Optional[str] = None,
+        baseurl_v1: Optional[str] = None,
+        hedge_delay: float = HEDGE_DELAY
+    ):
         """
         Initialize the OpenReview fetcher.
 
         Args:
             username: OpenReview username (optional, for authenticated access)
             password: OpenReview password (optional)
+            cache_dir: Venue cache directory (default $OPENREVIEW_CACHE_DIR or ~/.cache/openreview)
+            use_cache: Set False to download venue submission lists on every search
+            max_workers: Maximum concurrent API requests per lookup
+            forum_cache_size: Forum snapshots memoised in memory (0 disables)
+            baseurl_v2: API v2 base URL (default $OPENREVIEW_API_BASEURL_V2 or api2.openreview.net)
+            baseurl_v1: API v1 base URL (default $OPENREVIEW_BASEURL or api.openreview.net)
+            hedge_delay: Seconds to wait on API v2 before also asking API v1
         """
         if not OPENREVIEW_AVAILABLE:
             raise ImportError(
@@ -136,19 +730,140 @@ class OpenReviewFetcher:
                 "Install it with: pip install openreview-py"
             )
 
-        # Initialize API v2 client (current)
-        self.client_v2 = openreview.api.OpenReviewClient(
-            baseurl='https://api2.openreview.net',
-            username=username,
-            password=password
-        )
+        # API clients are created on first use (login can be a network round-trip)
+        # and shared by all fetchers with the same credentials
+        self._username = username
+        self._password = password
+        self.baseurl_v2 = baseurl_v2 or API_V2_URL
+        self.baseurl_v1 = baseurl_v1 or API_V1_URL
+        self._client_v2 = None
+        self._client_v1 = None
+
+        self.cache = VenueCache(cache_dir) if use_cache else None
+        self._venues: Dict[str, Dict[str, Any]] = {}  # in-memory venue entries
+        self._indexes: Dict[str, Tuple[List[list], TitleIndex]] = {}
+        self.max_workers = max(1, max_workers)
+        self.forums = ForumCache(forum_cache_size)
+        self.hedge_delay = hedge_delay
+        self._inflight: Dict[Tuple, Future] = {}  # single-flight venue fetches / index builds
+        self._inflight_lock = threading.Lock()
+
+        self.stats = FetcherStats()
+        self.hooks: List[Callable[[Dict[str, Any]], None]] = []  # called with each timed event
+
+    @property
+    def client_v2(self):
+        """API v2 client (current)."""
+        if self._client_v2 is None:
+            self._client_v2 = _shared_client(2, self.baseurl_v2, self._username, self._password)
+        return self._client_v2
+
+    @client_v2.setter
+    def client_v2(self, client):
+        self._client_v2 = client
+
+    @property
+    def client_v1(self):
+        """API v1 client (legacy, for older conferences)."""
+        if self._client_v1 is None:
+            self._client_v1 = _shared_client(1, self.baseurl_v1, self._username, self._password)
+        return self._client_v1
+
+    @client_v1.setter
+    def client_v1(self, client):
+        self._client_v1 = client
+
+    @contextmanager
+    def _timed(self, kind: str, op: str, **fields):
+        """
+        Time the enclosed block and record it in self.stats.
 
-        # Initialize API v1 client (legacy, for older conferences)
-        self.client_v1 = openreview.Client(
-            baseurl='https://api.openreview.net',
-            username=username,
-            password=password
-        )
+        kind is "api" for a single OpenReview query (its HTTP requests are
+        counted) or "lookup" for a public method. The block may add fields
+        (e.g. notes=) to the yielded event; the finished event goes to the
+        log at DEBUG and to each of self.hooks.
+        """
+        event = dict(kind=kind, op=op, **fields)
+        outer = getattr(_CALL, 'requests', None)
+        if kind == "api":
+            _CALL.requests = 0
+        start = time.perf_counter()
+        try:
+            yield event
+        except Exception as e:
+            event["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            event["seconds"] = round(time.perf_counter() - start, 4)
+            if kind == "api":
+                event["requests"] = _CALL.requests
+                _CALL.requests = outer
+            self.stats.record_call(event)
+            self._emit(logging.DEBUG, event)
+
+    def _emit(self, level: int, event: Dict[str, Any], message: Optional[str] = None):
+        """Log an event (with its fields for JSON logs) and pass it to the hooks."""
+        if message is None:
+            extra = " ".join(f"{k}={v}" for k, v in event.items() if k not in ("kind", "op", "seconds"))
+            message = f"{event['kind']} {event['op']} {event.get('seconds', 0) * 1000:.1f}ms {extra}".rstrip()
+        logger.log(level, message, extra={"event": event})
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.warning("stats hook failed: %s", e)
+
+    def _first_accepted(self, tasks: List[Tuple[str, Callable[[], Any]]], accept: Callable[[Any], bool]):
+        """
+        Return the first result that accept() takes, trying tasks in list (priority) order.
+
+        The next task starts only when the running ones have failed or returned
+        nothing acceptable, or hedge_delay seconds pass without an answer, so
+        fast (e.g. cached) primary answers never cost a backup request. Once
+        several run, the first acceptable answer wins, ties going to priority.
+        Tasks run on daemon threads: abandoned requests never delay exit.
+        """
+        waiting = list(enumerate(tasks))
+        running: Dict[Future, int] = {}
+
+        def start():
+            i, (label, fn) = waiting.pop(0)
+            future: Future = Future()
+
+            def run():
+                try:
+                    future.set_result(fn())
+                except BaseException as e:
+                    future.set_exception(e)
+
+            threading.Thread(target=run, name=f"openreview {label}", daemon=True).start()
+            running[future] = i
+
+        start()
+        while running:
+            done, _ = wait(running, timeout=self.hedge_delay if waiting else None,
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                start()  # primary is slow: hedge with the next task
+                continue
+            for future in sorted(done, key=running.get):
+                i = running.pop(future)
+                label = tasks[i][0]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self._emit(logging.WARNING, {"kind": "failure", "op": label, "error": str(e)},
+                               f"{label} failed: {e}")
+                    continue
+                if accept(result):
+                    if i:
+                        self.stats.record_fallback(tasks[0][0])
+                        self._emit(logging.INFO, {"kind": "fallback", "op": tasks[0][0], "used": label},
+                                   f"{tasks[0][0]}: no result yet, using {label}")
+                    return result
+            if not running and waiting:
+                start()
+        return None
 
     def search_paper(
         self,
@@ -169,29 +884,28 @@ class OpenReviewFetcher:
         Returns:
             List of PaperInfo objects matching the search
         """
-        results = []
-
-        # Try API v2 first
-        try:
-            notes = self._search_v2(title, venue, year, limit)
-            for note in notes:
-                paper = self._parse_paper_v2(note)
-                if paper:
-                    results.append(paper)
-        except Exception as e:
-            print(f"API v2 search failed: {e}")
-
-        # If no results, try API v1
-        if not results:
-            try:
-                notes = self._search_v1(title, venue, year, limit)
-                for note in notes:
-                    paper = self._parse_paper_v1(note)
-                    if paper:
-                        results.append(paper)
-            except Exception as e:
-                print(f"API v1 search failed: {e}")
-
+        def search_v1():
+            notes = self._search_v1(title, venue, year, limit)
+            return [p for p in (self._parse_paper_v1(note) for note in notes) if p]
+
+        candidates: List[PaperInfo] = []
+
+        def confident(papers) -> bool:
+            candidates.extend(papers or [])
+            return any(title_similarity(title, p.title) >= CONFIDENT_MATCH for p in papers or [])
+
+        # API v2 first; API v1 if v2 fails, has no confident match or is slow (see
+        # _first_accepted). Candidates from every API that answered are ranked together.
+        with self._timed("lookup", "search_paper", venue=venue) as event:
+            self._first_accepted([
+                ("API v2 search", lambda: self._search_v2(title, venue, year, limit)),
+                ("API v1 search", search_v1),
+            ], accept=confident)
+            unique: Dict[str, PaperInfo] = {}
+            for paper in candidates:
+                unique.setdefault(paper.forum_id, paper)
+            results = sorted(unique.values(), key=lambda p: -title_similarity(title, p.title))[:limit]
+            event["results"] = len(results)
         return results
 
     def _search_v2(
@@ -200,10 +914,9 @@ class OpenReviewFetcher:
         venue: Optional[str],
         year: Optional[int],
         limit: int
-    ) -> List:
-        """Search using API v2."""
-        results = []
-        title_lower = title.lower()
+    ) -> List[PaperInfo]:
+        """Search using API v2: rank cached venue submission lists by title similarity."""
+        ranked = []
 
         # OpenReview API v2 requires at least one of: invitation, forum, etc.
         # We need to search by venue/year to get results
@@ -230,24 +943,165 @@ class OpenReviewFetcher:
                     f"ICML.cc/{y}/Conference",
                 ])
 
-        for v in venues_to_try:
-            try:
-                invitation = f"{v}/-/Submission"
-                # Get all notes and filter locally (API doesn't support partial title match)
-                notes = list(self.client_v2.get_all_notes(invitation=invitation))
-
-                # Filter by title locally
-                for note in notes:
-                    note_title = note.content.get('title', {}).get('value', '')
-                    if title_lower in note_title.lower():
-                        results.append(note)
-
-                if results:
-                    break  # Found results, stop searching
-            except Exception:
-                continue
+        # Fetch venues concurrently (bounded); earlier venues win ties
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(venues_to_try)))
+        futures = {executor.submit(self.venue_index, v): (order, v)
+                   for order, v in enumerate(venues_to_try)}
+        try:
+            for future in as_completed(futures):
+                order, v = futures[future]
+                try:
+                    # API doesn't support partial title match: search the venue's list locally
+                    rows, index = future.result()
+                except Exception:
+                    continue
+
+                for score, doc in index.search(title, k=limit):
+                    ranked.append((score, -order, v, rows[doc]))
+
+                if ranked and max(r[0] for r in ranked) >= CONFIDENT_MATCH:
+                    break  # Confident match, stop searching
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        ranked.sort(key=lambda r: r[:2], reverse=True)
+        return [self._paper_from_row(v, row) for _, _, v, row in ranked[:limit]]
+
+    def _single_flight(self, key: Tuple, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() once for concurrent callers with the same key: the first caller
+        does the work, the others wait for and share its result (or error).
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            self.stats.record_cache(key[0], True)  # answered without another request
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def venue_index(self, venue: str) -> Tuple[List[list], TitleIndex]:
+        """Submission rows of a venue and a TitleIndex over them, rebuilt when the rows change."""
+        return self._single_flight(("index", venue), lambda: self._venue_index(venue))
+
+    def _venue_index(self, venue: str) -> Tuple[List[list], TitleIndex]:
+        rows = self.venue_submissions(venue)
+        built = self._indexes.get(venue)
+        self.stats.record_cache("index", built is not None and built[0] is rows)
+        if built is None or built[0] is not rows:
+            built = (rows, TitleIndex([row[1] for row in rows]))
+            self._indexes[venue] = built
+        return built
+
+    def venue_submissions(self, venue: str, refresh: bool = False) -> List[list]:
+        """
+        Submission rows [forum_id, title, authors, decision, cdate] for a venue.
+
+        Served from the venue cache while fresh. A stale entry is refreshed with
+        only the submissions created since its newest one; the whole list is
+        re-downloaded every FULL_REFRESH_DAYS or when refresh=True. Concurrent
+        calls for the same venue share one download.
 
-        return results[:limit]
+        Args:
+            venue: Venue ID, e.g. "ICLR.cc/2024/Conference"
+            refresh: Ignore the cache and re-download the full list
+
+        Returns:
+            List of submission rows
+        """
+        return self._single_flight(("venue", venue, refresh),
+                                   lambda: self._venue_submissions(venue, refresh))
+
+    def _venue_submissions(self, venue: str, refresh: bool) -> List[list]:
+        entry = None
+        if self.cache:
+            entry = self._venues.get(venue) or self.cache.load(venue)
+        if entry and not refresh and self.cache.is_fresh(entry):
+            self.stats.record_cache("venue", True)
+            self._venues[venue] = entry
+            return entry["submissions"]
+        self.stats.record_cache("venue", False)
+
+        now = time.time()
+        incremental = bool(entry) and not refresh and \
+            now - entry.get("full_fetched", 0) < FULL_REFRESH_DAYS * 86400
+        kwargs = {"invitation": f"{venue}/-/Submission"}
+        if incremental:
+            kwargs["mintcdate"] = entry["max_cdate"] + 1
+
+        try:
+            with self._timed("api", "venue_submissions", venue=venue, incremental=incremental) as event:
+                notes = self.client_v2.get_all_notes(**kwargs)
+                event["notes"] = len(notes)
+        except Exception as e:
+            if entry:
+                self._emit(logging.WARNING, {"kind": "failure", "op": "venue_submissions",
+                                             "venue": venue, "error": str(e)},
+                           f"Venue refresh failed for {venue}, using cached list: {e}")
+                return entry["submissions"]
+            raise
+
+        rows = {row[0]: row for row in entry["submissions"]} if incremental else {}
+        for note in notes:
+            row = self._submission_row(note)
+            rows[row[0]] = row
+        submissions = list(rows.values())
+
+        if self.cache:
+            entry = {
+                "fetched": now,
+                "full_fetched": entry["full_fetched"] if incremental else now,
+                "max_cdate": max((row[4] for row in submissions), default=0),
+                "submissions": submissions,
+            }
+            self.cache.save(venue, entry)
+            self._venues[venue] = entry
+        return submissions
+
+    @staticmethod
+    def _submission_row(note) -> list:
+        """Compact cache row for an API v2 submission note."""
+        content = note.content or {}
+
+        def get_val(key):
+            val = content.get(key)
+            return val.get('value') if isinstance(val, dict) else val
+
+        decision = get_val('decision')
+        if not decision:
+            # v2 venues publish the outcome as e.g. "ICLR 2024 poster" in content.venue
+            venue = get_val('venue') or ''
+            decision = None if not venue or venue.startswith('Submitted to') else venue
+        return [note.forum, get_val('title') or '', get_val('authors') or [],
+                decision, getattr(note, 'cdate', None) or 0]
+
+    @staticmethod
+    def _paper_from_row(venue: str, row: list) -> PaperInfo:
+        """PaperInfo from a cache row (abstracts are not cached)."""
+        forum_id, title, authors, decision = row[:4]
+        return PaperInfo(
+            forum_id=forum_id,
+            title=title,
+            authors=authors,
+            abstract='',
+            venue=venue,
+            url=f"https://openreview.net/forum?id={forum_id}",
+            decision=decision
+        )
 
     def _search_v1(
         self,
@@ -257,10 +1111,13 @@ class OpenReviewFetcher:
         limit: int
     ) -> List:
         """Search using API v1 (legacy)."""
-        notes = list(openreview.tools.iterget_notes(
-            self.client_v1,
-            content={'title': title}
-        ))
+        import openreview
+        with self._timed("api", "search_v1") as event:
+            notes = list(openreview.tools.iterget_notes(
+                self.client_v1,
+                content={'title': title}
+            ))
+            event["notes"] = len(notes)
         return notes[:limit]
 
     def _parse_paper_v2(self, note) -> Optional[PaperInfo]:
@@ -301,6 +1158,67 @@ class OpenReviewFetcher:
         except Exception:
             return None
 
+    def _forum_notes(self, forum_id: str, api: int = 2) -> List:
+        """All notes of a forum from one API version, fetched once and memoised."""
+        key = (api, forum_id)
+        notes = self.forums.get(key)
+        self.stats.record_cache("forum", notes is not None)
+        if notes is None:
+            with self._timed("api", f"forum_notes_v{api}", forum=forum_id) as event:
+                if api == 2:
+                    notes = list(self.client_v2.get_all_notes(forum=forum_id))
+                else:
+                    import openreview
+                    notes = list(openreview.tools.iterget_notes(self.client_v1, forum=forum_id))
+                event["notes"] = len(notes)
+            self.forums.put(key, notes)
+        return notes
+
+    def get_forum(self, forum_id: str, include_meta_review: bool = True) -> ForumInfo:
+        """
+        Get paper metadata, reviews and discussions for a forum in one fetch.
+
+        All three are built from the same memoised snapshot of the forum's notes,
+        so later get_reviews / get_discussions / validation calls for the same
+        forum cost no extra requests.
+
+        Args:
+            forum_id: The OpenReview forum ID of the paper
+            include_meta_review: Whether to include meta-reviews/AC decisions
+
+        Returns:
+            ForumInfo (paper is None if the forum was not found)
+        """
+        with self._timed("lookup", "get_forum", forum=forum_id) as event:
+            forum = self._first_accepted([
+                ("API v2 forum fetch", lambda: self.fetch_forum(forum_id, 2, include_meta_review)),
+                ("API v1 forum fetch", lambda: self.fetch_forum(forum_id, 1, include_meta_review)),
+            ], accept=lambda f: bool(f.paper or f.reviews))
+            event["found"] = forum is not None
+        return forum or ForumInfo(forum_id)
+
+    def fetch_forum(self, forum_id: str, api: int = 2, include_meta_review: bool = True) -> ForumInfo:
+        """
+        Build a ForumInfo from one API version's snapshot of a forum.
+
+        Unlike get_forum(), errors propagate and the other API version is not
+        tried, which suits bulk jobs that know their venue's API version.
+        """
+        notes = self._forum_notes(forum_id, api)
+        root = next((n for n in notes if n.id == forum_id), None)
+        if api == 2:
+            paper = self._parse_paper_v2(root) if root else None
+            review_notes = self._review_notes(notes, include_meta_review)
+            parse_review = self._parse_review_v2
+        else:
+            paper = self._parse_paper_v1(root) if root else None
+            review_notes = self._review_notes_v1(notes, include_meta_review)
+            parse_review = self._parse_review_v1
+        if paper and not paper.decision:
+            paper.decision = self._decision(notes)
+        reviews = [r for r in (parse_review(n) for n in review_notes) if r]
+        return ForumInfo(forum_id, paper, reviews, self._parse_discussions(notes))
+
     def get_reviews(
         self,
         forum_id: str,
@@ -316,36 +1234,30 @@ class OpenReviewFetcher:
         Returns:
             List of ReviewInfo objects
         """
-        reviews = []
-
-        # Try API v2 first
-        try:
-            review_notes = self._get_reviews_v2(forum_id, include_meta_review)
-            for note in review_notes:
-                review = self._parse_review_v2(note)
-                if review:
-                    reviews.append(review)
-        except Exception as e:
-            print(f"API v2 review fetch failed: {e}")
-
-        # If no results, try API v1
-        if not reviews:
-            try:
-                review_notes = self._get_reviews_v1(forum_id, include_meta_review)
-                for note in review_notes:
-                    review = self._parse_review_v1(note)
-                    if review:
-                        reviews.append(review)
-            except Exception as e:
-                print(f"API v1 review fetch failed: {e}")
-
-        return reviews
+        def reviews_v2():
+            notes = self._get_reviews_v2(forum_id, include_meta_review)
+            return [r for r in (self._parse_review_v2(note) for note in notes) if r]
+
+        def reviews_v1():
+            notes = self._get_reviews_v1(forum_id, include_meta_review)
+            return [r for r in (self._parse_review_v1(note) for note in notes) if r]
+
+        # API v2 first; API v1 if v2 fails, finds nothing or is slow (see _first_accepted)
+        with self._timed("lookup", "get_reviews", forum=forum_id) as event:
+            reviews = self._first_accepted([
+                ("API v2 review fetch", reviews_v2),
+                ("API v1 review fetch", reviews_v1),
+            ], accept=bool)
+            event["reviews"] = len(reviews or [])
+        return reviews or []
 
     def _get_reviews_v2(self, forum_id: str, include_meta_review: bool) -> List:
         """Get reviews using API v2."""
-        # Get all notes in the forum
-        notes = list(self.client_v2.get_all_notes(forum=forum_id))
+        return self._review_notes(self._forum_notes(forum_id, 2), include_meta_review)
 
+    @staticmethod
+    def _review_notes(notes: List, include_meta_review: bool) -> List:
+        """Review notes of an API v2 forum snapshot."""
         # Filter for reviews - API v2 uses 'invitations' (plural)
         review_notes = []
         for note in notes:
@@ -364,11 +1276,11 @@ class OpenReviewFetcher:
 
     def _get_reviews_v1(self, forum_id: str, include_meta_review: bool) -> List:
         """Get reviews using API v1."""
-        notes = list(openreview.tools.iterget_notes(
-            self.client_v1,
-            forum=forum_id
-        ))
+        return self._review_notes_v1(self._forum_notes(forum_id, 1), include_meta_review)
 
+    @staticmethod
+    def _review_notes_v1(notes: List, include_meta_review: bool) -> List:
+        """Review notes of an API v1 forum snapshot."""
         review_notes = []
         for note in notes:
             if note.invitation:
@@ -396,32 +1308,7 @@ class OpenReviewFetcher:
                 else:
                     reviewer = sig.split('/')[-1]
 
-            # Helper to get value from content
-            def get_val(key):
-                if key in content:
-                    val = content[key]
-                    if isinstance(val, dict):
-                        return val.get('value', '')
-                    return val
-                return None
-
-            return ReviewInfo(
-                review_id=note.id,
-                forum_id=note.forum,
-                reviewer=reviewer,
-                rating=get_val('rating') or get_val('recommendation'),
-                confidence=get_val('confidence'),
-                summary=get_val('summary') or get_val('summary_of_the_paper'),
-                strengths=get_val('strengths') or get_val('strengths_and_contributions'),
-                weaknesses=get_val('weaknesses') or get_val('weaknesses_and_limitations'),
-                questions=get_val('questions') or get_val('questions_for_authors'),
-                limitations=get_val('limitations'),
-                soundness=get_val('soundness'),
-                presentation=get_val('presentation'),
-                contribution=get_val('contribution'),
-                recommendation=get_val('recommendation') or get_val('decision'),
-                raw_content=dict(content) if content else None
-            )
+            return ReviewInfo(note.id, note.forum, reviewer, raw_content=content, api=2)
         except Exception:
             return None
 
@@ -440,23 +1327,7 @@ class OpenReviewFetcher:
                 else:
                     reviewer = sig.split('/')[-1]
 
-            return ReviewInfo(
-                review_id=note.id,
-                forum_id=note.forum,
-                reviewer=reviewer,
-                rating=content.get('rating') or content.get('recommendation'),
-                confidence=content.get('confidence'),
-                summary=content.get('review') or content.get('summary'),
-                strengths=content.get('strengths'),
-                weaknesses=content.get('weaknesses'),
-                questions=content.get('questions'),
-                limitations=content.get('limitations'),
-                soundness=content.get('soundness'),
-                presentation=content.get('presentation'),
-                contribution=content.get('contribution'),
-                recommendation=content.get('recommendation') or content.get('decision'),
-                raw_content=content
-            )
+            return ReviewInfo(note.id, note.forum, reviewer, raw_content=content, api=1)
         except Exception:
             return None
 
@@ -470,29 +1341,48 @@ class OpenReviewFetcher:
         Returns:
             List of DiscussionInfo objects
         """
-        discussions = []
-
         try:
-            notes = list(self.client_v2.get_all_notes(forum=forum_id))
-
-            for note in notes:
-                if note.invitation:
-                    inv_lower = note.invitation.lower()
-                    # Filter for comments/discussions (not reviews)
-                    if 'comment' in inv_lower or 'discussion' in inv_lower or 'rebuttal' in inv_lower:
-                        discussions.append(DiscussionInfo(
-                            comment_id=note.id,
-                            forum_id=note.forum,
-                            author=note.signatures[0].split('/')[-1] if note.signatures else "Unknown",
-                            content=str(note.content),
-                            reply_to=note.replyto if hasattr(note, 'replyto') else None,
-                            timestamp=str(note.cdate) if hasattr(note, 'cdate') else None
-                        ))
+            return self._parse_discussions(self._forum_notes(forum_id, 2))
         except Exception as e:
-            print(f"Discussion fetch failed: {e}")
-
+            self._emit(logging.WARNING, {"kind": "failure", "op": "get_discussions",
+                                         "forum": forum_id, "error": str(e)},
+                       f"Discussion fetch failed: {e}")
+            return []
+
+    @staticmethod
+    def _invitations(note) -> List[str]:
+        """Invitation IDs of a note: API v2 'invitations' or API v1 'invitation'."""
+        invitations = getattr(note, 'invitations', None) or []
+        invitation = getattr(note, 'invitation', None)
+        return list(invitations) + ([invitation] if invitation else [])
+
+    def _parse_discussions(self, notes: List) -> List[DiscussionInfo]:
+        """Comment / rebuttal notes of a forum snapshot (either API version)."""
+        discussions = []
+        for note in notes:
+            inv_lower = " ".join(self._invitations(note)).lower()
+            # Filter for comments/discussions (not reviews)
+            if 'comment' in inv_lower or 'discussion' in inv_lower or 'rebuttal' in inv_lower:
+                discussions.append(DiscussionInfo(
+                    comment_id=note.id,
+                    forum_id=note.forum,
+                    author=note.signatures[0].split('/')[-1] if note.signatures else "Unknown",
+                    reply_to=getattr(note, 'replyto', None),
+                    timestamp=str(note.cdate) if getattr(note, 'cdate', None) else None,
+                    raw_content=note.content
+                ))
         return discussions
 
+    def _decision(self, notes: List) -> Optional[str]:
+        """Decision text from a forum's decision note, if it has one."""
+        for note in notes:
+            if any(inv.lower().endswith('decision') for inv in self._invitations(note)):
+                val = (note.content or {}).get('decision')
+                val = val.get('value') if isinstance(val, dict) else val
+                if val:
+                    return val
+        return None
+
     def get_reviews_by_title(
         self,
         title: str,
@@ -514,6 +1404,18 @@ class OpenReviewFetcher:
         Returns:
             Dictionary containing paper info and reviews
         """
+        with self._timed("lookup", "get_reviews_by_title", venue=venue) as event:
+            result = self._reviews_by_title(title, venue, year, verify)
+            event["success"] = result["success"]
+        return result
+
+    def _reviews_by_title(
+        self,
+        title: str,
+        venue: Optional[str],
+        year: Optional[int],
+        verify: bool
+    ) -> Dict[str, Any]:
         # Search for the paper
         papers = self.search_paper(title, venue, year, limit=5)
 
@@ -548,7 +1450,7 @@ class OpenReviewFetcher:
                 "reviews": []
             }
 
-        if verify and best_score < 0.5:
+        if verify and not titles_match(title, best_match.title):
             return {
                 "success": False,
                 "error": f"No paper found with sufficiently similar title. Best match: '{best_match.title}' (similarity: {best_score:.2f})",
@@ -556,36 +1458,23 @@ class OpenReviewFetcher:
                 "reviews": []
             }
 
-        # Get reviews
-        reviews = self.get_reviews(best_match.forum_id)
+        # Get reviews and discussions from one forum fetch
+        forum = self.get_forum(best_match.forum_id)
+        if forum.paper:
+            best_match.abstract = best_match.abstract or forum.paper.abstract
+            best_match.decision = best_match.decision or forum.paper.decision
 
         return {
             "success": True,
             "paper": best_match.to_dict(),
-            "reviews": [r.to_dict() for r in reviews],
-            "discussions": [],  # Can be fetched separately if needed
+            "reviews": [r.to_dict() for r in forum.reviews],
+            "discussions": [d.to_dict() for d in forum.discussions],
             "url": best_match.url
         }
 
     def _title_similarity(self, title1: str, title2: str) -> float:
-        """Calculate simple title similarity score."""
-        # Normalize titles
-        t1 = set(title1.lower().split())
-        t2 = set(title2.lower().split())
-
-        # Remove common words
-        stopwords = {'a', 'an', 'the', 'of', 'for', 'and', 'or', 'in', 'on', 'to', 'with'}
-        t1 = t1 - stopwords
-        t2 = t2 - stopwords
-
-        if not t1 or not t2:
-            return 0.0
-
-        # Jaccard similarity
-        intersection = len(t1 & t2)
-        union = len(t1 | t2)
-
-        return intersection / union if union > 0 else 0.0
+        """Calculate title similarity score (see title_similarity())."""
+        return title_similarity(title1, title2)
 
     def validate_paper_review_match(
         self,
@@ -607,8 +1496,8 @@ class OpenReviewFetcher:
             Validation result with match scores
         """
         try:
-            # Get paper info from forum
-            notes = list(self.client_v2.get_all_notes(forum=forum_id, limit=1))
+            # Get paper info from the (memoised) forum snapshot
+            notes = [n for n in self._forum_notes(forum_id, 2) if n.id == forum_id]
 
             if not notes:
                 return {
@@ -640,7 +1529,7 @@ class OpenReviewFetcher:
                 author_score = 0.0
 
             # Combined validation
-            is_valid = title_score >= 0.5 or author_score >= 0.3
+            is_valid = titles_match(paper_title, paper.title) or author_score >= 0.3
 
             return {
                 "valid": is_valid,
@@ -660,6 +1549,26 @@ class OpenReviewFetcher:
             }
 
 
+def _review_markdown(review: Dict[str, Any], index: int = 1) -> List[str]:
+    """Markdown lines for one review dict."""
+    md = [f"#### {review.get('reviewer') or f'Reviewer {index}'}"]
+
+    for key, label in (('rating', 'Rating'), ('confidence', 'Confidence'), ('soundness', 'Soundness'),
+                       ('presentation', 'Presentation'), ('contribution', 'Contribution')):
+        if review.get(key):
+            md.append(f"**{label}**: {review[key]}")
+
+    md.append("")
+
+    for key, label in (('summary', 'Summary'), ('strengths', 'Strengths'), ('weaknesses', 'Weaknesses'),
+                       ('questions', 'Questions'), ('limitations', 'Limitations')):
+        if review.get(key):
+            md.append(f"**{label}**:\n{review[key]}\n")
+
+    md.append("---\n")
+    return md
+
+
 def format_reviews_markdown(result: Dict[str, Any]) -> str:
     """
     Format review results as markdown for display.
@@ -689,33 +1598,7 @@ def format_reviews_markdown(result: Dict[str, Any]) -> str:
     md.append(f"### Reviews ({len(reviews)} total)\n")
 
     for i, review in enumerate(reviews, 1):
-        md.append(f"#### {review.get('reviewer', f'Reviewer {i}')}")
-
-        if review.get('rating'):
-            md.append(f"**Rating**: {review['rating']}")
-        if review.get('confidence'):
-            md.append(f"**Confidence**: {review['confidence']}")
-        if review.get('soundness'):
-            md.append(f"**Soundness**: {review['soundness']}")
-        if review.get('presentation'):
-            md.append(f"**Presentation**: {review['presentation']}")
-        if review.get('contribution'):
-            md.append(f"**Contribution**: {review['contribution']}")
-
-        md.append("")
-
-        if review.get('summary'):
-            md.append(f"**Summary**:\n{review['summary']}\n")
-        if review.get('strengths'):
-            md.append(f"**Strengths**:\n{review['strengths']}\n")
-        if review.get('weaknesses'):
-            md.append(f"**Weaknesses**:\n{review['weaknesses']}\n")
-        if review.get('questions'):
-            md.append(f"**Questions**:\n{review['questions']}\n")
-        if review.get('limitations'):
-            md.append(f"**Limitations**:\n{review['limitations']}\n")
-
-        md.append("---\n")
+        md.extend(_review_markdown(review, i))
 
     return "\n".join(md)
 
@@ -754,25 +1637,34 @@ def extract_forum_id(url_or_id: str) -> Optional[str]:
 
 # CLI interface for testing
 if __name__ == "__main__":
+    import argparse
     import sys
 
-    if len(sys.argv) < 2:
-        print("Usage: python openreview_api.py <paper_title> [venue] [year]")
-        print("Example: python openreview_api.py 'Attention Is All You Need' NeurIPS.cc 2017")
-        sys.exit(1)
-
-    title = sys.argv[1]
-    venue = sys.argv[2] if len(sys.argv) > 2 else None
-    year = int(sys.argv[3]) if len(sys.argv) > 3 else None
-
-    print(f"Searching for: {title}")
-    if venue:
-        print(f"Venue filter: {venue}")
-    if year:
-        print(f"Year filter: {year}")
+    parser = argparse.ArgumentParser(
+        description="Search OpenReview by paper title and print its reviews",
+        epilog="Example: python openreview_api.py 'Attention Is All You Need' NeurIPS.cc 2017")
+    parser.add_argument("title", help="Paper title")
+    parser.add_argument("venue", nargs="?", help="Venue filter, e.g. ICLR.cc/2024/Conference")
+    parser.add_argument("year", nargs="?", type=int, help="Year filter")
+    parser.add_argument("--verbose", "-v", action="count", default=0,
+                        help="Log fallbacks (-v) and every API call with its latency (-vv) to stderr")
+    parser.add_argument("--log-json", action="store_true", help="Log events as JSON lines")
+    parser.add_argument("--stats", action="store_true", help="Print fetcher statistics to stderr")
+    args = parser.parse_args()
+
+    if args.verbose or args.log_json:
+        configure_logging("DEBUG" if args.verbose > 1 else "INFO", json_format=args.log_json)
+
+    print(f"Searching for: {args.title}")
+    if args.venue:
+        print(f"Venue filter: {args.venue}")
+    if args.year:
+        print(f"Year filter: {args.year}")
 
     fetcher = OpenReviewFetcher()
-    result = fetcher.get_reviews_by_title(title, venue, year)
+    result = fetcher.get_reviews_by_title(args.title, args.venue, args.year)
 
     print("\n" + "="*60 + "\n")
     print(format_reviews_markdown(result))
+    if args.stats:
+        print(fetcher.stats.summary(), file=sys.stderr)
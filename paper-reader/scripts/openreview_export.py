@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Bulk export of OpenReview reviews and discussions.
+
+Fetches whole venues (or a list of forum IDs) concurrently and streams the
+parsed reviews and discussions to JSONL or Parquet part files, so memory stays
+flat no matter how many forums are exported. A checkpoint file records the
+finished parts; re-running the same command resumes where it stopped.
+
+Usage:
+    python openreview_export.py --venue ICLR.cc/2024/Conference -o exports/iclr2024
+    python openreview_export.py --forums ids.txt -o exports/mine --format parquet
+    python openreview_export.py LzPWWPAdY4 JePfAI8fah -o exports/two
+
+    from scripts.openreview_export import export_forums
+    export_forums(OpenReviewFetcher(), forum_ids, "exports/iclr2024", jobs=8)
+
+Output directory:
+    reviews-00000.jsonl        one review per line (raw content omitted)
+    discussions-00000.jsonl    one comment / rebuttal per line
+    checkpoint.json            finished parts and forum IDs, failed forum IDs
+
+Parquet output (--format parquet) needs: pip install pyarrow
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import List, Dict, Any, Iterable
+
+try:
+    from .openreview_api import OpenReviewFetcher, ForumInfo, ReviewInfo, DiscussionInfo
+except ImportError:
+    from openreview_api import OpenReviewFetcher, ForumInfo, ReviewInfo, DiscussionInfo
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+CHECKPOINT = "checkpoint.json"
+PART_SIZE = 500       # forums per part file (and per checkpoint)
+ROW_GROUP = 2000      # rows buffered per Parquet row group
+DEFAULT_JOBS = 8
+
+REVIEW_COLUMNS = ["venue"] + list(ReviewInfo.FIELDS)
+DISCUSSION_COLUMNS = ["venue"] + list(DiscussionInfo.FIELDS)
+
+
+def review_rows(forum: ForumInfo) -> List[Dict[str, Any]]:
+    venue = forum.paper.venue if forum.paper else None
+    return [dict({c: getattr(r, c) for c in REVIEW_COLUMNS[1:]}, venue=venue)
+            for r in forum.reviews]
+
+
+def discussion_rows(forum: ForumInfo) -> List[Dict[str, Any]]:
+    venue = forum.paper.venue if forum.paper else None
+    return [dict({c: getattr(d, c) for c in DISCUSSION_COLUMNS[1:]}, venue=venue)
+            for d in forum.discussions]
+
+
+class PartWriter:
+    """Writes rows to {name}-{part:05d}.jsonl / .parquet, one file per part."""
+
+    def __init__(self, out_dir: Path, name: str, columns: List[str], fmt: str):
+        self.out_dir = out_dir
+        self.name = name
+        self.columns = columns
+        self.fmt = fmt
+        self.rows = 0
+        self._file = None
+        self._writer = None
+        self._buffer: List[Dict[str, Any]] = []
+
+    def path(self, part: int) -> Path:
+        return self.out_dir / f"{self.name}-{part:05d}.{self.fmt}"
+
+    def open(self, part: int) -> None:
+        path = self.path(part)
+        if self.fmt == "jsonl":
+            self._file = open(path, "w", encoding="utf-8")
+        else:
+            schema = pa.schema([(c, pa.string()) for c in self.columns])
+            self._writer = pq.ParquetWriter(str(path), schema)
+
+    def write(self, rows: Iterable[Dict[str, Any]]) -> None:
+        for row in rows:
+            self.rows += 1
+            if self.fmt == "jsonl":
+                self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+            else:
+                # Scores are strings in some venues and numbers in others: store as text
+                self._buffer.append({c: None if row.get(c) is None else str(row[c])
+                                     for c in self.columns})
+                if len(self._buffer) >= ROW_GROUP:
+                    self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._writer.write_table(pa.Table.from_pylist(self._buffer, schema=self._writer.schema))
+            self._buffer = []
+
+    def close(self) -> None:
+        if self._file:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+        if self._writer:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+
+
+def _load_checkpoint(out_dir: Path) -> Dict[str, Any]:
+    try:
+        return json.loads((out_dir / CHECKPOINT).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"parts": [], "done": [], "failed": {}}
+
+
+def _save_checkpoint(out_dir: Path, checkpoint: Dict[str, Any]) -> None:
+    """Atomic replace: a crash leaves the previous checkpoint intact."""
+    fd, tmp = tempfile.mkstemp(dir=out_dir, prefix=CHECKPOINT, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp, out_dir / CHECKPOINT)
+
+
+def export_forums(
+    fetcher: OpenReviewFetcher,
+    forum_ids: List[str],
+    out_dir: str,
+    fmt: str = "jsonl",
+    jobs: int = DEFAULT_JOBS,
+    api: int = 2,
+    include_discussions: bool = True,
+    part_size: int = PART_SIZE,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Export reviews (and discussions) of many forums, resuming from a checkpoint.
+
+    Forums are fetched with up to `jobs` requests in flight. Every `part_size`
+    finished forums the current part files are closed and the checkpoint is
+    updated; part files not in the checkpoint (from an interrupted run) are
+    deleted and their forums fetched again, so output never holds duplicates.
+
+    Args:
+        fetcher: OpenReviewFetcher to fetch with
+        forum_ids: Forum IDs to export (duplicates are ignored)
+        out_dir: Output directory (created if missing)
+        fmt: "jsonl" or "parquet"
+        jobs: Concurrent forum fetches
+        api: OpenReview API version of the forums (2, or 1 for older venues)
+        include_discussions: Also export comments / rebuttals
+        part_size: Forums per part file and checkpoint
+        verbose: Print progress
+
+    Returns:
+        Summary dict: forums, exported, skipped, failed, reviews, discussions, seconds
+    """
+    if fmt not in ("jsonl", "parquet"):
+        raise ValueError(f"unknown format: {fmt}")
+    if fmt == "parquet" and not PYARROW_AVAILABLE:
+        raise ImportError("Parquet export needs pyarrow. Install it with: pip install pyarrow")
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    checkpoint = _load_checkpoint(out)
+    kept = set(checkpoint["parts"])
+    for path in list(out.glob("reviews-*.*")) + list(out.glob("discussions-*.*")):
+        if path.name not in kept:
+            path.unlink()  # left over from an interrupted run, not checkpointed
+
+    forum_ids = list(dict.fromkeys(forum_ids))  # duplicates are exported (and counted) once
+    done = set(checkpoint["done"])
+    todo = [f for f in forum_ids if f not in done]
+    skipped = len(forum_ids) - len(todo)  # found in the checkpoint
+    writers = [PartWriter(out, "reviews", REVIEW_COLUMNS, fmt)]
+    if include_discussions:
+        writers.append(PartWriter(out, "discussions", DISCUSSION_COLUMNS, fmt))
+    part = 1 + max((int(name.rsplit("-", 1)[1].split(".")[0]) for name in checkpoint["parts"]),
+                   default=-1)
+
+    start = time.time()
+    part_forums: List[str] = []
+    failed: Dict[str, str] = {}
+    exported = 0
+
+    def finish_part():
+        nonlocal part, part_forums
+        for w in writers:
+            w.close()
+        if part_forums:
+            checkpoint["parts"].extend(w.path(part).name for w in writers)
+            checkpoint["done"].extend(part_forums)
+            done.update(part_forums)
+        else:
+            for w in writers:
+                w.path(part).unlink(missing_ok=True)
+        checkpoint["failed"] = {k: v for k, v in {**checkpoint["failed"], **failed}.items()
+                                if k not in done}
+        _save_checkpoint(out, checkpoint)
+        part += 1
+        part_forums = []
+
+    executor = ThreadPoolExecutor(max_workers=max(1, jobs))
+    pending = {}
+    queue = iter(todo)
+    try:
+        for w in writers:
+            w.open(part)
+        while True:
+            # Keep a bounded window of requests in flight
+            while len(pending) < 2 * max(1, jobs):
+                forum_id = next(queue, None)
+                if forum_id is None:
+                    break
+                pending[executor.submit(fetcher.fetch_forum, forum_id, api)] = forum_id
+            if not pending:
+                break
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                forum_id = pending.pop(future)
+                try:
+                    forum = future.result()
+                except Exception as e:
+                    failed[forum_id] = f"{type(e).__name__}: {e}"
+                    continue
+                writers[0].write(review_rows(forum))
+                if include_discussions:
+                    writers[1].write(discussion_rows(forum))
+                part_forums.append(forum_id)
+                exported += 1
+
+            if len(part_forums) >= part_size:
+                finish_part()
+                for w in writers:
+                    w.open(part)
+                if verbose:
+                    print(f"  {exported}/{len(todo)} forums, {writers[0].rows} reviews "
+                          f"({time.time() - start:.0f}s)")
+        finish_part()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+        for w in writers:
+            w.close()  # an unfinished part stays out of the checkpoint and is redone
+
+    return {
+        "forums": len(forum_ids),
+        "exported": exported,
+        "skipped": skipped,
+        "failed": len(checkpoint["failed"]),
+        "reviews": writers[0].rows,
+        "discussions": writers[1].rows if include_discussions else 0,
+        "seconds": round(time.time() - start, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk export of OpenReview reviews and discussions")
+    parser.add_argument("forum_ids", nargs="*", help="Forum IDs or OpenReview URLs")
+    parser.add_argument("--venue", action="append", default=[],
+                        help="Export every submission of a venue, e.g. ICLR.cc/2024/Conference (repeatable)")
+    parser.add_argument("--forums", help="File with one forum ID or URL per line")
+    parser.add_argument("--output", "-o", required=True, help="Output directory")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help="Concurrent forum fetches")
+    parser.add_argument("--api", type=int, choices=[1, 2], default=2,
+                        help="OpenReview API version of the forums (1 for pre-2023 venues)")
+    parser.add_argument("--no-discussions", action="store_true", help="Export reviews only")
+    parser.add_argument("--part-size", type=int, default=PART_SIZE, help="Forums per part / checkpoint")
+    parser.add_argument("--verbose", "-v", action="count", default=0,
+                        help="Log failures (-v) and every API call with its latency (-vv) to stderr")
+    parser.add_argument("--log-json", action="store_true", help="Log events as JSON lines")
+    parser.add_argument("--stats", action="store_true", help="Print fetcher statistics to stderr at the end")
+    args = parser.parse_args()
+
+    try:
+        from .openreview_api import extract_forum_id, configure_logging
+    except ImportError:
+        from openreview_api import extract_forum_id, configure_logging
+
+    if args.verbose or args.log_json:
+        configure_logging("DEBUG" if args.verbose > 1 else "INFO", json_format=args.log_json)
+
+    ids = list(args.forum_ids)
+    if args.forums:
+        ids += [line.strip() for line in Path(args.forums).read_text().splitlines() if line.strip()]
+    ids = [i for i in (extract_forum_id(x) for x in ids) if i]
+
+    fetcher = OpenReviewFetcher(max_workers=args.jobs)
+    for venue in args.venue:
+        rows = fetcher.venue_submissions(venue)
+        print(f"{venue}: {len(rows)} submissions")
+        ids += [row[0] for row in rows]
+
+    if not ids:
+        print("ERROR: no forum IDs (give IDs, --forums or --venue)", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        summary = export_forums(fetcher, ids, args.output, fmt=args.format, jobs=args.jobs,
+                                api=args.api, include_discussions=not args.no_discussions,
+                                part_size=args.part_size)
+    except ImportError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(2)
+    except KeyboardInterrupt:
+        print("\nInterrupted: re-run the same command to resume", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        if args.stats:
+            print(fetcher.stats.summary(), file=sys.stderr)
+
+    print(f"OK: {summary['exported']} forums exported ({summary['skipped']} already done), "
+          f"{summary['reviews']} reviews, {summary['discussions']} discussions "
+          f"in {summary['seconds']}s → {args.output}")
+    if summary["failed"]:
+        print(f"WARN: {summary['failed']} forums failed (see {CHECKPOINT}); re-run to retry",
+              file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OpenReview API, for offline tests and benchmarks.
+
+Serves GET /v2/notes and /v1/notes in the shapes openreview-py expects
+({"notes": [...], "count": N}, sorted by id, paged with limit/after/offset)
+from a note corpus, with optional latency and error injection.
+
+Usage:
+    # Replay recorded fixtures
+    python openreview_stub.py --fixtures fixtures/ --latency 0.1 --error-rate 0.02
+
+    # Record: proxy to api2/api.openreview.net and save every note served
+    python openreview_stub.py --fixtures fixtures/ --record
+
+    # Synthetic corpus (no recording needed)
+    python openreview_stub.py --synthetic 2000 --venue ICLR.cc/2024/Conference
+
+Then point the fetcher at it:
+    export OPENREVIEW_API_BASEURL_V2=http://127.0.0.1:47400/v2
+    export OPENREVIEW_BASEURL=http://127.0.0.1:47400/v1
+
+Fixtures directory: v2.jsonl and v1.jsonl, one note JSON per line.
+"""
+
+import argparse
+import bisect
+import json
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 47400
+UPSTREAM = {"v2": "https://api2.openreview.net", "v1": "https://api.openreview.net"}
+DEFAULT_LIMIT = 1000
+
+
+class NoteStore:
+    """Notes of one API version, indexed by id, forum and invitation."""
+
+    def __init__(self, api: str):
+        self.api = api
+        self.notes: Dict[str, Dict[str, Any]] = {}
+        self.by_forum: Dict[str, List[str]] = {}
+        self.by_invitation: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.notes)
+
+    def add(self, note: Dict[str, Any]) -> bool:
+        """Add a note; False if its id was already stored."""
+        with self._lock:
+            if note["id"] in self.notes:
+                return False
+            self.notes[note["id"]] = note
+            for index, keys in ((self.by_forum, [note.get("forum")]),
+                                (self.by_invitation, self._invitations(note))):
+                for key in keys:
+                    if key:
+                        bisect.insort(index.setdefault(key, []), note["id"])
+            return True
+
+    def _invitations(self, note: Dict[str, Any]) -> List[str]:
+        return list(note.get("invitations") or []) + ([note["invitation"]] if note.get("invitation") else [])
+
+    def query(self, params: Dict[str, str]) -> Tuple[List[Dict[str, Any]], int]:
+        """Notes matching the /notes query parameters the fetcher uses, and the total count."""
+        if params.get("id"):
+            ids = [params["id"]] if params["id"] in self.notes else []
+        elif params.get("forum"):
+            ids = self.by_forum.get(params["forum"], [])
+        elif params.get("invitation"):
+            ids = self.by_invitation.get(params["invitation"], [])
+        else:
+            ids = sorted(self.notes)
+
+        notes = [self.notes[i] for i in ids]
+        if params.get("mintcdate"):
+            mintcdate = int(params["mintcdate"])
+            notes = [n for n in notes if (n.get("tcdate") or n.get("cdate") or 0) >= mintcdate]
+        for key, value in params.items():
+            if key.startswith("content."):
+                field = key[len("content."):]
+                notes = [n for n in notes if _content_value(n, field) == value]
+
+        count = len(notes)
+        if params.get("after"):
+            pos = bisect.bisect_right([n["id"] for n in notes], params["after"])
+            notes = notes[pos:]
+        offset = int(params.get("offset") or 0)
+        limit = int(params.get("limit") or DEFAULT_LIMIT)
+        return notes[offset:offset + limit], count
+
+    def load(self, path: Path) -> int:
+        added = 0
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        added += self.add(json.loads(line))
+        return added
+
+
+def _content_value(note: Dict[str, Any], field: str):
+    val = (note.get("content") or {}).get(field)
+    return val.get("value") if isinstance(val, dict) else val
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+
+WORDS = ("learning neural network graph transformer attention diffusion model robust efficient "
+         "sparse reinforcement policy language vision contrastive federated optimization bayesian "
+         "inference causal generative adversarial representation scalable adaptive").split()
+DECISIONS = ["Accept (oral)", "Accept (spotlight)", "Accept (poster)", "Reject", "Reject", "Reject"]
+SOUNDNESS = ["1 poor", "2 fair", "3 good", "4 excellent"]
+
+
+def synthetic_venue(venue: str, submissions: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """API v2 notes for a generated venue: submissions, reviews, decisions, comments."""
+    rng = random.Random(f"{venue}/{seed}")
+    name = " ".join(venue.split("/")[:2]).replace(".cc", "")  # "ICLR 2024"
+    base = 1_690_000_000_000
+    notes = []
+    V = lambda x: {"value": x}  # noqa: E731
+    for n in range(1, submissions + 1):
+        forum = f"{rng.getrandbits(40):010x}"
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 9))).title()
+        decision = rng.choice(DECISIONS)
+        accepted = decision.startswith("Accept")
+        prefix = f"{venue}/Submission{n}"
+        notes.append({
+            "id": forum, "forum": forum, "number": n, "cdate": base + n * 1000,
+            "invitations": [f"{venue}/-/Submission"],
+            "signatures": [f"{prefix}/Authors"],
+            "content": {
+                "title": V(title),
+                "authors": V([f"Author {rng.randint(1, 5000)}" for _ in range(rng.randint(1, 6))]),
+                "abstract": V(" ".join(rng.choice(WORDS) for _ in range(120)).capitalize() + "."),
+                "venue": V(f"{name} poster" if accepted else f"Submitted to {name}"),
+            },
+        })
+        for j in range(rng.randint(3, 5)):
+            rating = rng.choice([1, 3, 5, 6, 8, 10])
+            notes.append({
+                "id": f"{forum}r{j}", "forum": forum, "replyto": forum, "cdate": base + n * 1000 + j + 1,
+                "invitations": [f"{prefix}/-/Official_Review"],
+                "signatures": [f"{prefix}/Reviewer_{rng.getrandbits(16):04x}"],
+                "content": {
+                    "rating": V(rating), "confidence": V(rng.randint(1, 5)),
+                    "soundness": V(rng.choice(SOUNDNESS)), "presentation": V(rng.choice(SOUNDNESS)),
+                    "contribution": V(rng.choice(SOUNDNESS)),
+                    "summary": V(" ".join(rng.choice(WORDS) for _ in range(80))),
+                    "strengths": V(" ".join(rng.choice(WORDS) for _ in range(60))),
+                    "weaknesses": V(" ".join(rng.choice(WORDS) for _ in range(60))),
+                    "questions": V(" ".join(rng.choice(WORDS) for _ in range(30))),
+                },
+            })
+        notes.append({
+            "id": f"{forum}d", "forum": forum, "replyto": forum, "cdate": base + n * 1000 + 50,
+            "invitations": [f"{prefix}/-/Decision"],
+            "signatures": [f"{venue}/Program_Chairs"],
+            "content": {"decision": V(decision)},
+        })
+        for j in range(rng.randint(0, 3)):
+            notes.append({
+                "id": f"{forum}c{j}", "forum": forum, "replyto": forum, "cdate": base + n * 1000 + 60 + j,
+                "invitations": [f"{prefix}/-/Official_Comment"],
+                "signatures": [f"{prefix}/Authors"],
+                "content": {"comment": V(" ".join(rng.choice(WORDS) for _ in range(50)))},
+            })
+    return notes
+
+
+# ---------------------------------------------------------------------------
+# Server
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "openreview-stub/1"
+
+    def log_message(self, format, *args):  # noqa: A002
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+        api, _, endpoint = url.path.strip("/").partition("/")
+        server.count_request()
+
+        if server.latency or server.jitter:
+            time.sleep(server.latency + random.uniform(0, server.jitter))
+        if server.error_rate and random.random() < server.error_rate:
+            body = {"name": "Error", "message": "injected error", "status": server.error_status}
+            return self._send(server.error_status, json.dumps(body).encode())
+
+        store = server.stores.get(api)
+        if store is None or endpoint != "notes":
+            body = {"name": "NotFoundError", "message": f"no route for {url.path}"}
+            return self._send(404, json.dumps(body).encode())
+
+        if server.record:
+            return self._proxy(api, store, url.query)
+
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        notes, count = store.query(params)
+        self._send(200, json.dumps({"notes": notes, "count": count}).encode())
+
+    def _proxy(self, api: str, store: NoteStore, query: str):
+        upstream = f"{UPSTREAM[api]}/notes" + (f"?{query}" if query else "")
+        request = urllib.request.Request(upstream, headers={"Accept": "application/json",
+                                                            "User-Agent": "openreview-stub/1"})
+        try:
+            with urllib.request.urlopen(request, timeout=60) as resp:
+                status, body = resp.status, resp.read()
+        except urllib.error.HTTPError as e:
+            status, body = e.code, e.read()
+        except OSError as e:
+            status, body = 502, json.dumps({"name": "Error", "message": str(e)}).encode()
+        if status == 200:
+            self.server.save(api, json.loads(body).get("notes", []))
+        self._send(status, body)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, stores: Dict[str, NoteStore], *, fixtures: Optional[Path] = None,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 500, record: bool = False, verbose: bool = False):
+        super().__init__(address, _Handler)
+        self.stores = stores
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.record = record
+        self.verbose = verbose
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def save(self, api: str, notes: List[Dict[str, Any]]) -> None:
+        """Record notes into the store and append new ones to the fixture file."""
+        new = [n for n in notes if self.stores[api].add(n)]
+        if new and self.fixtures:
+            with self._lock, open(self.fixtures / f"{api}.jsonl", "a", encoding="utf-8") as f:
+                for note in new:
+                    f.write(json.dumps(note, ensure_ascii=False) + "\n")
+
+    @property
+    def baseurls(self) -> Dict[str, str]:
+        host, port = self.server_address[:2]
+        return {api: f"http://{host}:{port}/{api}" for api in ("v2", "v1")}
+
+
+def start_server(stores: Dict[str, NoteStore], host: str = DEFAULT_HOST, port: int = 0,
+                 **options) -> StubServer:
+    """Start a StubServer in a daemon thread (port 0 = any free port); call .shutdown() to stop."""
+    server = StubServer((host, port), stores, **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def load_stores(fixtures: Optional[Path] = None, synthetic: int = 0,
+                venues: Optional[List[str]] = None) -> Dict[str, NoteStore]:
+    stores = {"v2": NoteStore("v2"), "v1": NoteStore("v1")}
+    if fixtures:
+        for api, store in stores.items():
+            store.load(fixtures / f"{api}.jsonl")
+    if synthetic:
+        for venue in venues or []:
+            for note in synthetic_venue(venue, synthetic):
+                stores["v2"].add(note)
+    return stores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenReview API")
+    parser.add_argument("--fixtures", help="Fixture directory (v2.jsonl / v1.jsonl)")
+    parser.add_argument("--record", action="store_true",
+                        help="Proxy to the real API and append served notes to --fixtures")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N",
+                        help="Add N generated submissions (with reviews) per --venue")
+    parser.add_argument("--venue", action="append", default=[],
+                        help="Venue for --synthetic (repeatable; default ICLR.cc/2024/Conference)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, 0..J seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=500,
+                        help="HTTP status of injected errors (openreview-py retries 429/5xx)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    fixtures = Path(args.fixtures) if args.fixtures else None
+    if args.record and not fixtures:
+        print("ERROR: --record needs --fixtures DIR", file=sys.stderr)
+        sys.exit(2)
+    if fixtures:
+        fixtures.mkdir(parents=True, exist_ok=True)
+    venues = args.venue or ["ICLR.cc/2024/Conference"]
+    stores = load_stores(fixtures, args.synthetic, venues)
+    if not args.record and not any(len(s) for s in stores.values()):
+        print("ERROR: empty corpus (give --fixtures with recorded notes, --synthetic N or --record)",
+              file=sys.stderr)
+        sys.exit(2)
+
+    server = StubServer((args.host, args.port), stores, fixtures=fixtures, latency=args.latency,
+                        jitter=args.jitter, error_rate=args.error_rate,
+                        error_status=args.error_status, record=args.record, verbose=args.verbose)
+    mode = "recording" if args.record else "replaying"
+    print(f"OK: {mode} {len(stores['v2'])} v2 / {len(stores['v1'])} v1 notes")
+    print(f"  export OPENREVIEW_API_BASEURL_V2={server.baseurls['v2']}")
+    print(f"  export OPENREVIEW_BASEURL={server.baseurls['v1']}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    print(f"{server.requests} requests served")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+"""
+Venue-wide review statistics.
+
+Review scores arrive as strings like "6: marginally above the acceptance
+threshold", "3 good" or plain numbers. ReviewTable parses each distinct value
+once into typed numpy columns (one row per review, keyed by forum and
+reviewer) and computes per-paper and per-venue statistics with vectorised
+group-bys: mean, spread, reviewer disagreement, score distributions and the
+join with accept / reject decisions.
+
+Usage:
+    python review_stats.py exports/iclr2024                      # openreview_export.py output
+    python review_stats.py --venue ICLR.cc/2024/Conference -j 8  # fetch with OpenReviewFetcher
+    python review_stats.py exports/iclr2024 --venue-cache --papers papers.csv --json venues.json
+    python review_stats.py exports/iclr2024 --save iclr2024.npz  # later runs: review_stats.py iclr2024.npz
+
+    from scripts.review_stats import ReviewTable
+    table = ReviewTable.from_export("exports/iclr2024")
+    table.per_venue()["ICLR.cc/2024/Conference"]["rating"]["mean"]
+
+Decisions come from the decision / meta-review rows in the data and, with
+--venue-cache, from the venue submission lists cached by OpenReviewFetcher.
+Acceptance rates count only papers with a known decision. A cached list
+only names accepted papers ("ICLR 2024 poster"); the rest read "Submitted
+to ...". Once a venue's list names any accepted paper its decisions are out,
+so the join records those others as not accepted (desk rejections and
+withdrawals keep their own labels); before that they stay unknown.
+
+Requirements:
+    pip install numpy   (pyarrow for Parquet exports)
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+SCORE_COLUMNS = ("rating", "confidence", "soundness", "presentation", "contribution")
+READ_COLUMNS = ["forum_id", "reviewer", "venue", "recommendation"] + list(SCORE_COLUMNS)
+NOT_ACCEPTED = "Not accepted"  # joined for papers missing from a final venue list
+
+_LEADING_NUMBER = re.compile(r"\s*(-?\d+(?:\.\d+)?)")
+
+
+def parse_score(value: Any) -> float:
+    """
+    Numeric value of a review score; NaN if it has none.
+
+    Accepts numbers, numeric strings, "6: marginally above ..." / "3 good"
+    style strings (leading number) and API v2 {'value': ...} wrappers.
+    """
+    if isinstance(value, dict):
+        value = value.get("value")
+    if isinstance(value, bool) or value is None:
+        return float("nan")
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _LEADING_NUMBER.match(str(value))
+    return float(match.group(1)) if match else float("nan")
+
+
+def decision_outcome(decision: Optional[str]) -> float:
+    """1.0 for accepted, 0.0 for rejected, NaN when unknown (or withdrawn)."""
+    text = (decision or "").lower()
+    if not text or "withdraw" in text:
+        return float("nan")
+    if "reject" in text or text.startswith(NOT_ACCEPTED.lower()):
+        return 0.0
+    if any(word in text for word in ("accept", "poster", "oral", "spotlight", "notable")):
+        return 1.0
+    return float("nan")
+
+
+def venue_list_decisions(rows: List[list]) -> Dict[str, Optional[str]]:
+    """
+    {forum_id: decision} from cached venue submission rows. The cache keeps no
+    label for papers still "Submitted to ..."; once any paper in the list is
+    accepted the venue's decisions are out and those read as NOT_ACCEPTED.
+    """
+    final = any(decision_outcome(row[3]) == 1.0 for row in rows)
+    return {row[0]: row[3] or (NOT_ACCEPTED if final else None) for row in rows}
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("Review statistics need numpy. Install it with: pip install numpy")
+
+
+def _round(x: Any, digits: int = 4) -> Optional[float]:
+    """JSON-friendly float: rounded, NaN -> None."""
+    x = float(x)
+    return None if x != x else round(x, digits)
+
+
+def _group(codes, values, n: int) -> Dict[str, Any]:
+    """count / mean / std / min / max of values grouped by integer codes (NaNs skipped)."""
+    ok = ~np.isnan(values)
+    c, v = codes[ok], values[ok]
+    count = np.bincount(c, minlength=n)
+    total = np.bincount(c, weights=v, minlength=n)
+    squares = np.bincount(c, weights=v * v, minlength=n)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+        var = np.maximum(squares / count - mean * mean, 0.0)
+    lo = np.full(n, np.nan)
+    hi = np.full(n, np.nan)
+    np.fmin.at(lo, c, v)
+    np.fmax.at(hi, c, v)
+    return {"count": count, "mean": mean, "std": np.sqrt(var), "min": lo, "max": hi}
+
+
+def _corr(x, y) -> Optional[float]:
+    """Pearson correlation over pairs where both are known."""
+    ok = ~(np.isnan(x) | np.isnan(y))
+    if ok.sum() < 3 or x[ok].std() == 0 or y[ok].std() == 0:
+        return None
+    return _round(np.corrcoef(x[ok], y[ok])[0, 1])
+
+
+class ReviewTable:
+    """
+    Reviews as columns: one row per scored review, plus per-paper columns.
+
+    Review columns (length R): forum (int32 code into forum_ids), reviewer,
+    and one float64 array per SCORE_COLUMNS entry (NaN when missing).
+    Paper columns (length P): forum_ids, venue (int32 code into venues),
+    decision and accepted (1.0 / 0.0 / NaN).
+    """
+
+    def __init__(self, forum_ids: List[str], venues: List[str], paper_venue, decisions: List[Optional[str]],
+                 forum, reviewer, scores: Dict[str, Any]):
+        _require_numpy()
+        self.forum_ids = list(forum_ids)
+        self.venues = list(venues)
+        self.paper_venue = np.asarray(paper_venue, dtype=np.int32)
+        self.decisions = list(decisions)
+        self.forum = np.asarray(forum, dtype=np.int32)
+        self.reviewer = np.asarray(reviewer, dtype=object)
+        self.scores = {col: np.asarray(scores[col], dtype=np.float64) for col in SCORE_COLUMNS}
+        self._refresh()
+
+    def _refresh(self):
+        self.accepted = np.array([decision_outcome(d) for d in self.decisions], dtype=np.float64)
+        self._forum_index = {f: i for i, f in enumerate(self.forum_ids)}
+        self._papers = None
+
+    def __len__(self) -> int:
+        return len(self.forum)
+
+    # ---- building ----
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], default_venue: Optional[str] = None) -> "ReviewTable":
+        """
+        Build from review dicts: openreview_export rows or ReviewInfo.to_dict().
+
+        Rows with at least one numeric score become reviews. Rows without any
+        (decision notes, most meta-reviews) only contribute their
+        recommendation text as the paper's decision.
+        """
+        _require_numpy()
+        forum_index: Dict[str, int] = {}
+        venue_index: Dict[str, int] = {}
+        paper_venue: List[int] = []
+        decisions: List[Optional[str]] = []
+        decision_rank: List[int] = []
+        forum: List[int] = []
+        reviewer: List[str] = []
+        columns: Dict[str, List[float]] = {col: [] for col in SCORE_COLUMNS}
+        parsed: Dict[Any, float] = {}  # distinct raw score -> number, parsed once
+
+        def score(value):
+            if isinstance(value, dict):
+                value = value.get("value")
+            try:
+                return parsed[value]
+            except KeyError:
+                parsed[value] = result = parse_score(value)
+                return result
+            except TypeError:  # unhashable
+                return parse_score(value)
+
+        for row in rows:
+            forum_id = row.get("forum_id")
+            if not forum_id:
+                continue
+            code = forum_index.get(forum_id)
+            if code is None:
+                venue = row.get("venue") or default_venue or "unknown"
+                code = forum_index[forum_id] = len(paper_venue)
+                paper_venue.append(venue_index.setdefault(venue, len(venue_index)))
+                decisions.append(None)
+                decision_rank.append(0)
+
+            values = [score(row.get(col)) for col in SCORE_COLUMNS]
+            if all(v != v for v in values):
+                text = row.get("recommendation")
+                if isinstance(text, dict):
+                    text = text.get("value")
+                if isinstance(text, str) and text.strip():
+                    # the program chairs' decision note beats a meta-review recommendation
+                    rank = 2 if "program" in (row.get("reviewer") or "").lower() else 1
+                    if rank >= decision_rank[code]:
+                        decisions[code], decision_rank[code] = text.strip(), rank
+                continue
+
+            forum.append(code)
+            reviewer.append(row.get("reviewer") or "")
+            for col, v in zip(SCORE_COLUMNS, values):
+                columns[col].append(v)
+
+        return cls(list(forum_index), list(venue_index), paper_venue, decisions, forum, reviewer, columns)
+
+    @classmethod
+    def from_export(cls, path: str) -> "ReviewTable":
+        """Build from an openreview_export.py output directory (checkpointed JSONL / Parquet parts)."""
+        return cls.from_rows(export_rows(path))
+
+    @classmethod
+    def from_fetcher(cls, fetcher, venue: str, jobs: int = 8, api: int = 2) -> "ReviewTable":
+        """Fetch every forum of a venue (submission list from the venue cache) and build the table."""
+        table = cls.from_rows(fetch_rows(fetcher, venue, jobs, api), default_venue=venue)
+        table.join_venue_cache(fetcher, [venue])
+        return table
+
+    def join_decisions(self, decisions: Dict[str, Optional[str]], overwrite: bool = False) -> int:
+        """Set paper decisions from {forum_id: decision}; returns how many papers changed."""
+        changed = 0
+        for forum_id, decision in decisions.items():
+            i = self._forum_index.get(forum_id)
+            if i is not None and decision and (overwrite or not self.decisions[i]):
+                self.decisions[i] = decision
+                changed += 1
+        if changed:
+            self._refresh()
+        return changed
+
+    def join_venue_cache(self, fetcher, venues: Optional[List[str]] = None) -> int:
+        """
+        Fill missing decisions from the fetcher's cached venue submission lists.
+
+        Unlabelled papers count as not accepted once the venue's decisions are out
+        (venue_list_decisions); decisions already set are kept.
+        """
+        joined = 0
+        for venue in venues or [v for v in self.venues if v != "unknown"]:
+            joined += self.join_decisions(venue_list_decisions(fetcher.venue_submissions(venue)))
+        return joined
+
+    # ---- storage ----
+
+    def save(self, path: str) -> None:
+        """Write the parsed columns to a .npz file (load() skips all parsing)."""
+        np.savez_compressed(
+            path,
+            forum_ids=np.array(self.forum_ids, dtype=str),
+            venues=np.array(self.venues, dtype=str),
+            paper_venue=self.paper_venue,
+            decisions=np.array([d or "" for d in self.decisions], dtype=str),
+            forum=self.forum,
+            reviewer=np.array(self.reviewer.tolist(), dtype=str),
+            **{f"score_{col}": self.scores[col] for col in SCORE_COLUMNS},
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ReviewTable":
+        _require_numpy()
+        with np.load(path) as data:
+            return cls(data["forum_ids"].tolist(), data["venues"].tolist(), data["paper_venue"],
+                       [d or None for d in data["decisions"].tolist()], data["forum"],
+                       data["reviewer"].tolist(), {col: data[f"score_{col}"] for col in SCORE_COLUMNS})
+
+    # ---- statistics ----
+
+    def paper_scores(self, forum_id: str) -> Dict[str, Dict[str, Optional[float]]]:
+        """{reviewer: {score column: value}} for one paper."""
+        rows = np.flatnonzero(self.forum == self._forum_index[forum_id])
+        return {self.reviewer[i]: {col: _round(self.scores[col][i]) for col in SCORE_COLUMNS} for i in rows}
+
+    def per_paper(self) -> Dict[str, Any]:
+        """
+        Per-paper columns (arrays of length P): reviews, <score>_mean / _std for
+        every score, rating_min / rating_max / rating_range, plus forum_ids,
+        venue, decision and accepted.
+        """
+        if self._papers is None:
+            n = len(self.forum_ids)
+            papers: Dict[str, Any] = {
+                "forum_id": self.forum_ids,
+                "venue": [self.venues[v] for v in self.paper_venue],
+                "reviews": np.bincount(self.forum, minlength=n),
+            }
+            for col in SCORE_COLUMNS:
+                g = _group(self.forum, self.scores[col], n)
+                papers[f"{col}_mean"] = g["mean"]
+                papers[f"{col}_std"] = g["std"]
+                if col == "rating":
+                    papers["rating_min"], papers["rating_max"] = g["min"], g["max"]
+                    papers["rating_range"] = g["max"] - g["min"]
+            papers["decision"] = self.decisions
+            papers["accepted"] = self.accepted
+            self._papers = papers
+        return self._papers
+
+    def per_venue(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-venue summary: paper / review counts, for every score its mean, std,
+        quartiles and value histogram, reviewer disagreement (mean per-paper
+        rating std and range), acceptance rate and how ratings relate to decisions.
+        Decision statistics cover only papers with a known decision ("papers");
+        "undecided" counts the others.
+        """
+        papers = self.per_paper()
+        review_venue = self.paper_venue[self.forum]
+        result = {}
+        for v, venue in enumerate(self.venues):
+            in_venue = self.paper_venue == v
+            reviews = review_venue == v
+            summary: Dict[str, Any] = {"papers": int(in_venue.sum()), "reviews": int(reviews.sum())}
+
+            for col in SCORE_COLUMNS:
+                values = self.scores[col][reviews]
+                values = values[~np.isnan(values)]
+                if not len(values):
+                    continue
+                levels, counts = np.unique(values, return_counts=True)
+                q1, median, q3 = np.percentile(values, [25, 50, 75])
+                summary[col] = {
+                    "n": int(len(values)), "mean": _round(values.mean()), "std": _round(values.std()),
+                    "q1": _round(q1), "median": _round(median), "q3": _round(q3),
+                    "histogram": {f"{x:g}": int(c) for x, c in zip(levels, counts)},
+                }
+
+            multi = in_venue & (papers["reviews"] >= 2) & ~np.isnan(papers["rating_std"])
+            if multi.any():
+                summary["disagreement"] = {
+                    "papers": int(multi.sum()),
+                    "mean_rating_std": _round(papers["rating_std"][multi].mean()),
+                    "mean_rating_range": _round(papers["rating_range"][multi].mean()),
+                    "max_rating_range": _round(papers["rating_range"][multi].max()),
+                }
+
+            accepted = self.accepted[in_venue]
+            rating = papers["rating_mean"][in_venue]
+            decided = ~np.isnan(accepted)
+            if decided.any():
+                acc, rej = decided & (accepted == 1), decided & (accepted == 0)
+                summary["decisions"] = {
+                    "papers": int(decided.sum()),
+                    "undecided": int((~decided).sum()),
+                    "acceptance_rate": _round(accepted[decided].mean()),
+                    "mean_rating_accepted": _round(np.nanmean(rating[acc])) if (acc & ~np.isnan(rating)).any() else None,
+                    "mean_rating_rejected": _round(np.nanmean(rating[rej])) if (rej & ~np.isnan(rating)).any() else None,
+                    "rating_acceptance_corr": _corr(rating, accepted),
+                }
+            summary["rating_confidence_corr"] = _corr(self.scores["rating"][reviews],
+                                                      self.scores["confidence"][reviews])
+            result[venue] = summary
+        return result
+
+    def write_papers(self, path: str) -> None:
+        """Per-paper statistics as CSV, JSONL or Parquet (by extension)."""
+        papers = self.per_paper()
+        names = list(papers)
+        columns = [papers[name] for name in names]
+        records = [{name: (_round(x) if isinstance(x, (float, np.floating)) else
+                           int(x) if isinstance(x, np.integer) else x)
+                    for name, x in zip(names, values)} for values in zip(*columns)]
+        out = Path(path)
+        if out.suffix == ".parquet":
+            if not PYARROW_AVAILABLE:
+                raise ImportError("Parquet output needs pyarrow. Install it with: pip install pyarrow")
+            import pyarrow as pa
+            pq.write_table(pa.Table.from_pylist(records), str(out))
+        elif out.suffix == ".jsonl":
+            with open(out, "w", encoding="utf-8") as fh:
+                for record in records:
+                    fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            with open(out, "w", encoding="utf-8", newline="") as fh:
+                writer = csv.DictWriter(fh, fieldnames=names)
+                writer.writeheader()
+                writer.writerows(records)
+
+
+def export_rows(path: str) -> Iterable[Dict[str, Any]]:
+    """Review rows of an openreview_export.py output directory (checkpointed parts only)."""
+    out = Path(path)
+    checkpoint = out / "checkpoint.json"
+    if checkpoint.exists():
+        parts = [out / name for name in json.loads(checkpoint.read_text(encoding="utf-8"))["parts"]
+                 if name.startswith("reviews-")]
+    else:
+        parts = sorted(out.glob("reviews-*.*"))
+    if not parts:
+        raise FileNotFoundError(f"no review parts in {out}")
+    for part in parts:
+        yield from _read_part(part)
+
+
+def fetch_rows(fetcher, venue: str, jobs: int = 8, api: int = 2) -> Iterable[Dict[str, Any]]:
+    """Review rows of every forum in a venue, fetched concurrently by an OpenReviewFetcher."""
+    forum_ids = [row[0] for row in fetcher.venue_submissions(venue)]
+
+    def rows(forum_id):
+        forum = fetcher.fetch_forum(forum_id, api)
+        return [dict(r.to_dict(raw=False), venue=venue) for r in forum.reviews]
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for batch in executor.map(rows, forum_ids):
+            yield from batch
+
+
+def _read_part(path: Path) -> Iterable[Dict[str, Any]]:
+    """Review rows of one export part file (only the columns statistics need)."""
+    if path.suffix == ".parquet":
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Reading Parquet exports needs pyarrow. Install it with: pip install pyarrow")
+        table = pq.read_table(str(path), columns=READ_COLUMNS)
+        columns = table.to_pydict()
+        for values in zip(*(columns[c] for c in READ_COLUMNS)):
+            yield dict(zip(READ_COLUMNS, values))
+    else:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def format_summary(per_venue: Dict[str, Dict[str, Any]]) -> str:
+    """Plain-text per-venue report."""
+    lines = []
+    for venue, s in per_venue.items():
+        lines.append(f"{venue}: {s['papers']} papers, {s['reviews']} reviews")
+        for col in SCORE_COLUMNS:
+            if col in s:
+                c = s[col]
+                lines.append(f"  {col:<13} mean {c['mean']:.2f}  std {c['std']:.2f}  "
+                             f"median {c['median']:g}  n={c['n']}")
+        if "disagreement" in s:
+            d = s["disagreement"]
+            lines.append(f"  disagreement  rating std {d['mean_rating_std']:.2f}  "
+                         f"range {d['mean_rating_range']:.2f} (max {d['max_rating_range']:g})")
+        if "decisions" in s:
+            d = s["decisions"]
+            acc, rej, corr = (("-" if x is None else f"{x:.2f}") for x in
+                              (d["mean_rating_accepted"], d["mean_rating_rejected"], d["rating_acceptance_corr"]))
+            lines.append(f"  decisions     {d['papers']} papers ({d['undecided']} undecided), "
+                         f"accepted {d['acceptance_rate']:.1%}; "
+                         f"mean rating accepted {acc} / rejected {rej}; corr {corr}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Venue-wide OpenReview review statistics")
+    parser.add_argument("source", nargs="?", help="openreview_export.py output directory or a saved .npz table")
+    parser.add_argument("--venue", action="append", default=[],
+                        help="Fetch a venue with OpenReviewFetcher instead (repeatable)")
+    parser.add_argument("--jobs", "-j", type=int, default=8, help="Concurrent forum fetches with --venue")
+    parser.add_argument("--api", type=int, choices=[1, 2], default=2, help="OpenReview API version with --venue")
+    parser.add_argument("--venue-cache", action="store_true",
+                        help="Fill missing decisions from the cached venue submission lists")
+    parser.add_argument("--papers", help="Write per-paper statistics (.csv, .jsonl or .parquet)")
+    parser.add_argument("--json", help="Write per-venue statistics as JSON")
+    parser.add_argument("--save", help="Save the parsed table as .npz for later runs")
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("ERROR: numpy is not installed (pip install numpy)", file=sys.stderr)
+        sys.exit(2)
+    if not args.source and not args.venue:
+        print("ERROR: give an export directory, a .npz table or --venue", file=sys.stderr)
+        sys.exit(2)
+
+    fetcher = None
+    if args.venue or args.venue_cache:
+        try:
+            from .openreview_api import OpenReviewFetcher
+        except ImportError:
+            from openreview_api import OpenReviewFetcher
+        fetcher = OpenReviewFetcher(max_workers=args.jobs)
+
+    try:
+        if args.source and args.source.endswith(".npz"):
+            if args.venue:
+                print("ERROR: a saved .npz table can't be combined with --venue", file=sys.stderr)
+                sys.exit(2)
+            table = ReviewTable.load(args.source)
+        else:
+            sources = [export_rows(args.source)] if args.source else []
+            sources += [fetch_rows(fetcher, venue, args.jobs, args.api) for venue in args.venue]
+            table = ReviewTable.from_rows(row for rows in sources for row in rows)
+    except (ImportError, FileNotFoundError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if fetcher is not None:
+        joined = table.join_venue_cache(fetcher, args.venue or None)
+        print(f"OK: {joined} decisions joined from the venue cache", file=sys.stderr)
+    print(f"OK: {len(table.forum_ids)} papers, {len(table)} reviews, "
+          f"{int((~np.isnan(table.accepted)).sum())} with decisions", file=sys.stderr)
+    if np.isnan(table.accepted).all():
+        print("WARN: no decisions found; try --venue-cache", file=sys.stderr)
+
+    per_venue = table.per_venue()
+    print(format_summary(per_venue))
+
+    if args.papers:
+        table.write_papers(args.papers)
+    if args.json:
+        Path(args.json).write_text(json.dumps(per_venue, indent=2) + "\n", encoding="utf-8")
+    if args.save:
+        table.save(args.save)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""search_paper in openreview_api.py: a fuzzy API v2 hit must not hide an exact API v1 title."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+pytest.importorskip("openreview")
+
+import openreview_api as api  # noqa: E402
+import openreview_stub as stub  # noqa: E402
+
+VENUE = "ICLR.cc/2024/Conference"
+TITLE = "Attention Is All You Need"
+
+
+@pytest.fixture
+def server():
+    notes = stub.synthetic_venue(VENUE, 10)
+    notes[0]["content"]["title"] = {"value": "Attention Is Not All You Need"}
+    stores = stub.load_stores()
+    for note in notes:
+        stores["v2"].add(note)
+    stores["v1"].add({"id": "v1paper", "forum": "v1paper", "cdate": 1,
+                      "invitation": "ICLR.cc/2018/Conference/-/Blind_Submission",
+                      "content": {"title": TITLE, "authors": ["A. Vaswani"]}})
+    server = stub.start_server(stores)
+    yield server
+    server.shutdown()
+
+
+def test_exact_v1_title_beats_fuzzy_v2_hit(server, tmp_path):
+    fetcher = api.OpenReviewFetcher(cache_dir=str(tmp_path), baseurl_v2=server.baseurls["v2"],
+                                    baseurl_v1=server.baseurls["v1"])
+    for cache in ("cold", "warm"):
+        papers = fetcher.search_paper(TITLE, venue=VENUE, limit=5)
+        assert papers[0].title == TITLE, cache
+        assert "Attention Is Not All You Need" in [p.title for p in papers], cache
+        assert fetcher.get_reviews_by_title(TITLE, venue=VENUE)["paper"]["title"] == TITLE, cache
+
+
+def test_confident_v2_hit_skips_v1(server, tmp_path):
+    fetcher = api.OpenReviewFetcher(cache_dir=str(tmp_path), baseurl_v2=server.baseurls["v2"],
+                                    baseurl_v1=server.baseurls["v1"])
+    papers = fetcher.search_paper("Attention Is Not All You Need", venue=VENUE, limit=5)
+    assert papers[0].title == "Attention Is Not All You Need"
+    assert TITLE not in [p.title for p in papers]
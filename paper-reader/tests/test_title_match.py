@@ -0,0 +1,23 @@
+"""Title verification in openreview_api.py: near-miss titles sharing a prefix are rejected."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from openreview_api import titles_match  # noqa: E402
+
+
+def test_titles_sharing_a_prefix_do_not_match():
+    assert not titles_match("Benchmark Paper: Prose", "Benchmark Paper: Math")
+    assert not titles_match("Benchmark Paper: Math", "Benchmark Paper: Prose")
+    assert not titles_match("Deep Residual Learning for Image Recognition", "Deep Residual Learning")
+
+
+def test_same_title_with_formatting_differences_matches():
+    assert titles_match("Attention Is All You Need", "Attention is all you need.")
+    assert titles_match("Denoising Diffusion Probabilistic Models", "Denoising diffusion probabilistic model")
+    assert titles_match("Graph Atention Networks", "Graph Attention Networks")
+
+
+def test_shortened_query_matches_full_title():
+    assert titles_match("Deep Residual Learning", "Deep Residual Learning for Image Recognition")
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for pdf2md.py engines and modes.
+
+Generates a deterministic local PDF corpus (needs PyMuPDF), runs every
+engine / mode on it in a fresh child process, and reports wall time,
+pages/s, peak RSS and quality signals (surviving $...$ formulas, table
+rows, headings) as JSON, so conversion-speed regressions can be tracked.
+
+Usage:
+    python bench_pdf2md.py [--corpus-dir DIR] [--out results.json]
+                           [--cases pdftotext,pymupdf,marker,...] [--docs prose,math]
+                           [--repeat N] [--baseline previous.json]
+
+Cases:
+    pdftotext      poppler plain text (whole document)
+    pymupdf        PyMuPDF plain text (whole document)
+    pymupdf-md     pdf2md fast path: PyMuPDF → Markdown per page
+    marker         pdf2md, one marker_single run per document (no worker)
+    marker-worker  pdf2md via a running marker_worker.py
+    chunked        pdf2md chunked mode (10-page chunks, --jobs)
+    routed         pdf2md --route (PyMuPDF for prose pages, Marker for the rest)
+
+Exit codes: 0=ok, 1=regressions against --baseline, 2=setup failure
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import marker_worker
+import pdf_cache
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PDF2MD = SCRIPT_DIR / "pdf2md.py"
+
+DOCS = {  # name → pages
+    "prose": 12,
+    "math": 8,
+    "tables": 6,
+    "long": 120,
+    "scanned": 5,
+}
+CASES = ["pdftotext", "pymupdf", "pymupdf-md", "marker", "marker-worker", "chunked", "routed"]
+REGRESSION = 0.8  # pages/s below this fraction of the baseline is a regression
+
+INLINE_MATH_RE = re.compile(r"(?<!\$)\$[^$\n]+\$(?!\$)")
+DISPLAY_MATH_RE = re.compile(r"\$\$.+?\$\$", re.S)
+TABLE_ROW_RE = re.compile(r"^\|.*\|\s*$", re.M)
+TABLE_RULE_RE = re.compile(r"^\|[\s:|-]+\|\s*$", re.M)
+HEADING_RE = re.compile(r"^#{1,6} \S", re.M)
+
+WORDS = ("model data training loss gradient network layer attention sequence token "
+         "policy reward market price return signal feature sample batch error bound "
+         "theorem proof method result table figure baseline dataset evaluation").split()
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 18))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, n: int = 5) -> str:
+    return " ".join(_sentence(rng) for _ in range(n))
+
+
+def _prose_page(page, rng: random.Random, heading: str | None, y: float = 72) -> float:
+    if heading:
+        page.insert_text((72, y), heading, fontsize=14)
+        y += 28
+    while y < 640:
+        rect = (72, y, 540, y + 110)
+        page.insert_textbox(rect, _paragraph(rng), fontsize=10)
+        y += 120
+    return y
+
+
+def _formula_block(page, rng: random.Random, y: float) -> None:
+    # Base-14 Symbol font: a, b, S, p ... render as alpha, beta, Sigma, pi
+    for i in range(4):
+        expr = f"S a{i} = b{i} + p * l / (s + {rng.randint(2, 9)})"
+        page.insert_text((110, y + i * 22), expr, fontsize=12, fontname="symb")
+
+
+def _table(page, rng: random.Random, y: float, rows: int = 6, cols: int = 4) -> None:
+    w, h = 468 / cols, 20
+    for r in range(rows + 1):
+        page.draw_line((72, y + r * h), (72 + cols * w, y + r * h))
+    for c in range(cols + 1):
+        page.draw_line((72 + c * w, y), (72 + c * w, y + rows * h))
+    for r in range(rows):
+        for c in range(cols):
+            cell = "Method" if r == 0 and c == 0 else (
+                rng.choice(WORDS) if r == 0 or c == 0 else f"{rng.uniform(0, 100):.1f}")
+            page.insert_text((76 + c * w, y + r * h + 14), cell, fontsize=9)
+
+
+def generate_corpus(out_dir: Path, docs: list[str]) -> dict[str, Path]:
+    """Write the benchmark PDFs (same bytes on every run) and return their paths."""
+    import fitz  # type: ignore
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for name in docs:
+        path = out_dir / f"{name}.pdf"
+        paths[name] = path
+        if path.exists():
+            continue
+        rng = random.Random(name)
+        doc = fitz.open()
+        source = fitz.open() if name == "scanned" else doc
+        for i in range(DOCS[name]):
+            page = source.new_page()
+            heading = f"{i + 1} {rng.choice(WORDS).title()} {rng.choice(WORDS).title()}"
+            if i == 0:
+                page.insert_text((72, 60), f"Benchmark Paper: {name.title()}", fontsize=20)
+            if name in ("prose", "long", "scanned"):
+                _prose_page(page, rng, heading, 100 if i == 0 else 72)
+            elif name == "math":
+                _prose_page(page, rng, heading, 100 if i == 0 else 72)
+                _formula_block(page, rng, 660)
+            elif name == "tables":
+                page.insert_text((72, 100), heading, fontsize=14)
+                page.insert_textbox((72, 120, 540, 300), _paragraph(rng, 8), fontsize=10)
+                _table(page, rng, 320)
+                _table(page, rng, 500, rows=8)
+        if name == "scanned":
+            for src in source:
+                page = doc.new_page()
+                page.insert_image(page.rect, pixmap=src.get_pixmap(dpi=150))
+        doc.set_metadata({})
+        doc.save(str(path), garbage=3, deflate=True, no_new_id=True)
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Running one case
+
+_FAST_SNIPPETS = {
+    "pymupdf": (
+        "import fitz,sys\n"
+        "doc=fitz.open(sys.argv[1])\n"
+        "open(sys.argv[2],'w').write('\\n\\n'.join(p.get_text() for p in doc))\n"),
+    "pymupdf-md": (
+        "import sys; sys.path.insert(0, sys.argv[3]); import fitz, pdf2md\n"
+        "doc=fitz.open(sys.argv[1])\n"
+        "open(sys.argv[2],'w').write('\\n\\n'.join(pdf2md.fast_page_markdown(p) for p in doc))\n"),
+}
+
+
+def case_command(case: str, pdf: Path, out: Path, jobs: int) -> list[str]:
+    if case == "pdftotext":
+        return ["pdftotext", "-layout", str(pdf), str(out)]
+    if case in _FAST_SNIPPETS:
+        return [sys.executable, "-c", _FAST_SNIPPETS[case], str(pdf), str(out), str(SCRIPT_DIR)]
+    cmd = [sys.executable, str(PDF2MD), str(pdf), "-o", str(out),
+           "--force", "--no-cache", "--no-index"]
+    if case in ("marker", "marker-worker"):
+        cmd += ["--chunk-pages", "0"]
+    elif case == "chunked":
+        cmd += ["--chunk-pages", "10", "--jobs", str(jobs)]
+    elif case == "routed":
+        cmd += ["--route", "--jobs", str(jobs)]
+    return cmd
+
+
+def case_unavailable(case: str) -> str | None:
+    """Reason a case cannot run here, or None."""
+    if case == "pdftotext" and not shutil.which("pdftotext"):
+        return "pdftotext not installed"
+    needs_fitz = case in ("pymupdf", "pymupdf-md", "routed")
+    if needs_fitz:
+        try:
+            import fitz  # type: ignore  # noqa: F401
+        except ImportError:
+            return "PyMuPDF not installed"
+    try:
+        worker_up = marker_worker.request({"op": "ping"}, timeout=5) is not None
+    except (OSError, ValueError):  # busy or still loading models
+        worker_up = False
+    if case == "marker-worker" and not worker_up:
+        return "marker_worker.py not running"
+    if case in ("marker", "chunked", "routed") and not shutil.which("marker_single"):
+        return "marker_single not installed"
+    return None
+
+
+def run_measured(cmd: list[str], env: dict, timeout: float) -> tuple[int, float, float | None]:
+    """Run cmd; return (exit code, wall seconds, peak RSS in MB incl. waited-for children)."""
+    start = time.monotonic()
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is KiB on Linux, bytes on macOS
+            scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+            rss = usage.ru_maxrss / scale
+        else:
+            proc.wait()
+            rss = None
+    finally:
+        timer.cancel()
+    return proc.returncode, time.monotonic() - start, rss
+
+
+def quality(text: str) -> dict:
+    return {
+        "inline_formulas": len(INLINE_MATH_RE.findall(text)),
+        "display_formulas": len(DISPLAY_MATH_RE.findall(text)),
+        "table_rows": len(TABLE_ROW_RE.findall(text)) - len(TABLE_RULE_RE.findall(text)),
+        "headings": len(HEADING_RE.findall(text)),
+        "chars": len(text),
+    }
+
+
+def run_case(case: str, name: str, pdf: Path, *, jobs: int, timeout: float) -> dict:
+    row = {"doc": name, "case": case, "pages": DOCS[name]}
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / f"{name}.md"
+        env = dict(os.environ)
+        if case != "marker-worker":
+            env[marker_worker.WORKER_ENV] = "off"
+        code, seconds, rss = run_measured(case_command(case, pdf, out, jobs), env, timeout)
+        if not out.exists() and out.with_suffix(".txt").exists():
+            out = out.with_suffix(".txt")  # pdf2md fell back to plain text
+        text = out.read_text(encoding="utf-8", errors="replace") if out.exists() else ""
+    row.update(exit_code=code, seconds=round(seconds, 3),
+               pages_per_s=round(DOCS[name] / seconds, 3) if seconds else None,
+               peak_rss_mb=round(rss, 1) if rss is not None else None, **quality(text))
+    return row
+
+
+# ---------------------------------------------------------------------------
+
+def compare(results: list[dict], baseline: list[dict]) -> list[str]:
+    """Regressions: cases whose pages/s fell below REGRESSION x baseline."""
+    before = {(r["doc"], r["case"]): r for r in baseline if r.get("pages_per_s")}
+    found = []
+    for r in results:
+        old = before.get((r["doc"], r["case"]))
+        if old and r.get("pages_per_s") and r["pages_per_s"] < old["pages_per_s"] * REGRESSION:
+            found.append(f"{r['case']} on {r['doc']}: {r['pages_per_s']:.2f} pages/s "
+                         f"(baseline {old['pages_per_s']:.2f})")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pdf2md engines and modes")
+    parser.add_argument("--corpus-dir", default=str(Path(tempfile.gettempdir()) / "pdf2md-bench"),
+                        help="Where the generated PDFs are kept (reused across runs)")
+    parser.add_argument("--out", "-o", help="Write results JSON here (default: stdout)")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated case names")
+    parser.add_argument("--docs", default=",".join(DOCS), help="Comma-separated corpus documents")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case (best time kept)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="--jobs passed to chunked/routed modes")
+    parser.add_argument("--timeout", type=float, default=3600, help="Seconds per run")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare pages/s against")
+    args = parser.parse_args()
+
+    cases = [c for c in args.cases.split(",") if c]
+    docs = [d for d in args.docs.split(",") if d]
+    unknown = [c for c in cases if c not in CASES] + [d for d in docs if d not in DOCS]
+    if unknown:
+        print(f"ERROR: unknown case/doc: {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(2)
+    try:
+        corpus = generate_corpus(Path(args.corpus_dir), docs)
+    except ImportError:
+        print("ERROR: generating the corpus needs PyMuPDF (pip install pymupdf)", file=sys.stderr)
+        sys.exit(2)
+
+    results = []
+    for case in cases:
+        reason = case_unavailable(case)
+        if reason:
+            print(f"SKIP: {case} ({reason})", file=sys.stderr)
+            continue
+        for name in docs:
+            runs = [run_case(case, name, corpus[name], jobs=args.jobs, timeout=args.timeout)
+                    for _ in range(max(1, args.repeat))]
+            best = min(runs, key=lambda r: r["seconds"])
+            results.append(best)
+            print(f"{case:<14} {name:<8} {best['pages_per_s'] or 0:>8.2f} pages/s  "
+                  f"{best['peak_rss_mb'] or 0:>7.0f} MB  exit {best['exit_code']}",
+                  file=sys.stderr)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "host": platform.node(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "python": platform.python_version(),
+            "engine": pdf_cache.engine_version(),
+            "jobs": args.jobs,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline)
+        for line in regressions:
+            print(f"REGRESSION: {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""Long-lived Marker worker: load models once, serve conversions over a Unix socket.
+
+Start it once per session, then every pdf2md.py run (and every chunk of a
+large PDF) reuses the warm models instead of paying the ~60s warm-up again:
+
+    python marker_worker.py [--socket PATH] [--workers 1]
+
+The socket (default $XDG_RUNTIME_DIR/pdf2md-worker.sock, else
+~/.cache/pdf2md/pdf2md-worker.sock) is created with mode 0600 in a private
+directory, so only the user running the worker can send it files to convert.
+
+Protocol: one JSON object per line.
+
+    {"op": "ping"}
+    {"op": "convert", "pdf": "/abs/path.pdf", "pages": "0,5-10",
+     "no_images": true, "paginate": false, "timeout": 600}
+
+A convert first gets {"started": true} once a model process picks it up
+(time spent queued behind other jobs does not count against "timeout"),
+then the result: {"ok": true, "markdown": "..."} or {"ok": false,
+"error": "..."}. A job that runs past its timeout, or whose client
+disconnects, is cancelled: its model process is killed and replaced.
+
+pdf2md.py connects automatically when the worker is listening on the socket
+in $PDF2MD_WORKER (default above). Set PDF2MD_WORKER=off to force the
+one-shot marker_single path.
+"""
+import argparse
+import json
+import os
+import queue
+import select
+import signal
+import socket
+import socketserver
+import sys
+import time
+from pathlib import Path
+
+WORKER_ENV = "PDF2MD_WORKER"
+SOCKET_NAME = "pdf2md-worker.sock"
+CONNECT_TIMEOUT = 0.2
+QUEUE_TIMEOUT = 3600  # longest a client waits for a free model process
+RESULT_GRACE = 30     # client-side slack over the server-enforced job timeout
+DEFAULT_JOB_TIMEOUT = 600
+POLL = 0.5
+
+
+def default_socket_path() -> Path:
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return Path(runtime) / SOCKET_NAME
+    return Path.home() / ".cache" / "pdf2md" / SOCKET_NAME
+
+
+def worker_socket() -> Path | None:
+    """Socket path from $PDF2MD_WORKER, the default path, or None if disabled."""
+    value = os.environ.get(WORKER_ENV, "").strip()
+    if value.lower() in ("off", "0", "none", "false"):
+        return None
+    return Path(value).expanduser() if value else default_socket_path()
+
+
+def request(payload: dict, *, timeout: float, queue_timeout: float = QUEUE_TIMEOUT) -> dict | None:
+    """Send one request to the worker; None if no worker is listening.
+
+    For a convert, timeout bounds the conversion itself and waiting for a
+    free model process is bounded separately by queue_timeout. Other ops
+    (ping) never queue, so timeout bounds the whole reply, also while the
+    worker is still loading its models. Raises TimeoutError when either
+    runs out (closing the connection, which cancels the job on the worker).
+    """
+    path = worker_socket()
+    if path is None or not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    with sock:
+        convert = payload.get("op") == "convert"
+        payload = dict(payload, timeout=timeout) if convert else payload
+        sock.settimeout(queue_timeout if convert else timeout)
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+            if line and json.loads(line).get("started"):
+                sock.settimeout(timeout + RESULT_GRACE)
+                line = f.readline()
+    if not line:
+        return {"ok": False, "error": "worker closed the connection"}
+    return json.loads(line)
+
+
+# ---------------------------------------------------------------------------
+# Server side (model processes import marker lazily)
+
+_MODELS = None
+
+
+def _load_models():
+    global _MODELS
+    from marker.models import create_model_dict  # type: ignore
+    _MODELS = create_model_dict()
+
+
+def _convert(req: dict) -> dict:
+    from marker.config.parser import ConfigParser  # type: ignore
+    from marker.converters.pdf import PdfConverter  # type: ignore
+    from marker.output import text_from_rendered  # type: ignore
+
+    config = {"output_format": "markdown"}
+    if req.get("pages"):
+        config["page_range"] = req["pages"]
+    if req.get("no_images"):
+        config["disable_image_extraction"] = True
+    if req.get("paginate"):
+        config["paginate_output"] = True
+    try:
+        parser = ConfigParser(config)
+        converter = PdfConverter(
+            config=parser.generate_config_dict(),
+            artifact_dict=_MODELS,
+            processor_list=parser.get_processors(),
+            renderer=parser.get_renderer(),
+        )
+        text, _, _ = text_from_rendered(converter(req["pdf"]))
+    except Exception as e:  # report, keep serving
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    return {"ok": True, "markdown": text}
+
+
+def _serve_models(conn) -> None:
+    """Model process: load once, then convert requests from the pipe until it closes."""
+    _load_models()
+    conn.send({"ready": True})
+    while True:
+        try:
+            req = conn.recv()
+        except EOFError:
+            return
+        conn.send(_convert(req))
+
+
+class _Slot:
+    """One model process; killed and replaced when a job is cancelled."""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self._start()
+
+    def _start(self):
+        self.conn, child = self.ctx.Pipe()
+        self.proc = self.ctx.Process(target=_serve_models, args=(child,), daemon=True)
+        self.proc.start()
+        child.close()
+        self.ready = False
+
+    def wait_ready(self, alive=lambda: True) -> bool:
+        while not self.ready:
+            if not self.proc.is_alive():
+                raise RuntimeError("model process died while loading Marker")
+            if self.conn.poll(POLL):
+                self.ready = bool(self.conn.recv().get("ready"))
+            elif not alive():
+                return False
+        return True
+
+    def restart(self):
+        self.proc.kill()
+        self.proc.join()
+        self.conn.close()
+        self._start()
+
+    def stop(self):
+        self.proc.kill()
+        self.conn.close()
+
+
+def _client_gone(sock: socket.socket) -> bool:
+    """True once the client has closed its end (it sends nothing after the request)."""
+    readable, _, _ = select.select([sock], [], [], 0)
+    if not readable:
+        return False
+    try:
+        return sock.recv(1, socket.MSG_PEEK) == b""
+    except OSError:
+        return True
+
+
+def _marker_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("marker-pdf")
+    except Exception:
+        return "unknown"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def send(self, obj: dict) -> None:
+        self.wfile.write(json.dumps(obj).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            req = json.loads(line)
+        except ValueError:
+            return self.send({"ok": False, "error": "invalid JSON request"})
+        op = req.get("op")
+        if op == "ping":
+            return self.send({"ok": True, "workers": self.server.workers,
+                              "idle": self.server.idle.qsize(),
+                              "marker_version": self.server.marker_version})
+        if op != "convert" or not req.get("pdf"):
+            return self.send({"ok": False, "error": f"unknown request: {op!r}"})
+
+        alive = lambda: not _client_gone(self.connection)
+        slot = None
+        while slot is None:  # queued: does not count against the job timeout
+            try:
+                slot = self.server.idle.get(timeout=POLL)
+            except queue.Empty:
+                if not alive():
+                    return
+        try:
+            if not slot.wait_ready(alive):
+                return
+            self.send({"started": True})
+            slot.conn.send(req)
+            deadline = time.monotonic() + float(req.get("timeout") or DEFAULT_JOB_TIMEOUT)
+            while not slot.conn.poll(POLL):
+                if time.monotonic() > deadline or not alive():
+                    slot.restart()  # Marker can't be interrupted: cancel by replacing the process
+                    if alive():
+                        self.send({"ok": False, "error": f"timed out after {req.get('timeout')}s"})
+                    return
+            self.send(slot.conn.recv())
+        except (OSError, EOFError, RuntimeError) as e:
+            slot.restart()
+            try:
+                self.send({"ok": False, "error": f"{type(e).__name__}: {e}"})
+            except OSError:
+                pass
+        finally:
+            self.server.idle.put(slot)
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def _bind(path: Path) -> _Server:
+    """Listen on path with mode 0600 inside a 0700 directory; refuse if a worker is live."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()  # stale socket from a worker that died
+        else:
+            raise SystemExit(f"ERROR: a worker is already listening on {path}")
+        finally:
+            probe.close()
+    umask = os.umask(0o177)
+    try:
+        server = _Server(str(path), _Handler)
+    finally:
+        os.umask(umask)
+    os.chmod(path, 0o600)
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm Marker worker for pdf2md.py")
+    parser.add_argument("--socket", default=str(worker_socket() or default_socket_path()),
+                        help="Unix socket path (default: $PDF2MD_WORKER or the runtime dir)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Model copies (parallel conversions); ~4 GB RAM each on CPU")
+    args = parser.parse_args()
+    path = Path(args.socket).expanduser()
+
+    server = _bind(path)  # before the slow model load: fail fast if one is running
+    import multiprocessing as mp
+    # spawn: never fork a process that already holds torch state
+    ctx = mp.get_context("spawn")
+    slots = [_Slot(ctx) for _ in range(max(1, args.workers))]
+    print(f"Loading Marker models into {len(slots)} worker(s)...")
+    for slot in slots:
+        slot.wait_ready()
+
+    server.idle = queue.Queue()
+    for slot in slots:
+        server.idle.put(slot)
+    server.workers = len(slots)
+    server.marker_version = _marker_version()
+    print(f"OK: listening on {path} (Ctrl-C to stop)")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # still remove the socket
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+        for slot in slots:
+            slot.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Section index sidecar for converted Markdown.
+
+pdf2md.py writes {stem}.index.json next to every {stem}.md. The index is
+built in one linear pass and holds byte and line offsets for:
+
+    headings    heading tree (level, title, line/offset ranges, page, children)
+    pages       <!-- page N --> markers → line/offset (and engine)
+    tables      Markdown table blocks (rows, section, page)
+    equations   display math blocks ($$...$$, \\begin{equation}...)
+    references  the References / Bibliography section and its entry count
+
+so a reader can seek straight to a section instead of loading the file.
+
+Usage:
+    python md_index.py paper.md                       # print the outline
+    python md_index.py paper.md --section Experiments # print one section
+    python md_index.py paper.md --table 2             # print the 2nd table
+    python md_index.py paper.md --page 5              # print page 5 (0-based)
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+INDEX_VERSION = 2  # 2: equations close only on their own delimiter
+
+HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t#]*$")
+PAGE_RE = re.compile(r"^<!-- page (\d+)(?: \(([\w-]+)\))? -->$")
+FENCE_RE = re.compile(r"^(```|~~~)")
+TABLE_RULE_RE = re.compile(r"^\|?\s*:?-{3,}")
+MATH_BEGIN_RE = re.compile(r"^\\begin\{([^}]+)\}")
+REFERENCES_RE = re.compile(r"^(?:\d+\.?\s+)?(references|bibliography|works cited)\b", re.I)
+REFERENCE_ENTRY_RE = re.compile(r"^(?:[-*]\s+|\[\d+\]|\d+\.\s)")
+
+
+def index_path(md: Path) -> Path:
+    return md.with_name(md.stem + ".index.json")
+
+
+def _closes_equation(line: str, end: str) -> bool:
+    """Whether line closes a display equation whose closing delimiter is end."""
+    return line.endswith(end) if end == "$$" else end in line
+
+
+def build_index(text: str) -> dict:
+    """Index Markdown text in a single pass over its lines."""
+    headings: list[dict] = []   # roots of the heading tree
+    stack: list[dict] = []      # open headings, outermost first
+    pages: list[dict] = []
+    tables: list[dict] = []
+    equations: list[dict] = []
+    references = None
+
+    page = None
+    table = equation = None
+    equation_end = None  # delimiter that closes the open equation: "$$" or "\end{env}"
+    in_fence = False
+    offset = 0
+    line_no = 0
+
+    def close_table(end: int, end_line: int):
+        nonlocal table
+        if table:
+            table.update(end_offset=end, end_line=end_line)
+            tables.append(table)
+            table = None
+
+    for line_no, raw in enumerate(text.splitlines(keepends=True), 1):
+        line = raw.rstrip("\r\n")
+        size = len(raw.encode("utf-8"))
+        stripped = line.strip()
+
+        if FENCE_RE.match(stripped):
+            in_fence = not in_fence
+        elif in_fence:
+            pass
+        elif equation is not None:
+            if _closes_equation(stripped, equation_end):
+                equation.update(end_offset=offset + size, end_line=line_no)
+                equations.append(equation)
+                equation = None
+        elif stripped.startswith("|"):
+            if table is None:
+                table = {"line": line_no, "offset": offset, "rows": 0, "page": page,
+                         "section": stack[-1]["title"] if stack else None}
+            if not TABLE_RULE_RE.match(stripped):
+                table["rows"] += 1
+        else:
+            close_table(offset, line_no - 1)
+            m = PAGE_RE.match(stripped)
+            h = HEADING_RE.match(line) if not m else None
+            if m:
+                page = int(m.group(1))
+                entry = {"page": page, "line": line_no, "offset": offset}
+                if m.group(2):
+                    entry["engine"] = m.group(2)
+                pages.append(entry)
+            elif h:
+                level = len(h.group(1))
+                while stack and stack[-1]["level"] >= level:
+                    node = stack.pop()
+                    node.update(end_offset=offset, end_line=line_no - 1)
+                node = {"level": level, "title": h.group(2), "line": line_no,
+                        "offset": offset, "page": page, "children": []}
+                (stack[-1]["children"] if stack else headings).append(node)
+                stack.append(node)
+                if REFERENCES_RE.match(h.group(2)):
+                    references = node
+            elif stripped.startswith("$$") or MATH_BEGIN_RE.match(stripped):
+                equation = {"line": line_no, "offset": offset, "page": page,
+                            "section": stack[-1]["title"] if stack else None}
+                begin = MATH_BEGIN_RE.match(stripped)
+                equation_end = rf"\end{{{begin.group(1)}}}" if begin else "$$"
+                rest = stripped[begin.end():] if begin else stripped[2:]
+                if _closes_equation(rest, equation_end):
+                    equation.update(end_offset=offset + size, end_line=line_no)
+                    equations.append(equation)
+                    equation = None
+            elif references is not None and references in stack and REFERENCE_ENTRY_RE.match(stripped):
+                references["entries"] = references.get("entries", 0) + 1
+        offset += size
+
+    close_table(offset, line_no)
+    for node in stack:
+        node.update(end_offset=offset, end_line=line_no)
+
+    ref = None
+    if references is not None:
+        ref = {key: references[key] for key in ("title", "line", "offset", "end_offset", "end_line", "page")}
+        ref["entries"] = references.get("entries", 0)
+    return {"version": INDEX_VERSION, "bytes": offset, "lines": line_no,
+            "headings": headings, "pages": pages, "tables": tables,
+            "equations": equations, "references": ref}
+
+
+def write_index(md: Path) -> Path:
+    """Build and write {stem}.index.json for md; returns the index path."""
+    index = build_index(md.read_text(encoding="utf-8"))
+    index["source"] = md.name
+    path = index_path(md)
+    path.write_text(json.dumps(index, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    return path
+
+
+def is_current(md: Path) -> bool:
+    """Whether md's index exists, is newer than md and has this INDEX_VERSION."""
+    path = index_path(md)
+    if not path.exists() or path.stat().st_mtime < md.stat().st_mtime:
+        return False
+    with open(path, encoding="utf-8") as f:
+        head = f.read(64)  # written compactly: {"version":N,...
+    return head.startswith(f'{{"version":{INDEX_VERSION},')
+
+
+def load_index(md: Path) -> dict:
+    """Index for md, rebuilding it if missing, stale or from an older INDEX_VERSION."""
+    if not is_current(md):
+        write_index(md)
+    return json.loads(index_path(md).read_text(encoding="utf-8"))
+
+
+def iter_headings(nodes: list[dict]):
+    for node in nodes:
+        yield node
+        yield from iter_headings(node["children"])
+
+
+def find_section(index: dict, query: str) -> dict | None:
+    """First heading whose title matches query (exact, then prefix, then substring)."""
+    q = query.lower().strip()
+    nodes = list(iter_headings(index["headings"]))
+    titles = [re.sub(r"^[\d.\s]+", "", n["title"]).lower() for n in nodes]
+    for test in (lambda t, full: t == q or full == q,
+                 lambda t, full: t.startswith(q),
+                 lambda t, full: q in full):
+        for node, title in zip(nodes, titles):
+            if test(title, node["title"].lower()):
+                return node
+    return None
+
+
+def read_range(md: Path, start: int, end: int) -> str:
+    """Read bytes [start, end) of md without loading the rest of the file."""
+    with open(md, "rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode("utf-8", errors="replace")
+
+
+def page_range(index: dict, page: int) -> tuple[int, int] | None:
+    marks = index["pages"]
+    for i, mark in enumerate(marks):
+        if mark["page"] == page:
+            end = marks[i + 1]["offset"] if i + 1 < len(marks) else index["bytes"]
+            return mark["offset"], end
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Section index for pdf2md Markdown output")
+    parser.add_argument("md", help="Markdown file produced by pdf2md.py")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--section", help="Print the section whose heading matches")
+    group.add_argument("--table", type=int, help="Print the N-th table (1-based)")
+    group.add_argument("--page", type=int, help="Print page N (0-based, as in <!-- page N -->)")
+    args = parser.parse_args()
+
+    md = Path(args.md)
+    if not md.exists():
+        print(f"ERROR: {md} not found", file=sys.stderr)
+        sys.exit(2)
+    index = load_index(md)
+
+    if args.section:
+        node = find_section(index, args.section)
+        if node is None:
+            print(f"ERROR: no section matching '{args.section}'", file=sys.stderr)
+            sys.exit(1)
+        print(read_range(md, node["offset"], node["end_offset"]))
+    elif args.table is not None:
+        if not 1 <= args.table <= len(index["tables"]):
+            print(f"ERROR: {len(index['tables'])} tables in {md.name}", file=sys.stderr)
+            sys.exit(1)
+        table = index["tables"][args.table - 1]
+        print(read_range(md, table["offset"], table["end_offset"]))
+    elif args.page is not None:
+        span = page_range(index, args.page)
+        if span is None:
+            print(f"ERROR: no <!-- page {args.page} --> marker in {md.name}", file=sys.stderr)
+            sys.exit(1)
+        print(read_range(md, *span))
+    else:
+        for node in iter_headings(index["headings"]):
+            page = f"  p{node['page']}" if node["page"] is not None else ""
+            print(f"{'  ' * (node['level'] - 1)}{node['title']}  "
+                  f"[lines {node['line']}-{node['end_line']}]{page}")
+        print(f"\n{len(index['tables'])} tables, {len(index['equations'])} display equations, "
+              f"{len(index['pages'])} page markers, {index['lines']} lines")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,102 @@
 Usage:
     python pdf2md.py <input.pdf> [--output <output.md>] [--pages 0,5-10]
                                  [--no-images] [--force]
+    python pdf2md.py <dir|glob|pdf>... [--output <dir>] [--jobs N] [--recursive]
+                                 [--summary results.json]
 
-Exit codes: 0=marker success, 1=fallback to txt, 2=total failure
+PDFs over 50 pages are split into page chunks converted in parallel, each
+with its own timeout, and stitched back into one file with <!-- page N -->
+markers (0-based, like --pages). With --route, each page is triaged and
+only pages with formulas, tables, figures or scans go to Marker; the rest
+are extracted with PyMuPDF, and each page marker names its engine.
+Every Markdown output gets a <stem>.index.json section index (md_index.py).
+With --stream, Markdown is appended in page order as chunks finish (5 pages
+each unless --chunk-pages is given) and <stem>.progress.json reports pages
+done/total and an ETA; a later successful non-streamed run removes it.
+
+Pages (or chunks) on which Marker fails or exceeds its per-page time budget
+are retried once in smaller pieces; only pages that still fail fall back to
+plain text, marked <!-- page N (pymupdf-fallback) --> or (pdftotext-fallback).
+
+Exit codes: 0=marker success, 1=fallback to txt, 2=total failure,
+3=Markdown with some pages degraded to plain text
+(batch mode: the worst exit code over all files, ordered 2 > 1 > 3 > 0;
+an existing output with degraded pages is skipped with exit code 3)
+
+If marker_worker.py is running, Marker conversions are sent to it instead of
+spawning marker_single (no per-PDF model warm-up).
 """
 import argparse
+import glob
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
 import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import marker_worker
+import md_index
+from pdf_cache import DEFAULT_MAX_MB, ConversionCache
+
+MARKER_RAM_GB = 4.0  # rough peak RSS of one CPU-only Marker conversion
+CHUNK_THRESHOLD = 50  # PDFs with more selected pages than this are chunked
+CHUNK_PAGES = 20
+STREAM_CHUNK_PAGES = 5  # --stream default: first Markdown after a few pages
+PAGE_BUDGET = 30  # Marker seconds per page before a chunk counts as failed
+MARKER_STARTUP = 120  # added to every Marker job's timeout (model load)
+
+PAGE_MARKER = "<!-- page {} ({}) -->"
+PAGE_MARKER_RE = re.compile(r"^<!-- page (\d+)(?: \(([\w-]+)\))? -->$")
+PAGE_MARKER_LINE_RE = re.compile(PAGE_MARKER_RE.pattern, re.M)
+EXIT_SEVERITY = (0, 3, 1, 2)  # least to most severe
+PAGINATE_RE = re.compile(r"^\{(\d+)\}-{48}[ \t]*$", re.M)
+HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t]*$", re.M)
+# stitching: chunk-boundary overlap must be this long to be dropped as a repeat,
+# and block delimiters / rules never count as repeats
+MIN_OVERLAP_CHARS = 40
+STRUCTURAL_LINE_RE = re.compile(
+    r"^(?:\$\$|\\[\[\]]|\\(?:begin|end)\{[^}]*\}|(?:```|~~~).*|[-*_](?:[ \t]*[-*_]){2,}"
+    r"|\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?)$")
+# per-page triage for --route
+SCANNED_MIN_CHARS = 40
+FIGURE_MIN_AREA = 0.15  # fraction of the page covered by raster images
+FIGURE_MIN_DRAWINGS = 60  # vector paths (plots, diagrams)
+FORMULA_MIN_SPANS = 3
+TABLE_MIN_RULES = 4  # ruled grid: horizontal and vertical line segments
+ROUTE_MAX_GAP = 1
+MATH_FONT_RE = re.compile(r"CMMI|CMSY|CMEX|MSBM|MSAM|Math|STIX|rsfs|eufm|Symbol", re.I)
+MATH_CHARS = frozenset("∑∏∫∮∂∇√∞≤≥≈≠≡∝∈∉⊂⊆⊇∪∩∀∃αβγδϵεζηθλμνξπρστφχψωΓΔΘΛΞΠΣΦΨΩ")
+SECTION_NUM_RE = re.compile(r"^(?:\*\*)?(\d+(?:\.\d+)*|[A-Z](?:\.\d+)+)\.?\s+\S")
+
 
 def convert_with_marker(pdf: Path, output: Path, *,
                         pages: str | None = None,
                         no_images: bool = False,
+                        paginate: bool = False,
                         timeout: int = 600) -> bool:
-    """Run marker_single, return True on success."""
+    """Convert via the warm worker if one is running, else marker_single.
+
+    paginate: keep Marker's "{N}-----" page separators in the output.
+    Returns True on success.
+    """
+    via_worker = convert_with_worker(pdf, output, pages=pages, no_images=no_images,
+                                     paginate=paginate, timeout=timeout)
+    if via_worker is not None:
+        return via_worker
+
     cmd = ["marker_single", str(pdf)]
     if pages:
         cmd += ["--page_range", pages]
     if no_images:
         cmd += ["--disable_image_extraction"]
+    if paginate:
+        cmd += ["--paginate_output"]
 
     with tempfile.TemporaryDirectory() as tmpdir:
         cmd += ["--output_dir", tmpdir]
@@ -54,8 +130,38 @@ def convert_with_marker(pdf: Path, output: Path, *,
     return True
 
 
-def convert_with_pdftotext(pdf: Path, output: Path) -> bool:
-    """Fallback: extract plain text via pdftotext or Python."""
+def convert_with_worker(pdf: Path, output: Path, *,
+                        pages: str | None = None,
+                        no_images: bool = False,
+                        paginate: bool = False,
+                        timeout: int = 600) -> bool | None:
+    """Send the job to a running marker_worker.py; None if none is listening."""
+    req = {"op": "convert", "pdf": str(pdf), "pages": pages,
+           "no_images": no_images, "paginate": paginate}
+    try:
+        resp = marker_worker.request(req, timeout=timeout)
+    except TimeoutError:
+        print(f"ERROR: marker worker timed out ({timeout}s)", file=sys.stderr)
+        return False
+    except (OSError, ValueError) as e:
+        print(f"ERROR: marker worker: {e}", file=sys.stderr)
+        return False
+    if resp is None:
+        return None
+
+    if not resp.get("ok"):
+        print(f"ERROR: marker worker: {resp.get('error', 'unknown error')}", file=sys.stderr)
+        return False
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(resp["markdown"], encoding="utf-8")
+    return True
+
+
+def convert_with_pdftotext(pdf: Path, output: Path) -> str | None:
+    """Fallback: extract plain text via pdftotext or Python.
+
+    Returns the engine used ("pdftotext" or "pymupdf"), or None on failure.
+    """
     # Try pdftotext (poppler)
     try:
         r = subprocess.run(["pdftotext", "-layout", str(pdf), "-"],
@@ -63,7 +169,7 @@ def convert_with_pdftotext(pdf: Path, output: Path) -> bool:
         if r.returncode == 0 and r.stdout.strip():
             output.parent.mkdir(parents=True, exist_ok=True)
             output.write_text(r.stdout, encoding="utf-8")
-            return True
+            return "pdftotext"
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
 
@@ -76,52 +182,963 @@ def convert_with_pdftotext(pdf: Path, output: Path) -> bool:
         if text.strip():
             output.parent.mkdir(parents=True, exist_ok=True)
             output.write_text(text, encoding="utf-8")
+            return "pymupdf"
+    except ImportError:
+        pass
+
+    return None
+
+
+def page_count(pdf: Path) -> int | None:
+    """Number of pages via PyMuPDF or pdfinfo; None if neither is available."""
+    try:
+        import fitz  # type: ignore
+        with fitz.open(str(pdf)) as doc:
+            return doc.page_count
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    try:
+        r = subprocess.run(["pdfinfo", str(pdf)], capture_output=True, text=True, timeout=30)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    m = re.search(r"^Pages:\s+(\d+)", r.stdout, re.M)
+    return int(m.group(1)) if m else None
+
+
+def parse_pages(spec: str | None, n_pages: int) -> list[int]:
+    """Marker-style page spec ("0,5-10,20", 0-based, inclusive) → sorted indices."""
+    if not spec:
+        return list(range(n_pages))
+    selected: set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        selected.update(range(int(lo), int(hi or lo) + 1))
+    return sorted(p for p in selected if 0 <= p < n_pages)
+
+
+def format_pages(pages: list[int]) -> str:
+    """Inverse of parse_pages: [0, 1, 2, 7] → "0-2,7"."""
+    parts = []
+    start = prev = None
+    for p in pages:
+        if prev is not None and p == prev + 1:
+            prev = p
+            continue
+        if start is not None:
+            parts.append(f"{start}-{prev}" if prev != start else str(start))
+        start = prev = p
+    if start is not None:
+        parts.append(f"{start}-{prev}" if prev != start else str(start))
+    return ",".join(parts)
+
+
+def plan_chunks(pages: list[int], chunk_pages: int) -> list[list[int]]:
+    """Split the selected pages into consecutive chunks of at most chunk_pages."""
+    return [pages[i:i + chunk_pages] for i in range(0, len(pages), chunk_pages)]
+
+
+def mark_pages(md: str, first_page: int, engine: str = "marker",
+               pages: list[int] | None = None) -> str:
+    """Replace Marker's "{N}-----" separators with <!-- page N (engine) --> markers.
+
+    Marker numbers pages either absolutely or from 0 within a --page_range
+    run; ids are shifted so the first marker is first_page either way.
+    Given the run's pages, run-relative ids over a non-contiguous selection
+    are mapped through them instead. A chunk without separators gets a
+    single marker at its start.
+    """
+    ids = [int(m.group(1)) for m in PAGINATE_RE.finditer(md)]
+    if not ids:
+        return PAGE_MARKER.format(first_page, engine) + "\n\n" + md.strip("\n")
+    shift = first_page - ids[0]
+    if pages and not set(ids) <= set(pages) and max(ids) - ids[0] < len(pages):
+        number = lambda n: pages[n - ids[0]]
+    else:
+        number = lambda n: n + shift
+    return PAGINATE_RE.sub(lambda m: PAGE_MARKER.format(number(int(m.group(1))), engine),
+                           md).strip("\n")
+
+
+def _heading_number(text: str) -> int | None:
+    """Depth of a numbered heading ("3" → 1, "3.2.1" → 3, "A.1" → 2), else None."""
+    m = SECTION_NUM_RE.match(text)
+    return m.group(1).count(".") + 1 if m else None
+
+
+def heading_base(chunks: list[str]) -> int:
+    """Level most chunks use for top-level numbered sections ("## 1 Intro" → 2)."""
+    levels = Counter()
+    for chunk in chunks:
+        for m in HEADING_RE.finditer(chunk):
+            if _heading_number(m.group(2)) == 1:
+                levels[len(m.group(1))] += 1
+    return levels.most_common(1)[0][0] if levels else 2
+
+
+def normalize_headings(chunk: str, base: int, *, first: bool) -> str:
+    """Give one separately converted chunk the document's heading scheme.
+
+    Numbered section headings get level base + depth - 1; chunks other than
+    the first may not open a new H1 (only the first carries the title).
+    """
+    def fix(m: re.Match) -> str:
+        text = m.group(2)
+        depth = _heading_number(text)
+        if depth is not None:
+            level = base + depth - 1
+        elif not first and len(m.group(1)) < base:
+            level = base
+        else:
+            return m.group(0)
+        return "#" * min(level, 6) + " " + text
+
+    return HEADING_RE.sub(fix, chunk)
+
+
+def _content_lines(lines: list[str]) -> list[tuple[int, str]]:
+    return [(i, l.strip()) for i, l in enumerate(lines)
+            if l.strip() and not PAGE_MARKER_RE.match(l.strip())]
+
+
+def _is_repeat(overlap: list[str]) -> bool:
+    """Whether boundary lines shared by two chunks are a carried-over repeat."""
+    return (sum(map(len, overlap)) >= MIN_OVERLAP_CHARS
+            and not any(STRUCTURAL_LINE_RE.match(l) for l in overlap))
+
+
+class Stitcher:
+    """Joins chunk Markdown in order, one piece at a time.
+
+    Lines that end one chunk and open the next (a paragraph or running header
+    carried over a page break) are kept once, provided the overlap is at
+    least MIN_OVERLAP_CHARS long and holds no structural line ($$, rules,
+    table separators, fences), which legitimately repeat. Concatenating the pieces
+    returned by add() gives the stitched document, so it works both for a
+    finished list of chunks and for streaming them to disk.
+    """
+
+    def __init__(self, base: int | None = None, max_overlap: int = 8):
+        self.base = base
+        self.max_overlap = max_overlap
+        self.tail: list[str] = []
+        self.count = 0
+
+    def add(self, chunk: str) -> str:
+        if self.base is None:
+            self.base = heading_base([chunk])
+        chunk = normalize_headings(chunk, self.base, first=self.count == 0)
+        lines = chunk.strip("\n").split("\n")
+        head = _content_lines(lines)[:self.max_overlap]
+        for k in range(min(len(self.tail), len(head)), 0, -1):
+            overlap = [l for _, l in head[:k]]
+            if self.tail[-k:] == overlap and _is_repeat(overlap):
+                drop = {i for i, _ in head[:k]}
+                lines = [l for i, l in enumerate(lines) if i not in drop]
+                break
+        self.tail = (self.tail + [l for _, l in _content_lines(lines)])[-self.max_overlap:]
+        text = re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip("\n")
+        if not text:
+            return ""
+        piece = text if self.count == 0 else "\n\n" + text
+        self.count += 1
+        return piece
+
+
+def stitch_chunks(chunks: list[str], max_overlap: int = 8) -> str:
+    """Join finished chunks into one document (see Stitcher)."""
+    stitcher = Stitcher(heading_base(chunks), max_overlap)
+    return "".join(stitcher.add(chunk) for chunk in chunks) + "\n"
+
+
+def progress_path(output: Path) -> Path:
+    return output.with_name(output.stem + ".progress.json")
+
+
+class Progress:
+    """Progress sidecar (<output stem>.progress.json) for streamed conversions.
+
+    Rewritten atomically whenever a part finishes: pages done/total, the
+    last page already appended to the output, elapsed time and ETA.
+    """
+
+    def __init__(self, pdf: Path, output: Path, total_pages: int):
+        self.path = progress_path(output)
+        self.state = {"pdf": str(pdf), "output": str(output), "status": "running",
+                      "pages_total": total_pages, "pages_done": 0,
+                      "written_through_page": None, "elapsed_s": 0.0, "eta_s": None}
+        self.start = time.monotonic()
+        self.write()
+
+    def update(self, **changes) -> None:
+        self.state.update(changes)
+        elapsed = time.monotonic() - self.start
+        done, total = self.state["pages_done"], self.state["pages_total"]
+        self.state["elapsed_s"] = round(elapsed, 1)
+        self.state["eta_s"] = round(elapsed / done * (total - done), 1) if done else None
+        self.write()
+
+    def write(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.state, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def assemble_parts(pdf: Path, output: Path, parts: list[tuple[list[int], object]], *,
+                   jobs: int = 1,
+                   stream: bool = False,
+                   engines: dict[int, str] | None = None) -> list[list[int]]:
+    """Run part jobs in a thread pool and write them to output in page order.
+
+    parts: (pages, job) in document order, where job() returns the part's
+    Markdown or None on failure. With stream=True each part is appended to
+    output as soon as it and all parts before it are done, and a progress
+    sidecar is kept up to date (listing degraded pages from engines at the
+    end). Returns the page lists of failed parts;
+    nothing is written (or the partial stream is removed) if any failed.
+    """
+    total = sum(len(pages) for pages, _ in parts)
+    progress = Progress(pdf, output, total) if stream else None
+    output.parent.mkdir(parents=True, exist_ok=True)
+    out = open(output, "w", encoding="utf-8") if stream else None
+    stitcher = Stitcher()
+    results: dict[int, str | None] = {}
+    failed: list[list[int]] = []
+    written = done = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            futures = {pool.submit(job): i for i, (_, job) in enumerate(parts)}
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                done += len(parts[i][0])
+                if results[i] is None:
+                    failed.append(parts[i][0])
+                    if stream:
+                        for f in futures:
+                            f.cancel()
+                        break
+                if not stream:
+                    continue
+                while written in results and results[written] is not None:
+                    out.write(stitcher.add(results[written]))
+                    out.flush()
+                    written += 1
+                progress.update(pages_done=done,
+                                written_through_page=parts[written - 1][0][-1] if written else None)
+    finally:
+        if out:
+            out.close()
+
+    if failed:
+        if stream:
+            output.unlink(missing_ok=True)
+            progress.update(status="failed")
+        return sorted(failed)
+    if stream:
+        with open(output, "a", encoding="utf-8") as out:
+            out.write("\n")
+        progress.update(status="done", degraded_pages=degraded_pages(engines or {}))
+    else:
+        output.write_text(stitch_chunks([results[i] for i in range(len(parts))]),
+                          encoding="utf-8")
+    return []
+
+
+def marker_timeout(n_pages: int, page_budget: int = PAGE_BUDGET) -> int:
+    return MARKER_STARTUP + page_budget * n_pages
+
+
+def marker_available() -> bool:
+    """A warm worker answers, or marker_single is on PATH."""
+    try:
+        if marker_worker.request({"op": "ping"}, timeout=5) is not None:
             return True
+    except (OSError, ValueError):
+        pass
+    return shutil.which("marker_single") is not None
+
+
+def convert_marker_chunk(pdf: Path, chunk: list[int], *,
+                         no_images: bool = False,
+                         timeout: int | None = None) -> str | None:
+    """Marker Markdown for one page chunk with page markers, or None on failure."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        part = Path(tmpdir) / "chunk.md"
+        if not convert_with_marker(pdf, part, pages=format_pages(chunk), no_images=no_images,
+                                   paginate=True, timeout=timeout or marker_timeout(len(chunk))):
+            return None
+        return mark_pages(part.read_text(encoding="utf-8"), chunk[0], pages=chunk)
+
+
+def extract_page_texts(pdf: Path, pages: list[int]) -> tuple[dict[int, str], str] | None:
+    """Plain text of single pages via PyMuPDF or pdftotext, with the engine used."""
+    try:
+        import fitz  # type: ignore
+        with fitz.open(str(pdf)) as doc:
+            return {p: doc[p].get_text().strip() for p in pages}, "pymupdf"
     except ImportError:
         pass
+    texts = {}
+    for p in pages:
+        try:
+            r = subprocess.run(["pdftotext", "-layout", "-f", str(p + 1), "-l", str(p + 1),
+                                str(pdf), "-"], capture_output=True, text=True, timeout=60)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        if r.returncode != 0:
+            return None
+        texts[p] = r.stdout.strip()
+    return texts, "pdftotext"
 
-    return False
 
+def convert_marker_isolated(pdf: Path, chunk: list[int], engines: dict[int, str], *,
+                            no_images: bool = False,
+                            page_budget: int = PAGE_BUDGET) -> str | None:
+    """Marker Markdown for a chunk, isolating the pages Marker cannot handle.
+
+    A failed or timed-out range is retried once as two halves, recursively,
+    so a single bad page cannot sink its neighbours; a single page that
+    fails on its own attempt is retried once more. Pages that still fail
+    are extracted as plain text. engines is filled with each page's engine
+    ("marker" or "<engine>-fallback"). Returns None only if the fallback
+    extraction is unavailable too.
+    """
+    def solve(pages: list[int], retry: bool) -> list[tuple[list[int], str | None]]:
+        md = convert_marker_chunk(pdf, pages, no_images=no_images,
+                                  timeout=marker_timeout(len(pages), page_budget))
+        if md is not None:
+            return [(pages, md)]
+        if len(pages) > 1:
+            mid = len(pages) // 2
+            print(f"WARN: Marker failed on pages {format_pages(pages)}, retrying in halves",
+                  file=sys.stderr)
+            return solve(pages[:mid], True) + solve(pages[mid:], True)
+        if not retry:
+            return solve(pages, True)
+        return [(pages, None)]
+
+    pieces = []
+    for pages, md in solve(chunk, False):
+        if md is not None:
+            engines.update(dict.fromkeys(pages, "marker"))
+            pieces.append(md)
+            continue
+        extracted = extract_page_texts(pdf, pages)
+        if extracted is None:
+            return None
+        texts, engine = extracted
+        for p in pages:
+            engines[p] = f"{engine}-fallback"
+            pieces.append(PAGE_MARKER.format(p, engines[p]) + "\n\n" + texts[p])
+    return "\n\n".join(pieces)
 
-def main():
-    parser = argparse.ArgumentParser(description="PDF → Markdown (Marker + TXT fallback)")
-    parser.add_argument("pdf", help="Input PDF path")
-    parser.add_argument("--output", "-o", help="Output path (default: same dir, .md extension)")
-    parser.add_argument("--pages", help="Page range, e.g. '0,5-10,20'")
-    parser.add_argument("--no-images", action="store_true", help="Skip image extraction")
-    parser.add_argument("--force", action="store_true", help="Overwrite existing output")
-    args = parser.parse_args()
 
-    pdf = Path(args.pdf).resolve()
+def degraded_pages(engines: dict[int, str]) -> list[int]:
+    return sorted(p for p, engine in engines.items() if engine.endswith("-fallback"))
+
+
+def recorded_degraded_pages(output: Path) -> list[int]:
+    """Degraded pages of an existing output, from its <!-- page N (engine) --> markers."""
+    try:
+        text = output.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return []
+    return degraded_pages({int(m.group(1)): m.group(2)
+                           for m in PAGE_MARKER_LINE_RE.finditer(text) if m.group(2)})
+
+
+def worst_exit_code(codes) -> int:
+    """Most severe exit code (2 > 1 > 3 > 0); 0 for no codes."""
+    return max(codes, key=EXIT_SEVERITY.index, default=0)
+
+
+def convert_chunked(pdf: Path, output: Path, chunks: list[list[int]], *,
+                    no_images: bool = False,
+                    jobs: int = 1,
+                    stream: bool = False,
+                    page_budget: int = PAGE_BUDGET) -> dict[int, str] | None:
+    """Convert page chunks in parallel with Marker, then stitch one Markdown file.
+
+    Every chunk runs as its own Marker job with a timeout of page_budget
+    seconds per page; failing pages are isolated (convert_marker_isolated).
+    Returns the page → engine map, or None if the output could not be built.
+    """
+    engines: dict[int, str] = {}
+
+    def job(chunk: list[int]):
+        return lambda: convert_marker_isolated(pdf, chunk, engines, no_images=no_images,
+                                               page_budget=page_budget)
+
+    print(f"Chunked: {len(chunks)} chunks of ≤{len(chunks[0])} pages, {jobs} in parallel")
+    failed = assemble_parts(pdf, output, [(c, job(c)) for c in chunks], jobs=jobs,
+                            stream=stream, engines=engines)
+    if failed:
+        print(f"ERROR: no text fallback for pages {', '.join(map(format_pages, failed))}",
+              file=sys.stderr)
+        return None
+    return engines
+
+
+def classify_page(page) -> str:
+    """Triage one PyMuPDF page: "text", "formula", "table", "figure" or "scanned"."""
+    text = page.get_text("text")
+    images = page.get_image_info()
+    rect = page.rect
+    covered = 0.0
+    for info in images:
+        x0, y0, x1, y1 = info["bbox"]
+        covered += (max(0.0, min(x1, rect.x1) - max(x0, rect.x0))
+                    * max(0.0, min(y1, rect.y1) - max(y0, rect.y0)))
+    image_area = covered / (rect.width * rect.height or 1.0)
+    if len(text.strip()) < SCANNED_MIN_CHARS and images:
+        return "scanned"
+
+    finder = getattr(page, "find_tables", None)  # PyMuPDF >= 1.23
+    if finder is not None:
+        try:
+            if finder().tables:
+                return "table"
+        except Exception:
+            pass
+    drawings = page.get_drawings()
+    horizontal = vertical = 0
+    for path in drawings:
+        for item in path["items"]:
+            if item[0] == "l":
+                (x0, y0), (x1, y1) = item[1], item[2]
+                horizontal += abs(y1 - y0) < 1 and abs(x1 - x0) > 20
+                vertical += abs(x1 - x0) < 1 and abs(y1 - y0) > 10
+            elif item[0] == "re":
+                horizontal += 2
+                vertical += 2
+    if horizontal >= TABLE_MIN_RULES and vertical >= TABLE_MIN_RULES - 1:
+        return "table"
+    if image_area > FIGURE_MIN_AREA or len(drawings) > FIGURE_MIN_DRAWINGS:
+        return "figure"
+
+    math_spans = 0
+    for block in page.get_text("dict")["blocks"]:
+        for line in block.get("lines", []):
+            for span in line["spans"]:
+                if MATH_FONT_RE.search(span["font"]) or MATH_CHARS.intersection(span["text"]):
+                    math_spans += 1
+    if math_spans >= FORMULA_MIN_SPANS:
+        return "formula"
+    return "text"
+
+
+def fast_page_markdown(page) -> str:
+    """Plain-prose page → Markdown via PyMuPDF: paragraphs plus font-size headings."""
+    blocks = []
+    sizes = Counter()
+    for block in page.get_text("dict")["blocks"]:
+        lines = []
+        size = 0.0
+        bold = True
+        for line in block.get("lines", []):
+            spans = [sp for sp in line["spans"] if sp["text"].strip()]
+            if not spans:
+                continue
+            lines.append("".join(sp["text"] for sp in line["spans"]).strip())
+            for sp in spans:
+                sizes[round(sp["size"], 1)] += len(sp["text"])
+                size = max(size, sp["size"])
+                bold = bold and bool(sp["flags"] & 16)
+        if lines:
+            blocks.append((lines, size, bold))
+    if not blocks:
+        return ""
+    body = sizes.most_common(1)[0][0]
+
+    out = []
+    for lines, size, bold in blocks:
+        text = ""
+        for line in lines:  # join lines, undoing end-of-line hyphenation
+            if text.endswith("-") and line[:1].islower():
+                text = text[:-1] + line
+            else:
+                text = f"{text} {line}" if text else line
+        short = len(text) < 120
+        if short and size >= body * 1.6:
+            out.append(f"# {text}")
+        elif short and (size >= body * 1.15 or (bold and SECTION_NUM_RE.match(text))):
+            out.append(f"## {text}")
+        else:
+            out.append(text)
+    return "\n\n".join(out)
+
+
+def have_pymupdf() -> bool:
+    try:
+        import fitz  # type: ignore  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def triage_pages(pdf: Path, pages: list[int]) -> dict[int, str]:
+    """Page index → kind for the selected pages."""
+    import fitz  # type: ignore
+    with fitz.open(str(pdf)) as doc:
+        return {p: classify_page(doc[p]) for p in pages}
+
+
+def plan_marker_runs(kinds: dict[int, str], max_pages: int) -> list[list[int]]:
+    """Group pages that need Marker into runs of at most max_pages.
+
+    A gap of up to ROUTE_MAX_GAP text pages between two Marker pages is
+    folded into the run: one Marker job is cheaper than two.
+    """
+    runs: list[list[int]] = []
+    pages = sorted(kinds)
+    for p in pages:
+        if kinds[p] == "text":
+            continue
+        if runs and p - runs[-1][-1] <= ROUTE_MAX_GAP + 1 and len(runs[-1]) < max_pages \
+                and all(q in kinds for q in range(runs[-1][-1] + 1, p)):
+            runs[-1].extend(range(runs[-1][-1] + 1, p + 1))
+        else:
+            runs.append([p])
+    return [run[i:i + max_pages] for run in runs for i in range(0, len(run), max_pages)]
+
+
+def convert_routed(pdf: Path, output: Path, pages: list[int], *,
+                   no_images: bool = False,
+                   chunk_pages: int = CHUNK_PAGES,
+                   jobs: int = 1,
+                   stream: bool = False,
+                   page_budget: int = PAGE_BUDGET) -> dict[int, str] | None:
+    """Per-page engine routing: PyMuPDF for plain prose, Marker for the rest.
+
+    Every selected page is triaged; formula, table, figure and scanned pages
+    go to Marker (in parallel runs), text-only pages are extracted directly.
+    Writes one Markdown file with a <!-- page N (engine) --> marker per page
+    and returns the page → engine map, or None if the output could not be
+    built. Failing Marker pages are isolated as in convert_chunked.
+    Requires PyMuPDF (see have_pymupdf).
+    """
+    kinds = triage_pages(pdf, pages)
+    runs = plan_marker_runs(kinds, chunk_pages or len(pages))
+    on_marker = {p for run in runs for p in run}
+    tally = Counter(kinds.values())
+    print(f"Routed: {len(pages) - len(on_marker)} pages fast path, {len(on_marker)} via Marker "
+          f"({', '.join(f'{n} {k}' for k, n in sorted(tally.items()))})")
+
+    import fitz  # type: ignore
+    with fitz.open(str(pdf)) as doc:
+        fast = {p: fast_page_markdown(doc[p]) for p in pages if p not in on_marker}
+
+    engines: dict[int, str] = {}
+
+    def marker_job(run: list[int]):
+        return lambda: convert_marker_isolated(pdf, run, engines, no_images=no_images,
+                                               page_budget=page_budget)
+
+    def fast_job(p: int):
+        return lambda: PAGE_MARKER.format(p, "pymupdf") + "\n\n" + fast[p]
+
+    parts = []
+    runs_by_start = {run[0]: run for run in runs}
+    for p in pages:
+        if p in fast:
+            parts.append(([p], fast_job(p)))
+            engines[p] = "pymupdf"
+        elif p in runs_by_start:
+            parts.append((runs_by_start[p], marker_job(runs_by_start[p])))
+
+    failed = assemble_parts(pdf, output, parts, jobs=jobs, stream=stream, engines=engines)
+    if failed:
+        print(f"ERROR: no text fallback for pages {', '.join(map(format_pages, failed))}",
+              file=sys.stderr)
+        return None
+    return dict(sorted(engines.items()))
+
+
+def _stream_incomplete(output: Path) -> bool:
+    """True if output's progress sidecar says a streamed conversion never finished."""
+    try:
+        return json.loads(progress_path(output).read_text(encoding="utf-8")).get("status") != "done"
+    except (OSError, ValueError):
+        return False
+
+
+def ensure_index(md: Path) -> Path | None:
+    """Write md's section index unless an up-to-date one exists; None on failure."""
+    path = md_index.index_path(md)
+    try:
+        if not md_index.is_current(md):
+            md_index.write_index(md)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"WARN: could not write {path.name}: {e}", file=sys.stderr)
+        return None
+    return path
+
+
+def _writable(output: Path) -> bool:
+    if output.exists():
+        return os.access(output, os.W_OK)
+    parent = output.parent
+    while not parent.exists() and parent != parent.parent:
+        parent = parent.parent
+    return os.access(parent, os.W_OK)
+
+
+def convert_one(pdf: Path, output: Path, *,
+                pages: str | None = None,
+                no_images: bool = False,
+                force: bool = False,
+                chunk_pages: int | None = None,
+                chunk_jobs: int = 1,
+                route: bool = False,
+                stream: bool = False,
+                page_budget: int = PAGE_BUDGET,
+                index: bool = True,
+                use_cache: bool = True,
+                cache_dir: str | None = None,
+                cache_size_mb: int | None = None) -> dict:
+    """Convert one PDF with Marker, falling back to plain text.
+
+    PDFs with more than CHUNK_THRESHOLD selected pages are converted as
+    chunk_pages-page chunks, chunk_jobs at a time (chunk_pages=0 disables;
+    default CHUNK_PAGES, or STREAM_CHUNK_PAGES with stream=True).
+    route=True triages every page and only sends pages that need it to
+    Marker (convert_routed). stream=True always converts in chunks and
+    appends each one to the output as soon as it is ready (assemble_parts).
+    Markdown outputs get a {stem}.index.json section index (md_index.py).
+    Marker results are stored in the shared conversion cache (pdf_cache.py)
+    and reused for any PDF with the same content and options.
+
+    Returns a result dict: pdf, output, engine, exit_code, seconds (and
+    index, degraded_pages).
+    """
+    start = time.monotonic()
+    result = {"pdf": str(pdf), "output": str(output), "engine": None, "exit_code": 2}
+    work = output  # or a scratch file in the cache when output's directory is read-only
+
+    def done(exit_code: int, engine: str | None, out: Path = output) -> dict:
+        if exit_code in (0, 3) and engine != "skipped" and _stream_incomplete(output):
+            progress_path(output).unlink(missing_ok=True)  # stale: output is complete now
+        if work != output:
+            progress_path(work).unlink(missing_ok=True)  # scratch sidecar: conversion is over
+        if index and exit_code in (0, 3) and out.suffix == ".md":
+            index_file = ensure_index(out)
+            if index_file is not None:
+                result["index"] = str(index_file)
+        result.update(exit_code=exit_code, engine=engine, output=str(out),
+                      seconds=round(time.monotonic() - start, 2))
+        return result
+
     if not pdf.exists():
         print(f"ERROR: {pdf} not found", file=sys.stderr)
-        sys.exit(2)
+        return done(2, None)
 
-    output = Path(args.output) if args.output else pdf.with_suffix(".md")
-    output = output.resolve()
+    if route and not have_pymupdf():
+        print("WARN: --route needs PyMuPDF (pip install pymupdf), converting normally",
+              file=sys.stderr)
+        route = False
+    n_pages = page_count(pdf)
+    if stream and not n_pages:
+        print("WARN: --stream needs the page count (PyMuPDF or pdfinfo), converting normally",
+              file=sys.stderr)
+        stream = False
+    if chunk_pages is None:
+        chunk_pages = STREAM_CHUNK_PAGES if stream else CHUNK_PAGES
+    selected = parse_pages(pages, n_pages) if n_pages else []
+    chunks = []
+    if stream or (chunk_pages and len(selected) > CHUNK_THRESHOLD):
+        chunks = plan_chunks(selected, chunk_pages or STREAM_CHUNK_PAGES)
 
-    if output.exists() and not args.force:
-        print(f"OK: {output} already exists (use --force to overwrite)")
-        sys.exit(0)
+    cache = key = None
+    if use_cache:
+        try:
+            cache = ConversionCache(cache_dir, cache_size_mb)
+            key = cache.key(pdf, {"pages": pages, "no_images": no_images,
+                                  "chunk_pages": chunk_pages if chunks or route else None,
+                                  "route": route, "page_markers": True})
+        except OSError as e:
+            print(f"WARN: conversion cache unavailable: {e}", file=sys.stderr)
+            cache = None
+
+    if output.exists() and not force and _stream_incomplete(output):
+        print(f"INFO: {output.name} is an unfinished streamed conversion, reconverting")
+        force = True
+    if output.exists() and not force:
+        recorded = cache.output_key(output) if cache else None
+        if recorded is None or recorded == key:
+            print(f"OK: {output} already exists (use --force to overwrite)")
+            degraded = recorded_degraded_pages(output)
+            if degraded:
+                result["degraded_pages"] = degraded
+                print(f"WARN: {output.name} has pages {format_pages(degraded)} degraded to "
+                      f"plain text; re-run them with --pages", file=sys.stderr)
+                return done(3, "skipped")
+            return done(0, "skipped")
+        print(f"INFO: {output.name} was converted from other content or options, reconverting")
+
+    writable = _writable(output)
+    if cache and not force:
+        hit = cache.get(key)
+        if hit:
+            cached, meta = hit
+            if not writable:
+                print(f"OK: cache hit, {output.parent} is read-only → {cached}")
+                return done(0, f"{meta.get('engine', 'marker')} (cached)", cached)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, output)
+            cache.record_output(output, key)
+            print(f"OK: cache hit → {output.name}")
+            return done(0, f"{meta.get('engine', 'marker')} (cached)")
+
+    if not writable:
+        if not cache:
+            print(f"ERROR: {output.parent} is not writable", file=sys.stderr)
+            return done(2, None)
+        print(f"WARN: {output.parent} is read-only, result will stay in the cache", file=sys.stderr)
+    work = output if writable else cache.scratch_path(key)
 
     # Try Marker first
     print(f"Converting: {pdf.name} → {output.name}")
-    if convert_with_marker(pdf, output, pages=args.pages, no_images=args.no_images):
-        lines = output.read_text().count("\n")
-        print(f"OK: Marker success ({lines} lines)")
-        sys.exit(0)
+    engine = "marker"
+    engines = None
+    if route and selected:
+        engines = convert_routed(pdf, work, selected, no_images=no_images, chunk_pages=chunk_pages,
+                                 jobs=chunk_jobs, stream=stream, page_budget=page_budget)
+        engine = "routed"
+    elif chunks:
+        engines = convert_chunked(pdf, work, chunks, no_images=no_images, jobs=chunk_jobs,
+                                  stream=stream, page_budget=page_budget)
+    elif convert_with_marker(pdf, work, pages=pages, no_images=no_images, paginate=True,
+                             timeout=marker_timeout(len(selected) or CHUNK_THRESHOLD, page_budget)):
+        work.write_text(mark_pages(work.read_text(encoding="utf-8"), selected[0] if selected else 0,
+                                   pages=selected) + "\n", encoding="utf-8")
+        engines = {}
+    elif len(selected) > 1 and marker_available():
+        print("WARN: Marker failed on the whole document, isolating the failing pages",
+              file=sys.stderr)
+        halves = plan_chunks(selected, (len(selected) + 1) // 2)  # whole run was try one
+        engines = convert_chunked(pdf, work, halves, no_images=no_images, jobs=chunk_jobs,
+                                  page_budget=page_budget)
+
+    degraded = degraded_pages(engines or {})
+    if engines is not None and len(degraded) == len(engines) and degraded:
+        work.unlink(missing_ok=True)  # nothing left of Marker: plain-text fallback below
+        engines = None
+    if engines is not None:
+        lines = work.read_text().count("\n")
+        if engine == "routed":
+            on_marker = sum(e == "marker" for e in engines.values())
+            print(f"OK: Routed success ({lines} lines; {on_marker} pages Marker, "
+                  f"{len(engines) - on_marker - len(degraded)} pages PyMuPDF)")
+        else:
+            print(f"OK: Marker success ({lines} lines)")
+        if degraded:
+            result["degraded_pages"] = degraded
+            print(f"WARN: pages {format_pages(degraded)} degraded to plain text "
+                  f"(formulas/tables lost); re-run them with --pages", file=sys.stderr)
+            if cache and writable:
+                # not cached, but a later run must see which conversion wrote output
+                cache.record_output(output, key)
+            return done(3, engine, work)
+        if cache:
+            cached = cache.put(key, work, {"engine": engine, "pdf": str(pdf),
+                                           "pages": pages, "no_images": no_images})
+            if writable:
+                cache.record_output(output, key)
+            else:
+                work.unlink(missing_ok=True)
+                print(f"OK: result → {cached}")
+                return done(0, engine, cached)
+        return done(0, engine)
 
     # Fallback to TXT
     print("WARN: Marker failed, falling back to plain text extraction", file=sys.stderr)
-    txt_output = output.with_suffix(".txt") if output.suffix == ".md" else output
-    if convert_with_pdftotext(pdf, txt_output):
+    txt_output = work.with_suffix(".txt") if work.suffix == ".md" else work
+    engine = convert_with_pdftotext(pdf, txt_output)
+    if engine:
         lines = txt_output.read_text().count("\n")
         print(f"OK: TXT fallback ({lines} lines) → {txt_output.name}")
         print("WARN: Plain text lacks formulas/tables. Consider fixing Marker.", file=sys.stderr)
-        sys.exit(1)
+        return done(1, engine, txt_output)
 
     print("ERROR: All conversion methods failed", file=sys.stderr)
-    sys.exit(2)
+    return done(2, None)
+
+
+def _available_ram_gb() -> float | None:
+    """MemAvailable from /proc/meminfo, else free physical pages; None if unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024 ** 2
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024 ** 3
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def default_jobs() -> int:
+    """Batch worker count bounded by CPU cores and by RAM per Marker process."""
+    # marker_single is itself multi-threaded; two cores per process avoids thrashing
+    by_cpu = max(1, (os.cpu_count() or 1) // 2)
+    ram = _available_ram_gb()
+    by_ram = max(1, int(ram // MARKER_RAM_GB)) if ram is not None else by_cpu
+    return min(by_cpu, by_ram)
+
+
+def collect_pdfs(inputs: list[str], *, recursive: bool = False) -> list[Path]:
+    """Expand files, directories and glob patterns into a de-duplicated PDF list."""
+    found: list[Path] = []
+    for item in inputs:
+        if glob.has_magic(item):
+            paths = [Path(p) for p in sorted(glob.glob(item, recursive=True))]
+        else:
+            paths = [Path(item)]
+        for path in paths:
+            if path.is_dir():
+                pattern = "**/*" if recursive else "*"
+                found += sorted(p for p in path.glob(pattern)
+                                if p.is_file() and p.suffix.lower() == ".pdf")
+            else:
+                found.append(path)
+    seen: set[Path] = set()
+    unique = []
+    for path in found:
+        path = path.resolve()
+        if path not in seen:
+            seen.add(path)
+            unique.append(path)
+    return unique
+
+
+def batch_outputs(pdfs: list[Path], out_dir: Path | None) -> list[Path]:
+    """Output .md path per PDF: beside it, or under out_dir mirroring the
+    inputs' directory tree relative to their common root.
+
+    Raises ValueError naming the inputs if two of them would write the same file.
+    """
+    if out_dir is None:
+        outputs = [pdf.with_suffix(".md") for pdf in pdfs]
+    else:
+        root = Path(os.path.commonpath([pdf.parent for pdf in pdfs]))
+        outputs = [(out_dir / pdf.relative_to(root)).with_suffix(".md") for pdf in pdfs]
+    claimed: dict[Path, Path] = {}
+    clashes = []
+    for pdf, output in zip(pdfs, outputs):
+        key = Path(os.path.normcase(output))
+        if key in claimed:
+            clashes.append(f"{claimed[key]} and {pdf} -> {output}")
+        else:
+            claimed[key] = pdf
+    if clashes:
+        raise ValueError("output collision: " + "; ".join(clashes))
+    return outputs
+
+
+def _convert_job(job: tuple[Path, Path, dict]) -> dict:
+    pdf, output, opts = job
+    return convert_one(pdf, output, **opts)
+
+
+def convert_batch(jobs: list[tuple[Path, Path, dict]], *, workers: int) -> list[dict]:
+    """Run convert_one over jobs in a bounded process pool, in input order."""
+    if workers <= 1 or len(jobs) <= 1:
+        return [_convert_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(_convert_job, jobs))
+
+
+def print_summary(results: list[dict]) -> None:
+    """Per-file engine / duration / exit status table, then totals."""
+    print(f"\n{'exit':>4}  {'engine':<16} {'seconds':>8}  file")
+    for r in results:
+        engine = r["engine"] or "-"
+        print(f"{r['exit_code']:>4}  {engine:<16} {r['seconds']:>8.1f}  {Path(r['pdf']).name}")
+    counts = {code: sum(r["exit_code"] == code for r in results) for code in (0, 1, 2, 3)}
+    total = sum(r["seconds"] for r in results)
+    print(f"{len(results)} files: {counts[0]} ok, {counts[3]} with degraded pages, "
+          f"{counts[1]} txt fallback, {counts[2]} failed ({total:.1f}s of conversion)")
+    for r in results:
+        if r.get("degraded_pages"):
+            print(f"  degraded: {Path(r['pdf']).name} pages {format_pages(r['degraded_pages'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF → Markdown (Marker + TXT fallback)")
+    parser.add_argument("pdf", nargs="+", help="Input PDF path(s), directories or glob patterns")
+    parser.add_argument("--output", "-o",
+                        help="Output path (default: same dir, .md extension); "
+                             "output directory in batch mode (input subfolders are mirrored)")
+    parser.add_argument("--pages", help="Page range, e.g. '0,5-10,20'")
+    parser.add_argument("--no-images", action="store_true", help="Skip image extraction")
+    parser.add_argument("--force", action="store_true", help="Overwrite existing output")
+    parser.add_argument("--chunk-pages", type=int, metavar="N",
+                        help=f"Convert PDFs over {CHUNK_THRESHOLD} pages as parallel N-page chunks "
+                             f"(default: {CHUNK_PAGES}, {STREAM_CHUNK_PAGES} with --stream; "
+                             f"0 disables)")
+    parser.add_argument("--route", action="store_true",
+                        help="Triage pages; extract plain-prose pages with PyMuPDF and send "
+                             "only formula/table/figure/scanned pages to Marker")
+    parser.add_argument("--stream", action="store_true",
+                        help="Append Markdown chunk by chunk as pages finish and keep "
+                             "<stem>.progress.json up to date")
+    parser.add_argument("--page-budget", type=int, default=PAGE_BUDGET, metavar="SEC",
+                        help=f"Marker seconds per page before a chunk is retried in smaller "
+                             f"pieces (default: {PAGE_BUDGET})")
+    parser.add_argument("--no-index", action="store_true",
+                        help="Do not write the <stem>.index.json section index")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Neither read nor write the shared conversion cache")
+    parser.add_argument("--cache-dir", help="Cache directory (default: $PDF2MD_CACHE_DIR or ~/.cache/pdf2md)")
+    parser.add_argument("--cache-size", type=int, metavar="MB",
+                        help=f"Cache size limit before LRU eviction (default: {DEFAULT_MAX_MB} MB)")
+    parser.add_argument("--recursive", "-r", action="store_true",
+                        help="Batch: also search subdirectories for PDFs")
+    parser.add_argument("--jobs", "-j", type=int,
+                        help="Parallel conversions: files in batch mode, chunks otherwise "
+                             "(default: from CPU cores and free RAM)")
+    parser.add_argument("--summary", help="Batch: also write the per-file results as JSON")
+    args = parser.parse_args()
+
+    opts = {"pages": args.pages, "no_images": args.no_images, "force": args.force,
+            "chunk_pages": args.chunk_pages, "route": args.route, "stream": args.stream,
+            "index": not args.no_index, "page_budget": args.page_budget,
+            "use_cache": not args.no_cache, "cache_dir": args.cache_dir,
+            "cache_size_mb": args.cache_size}
+    batch = len(args.pdf) > 1 or any(glob.has_magic(p) or Path(p).is_dir() for p in args.pdf)
+
+    if not batch:
+        pdf = Path(args.pdf[0]).resolve()
+        output = Path(args.output) if args.output else pdf.with_suffix(".md")
+        opts["chunk_jobs"] = args.jobs or default_jobs()
+        sys.exit(convert_one(pdf, output.resolve(), **opts)["exit_code"])
+
+    pdfs = collect_pdfs(args.pdf, recursive=args.recursive)
+    if not pdfs:
+        print("ERROR: no PDF files found", file=sys.stderr)
+        sys.exit(2)
+    out_dir = Path(args.output).resolve() if args.output else None
+    try:
+        outputs = batch_outputs(pdfs, out_dir)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(2)
+    jobs = [(pdf, output, opts) for pdf, output in zip(pdfs, outputs)]
+    workers = args.jobs or default_jobs()
+    print(f"Batch: {len(jobs)} PDFs, {min(workers, len(jobs))} parallel worker(s)")
+
+    results = convert_batch(jobs, workers=workers)
+    print_summary(results)
+    if args.summary:
+        Path(args.summary).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    sys.exit(worst_exit_code(r["exit_code"] for r in results))
 
 
 if __name__ == "__main__":
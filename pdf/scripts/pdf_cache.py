@@ -0,0 +1,165 @@
+"""Content-addressed cache of pdf2md conversions.
+
+Entries are keyed by the PDF's SHA-256 plus the conversion options and the
+engine version, so renamed or copied PDFs hit the same entry and changed
+options (--pages, --no-images) miss it. The cache lives in a shared
+directory and is bounded by size with least-recently-used eviction.
+
+Layout under the cache root ($PDF2MD_CACHE_DIR, default ~/.cache/pdf2md):
+
+    entries/<key>.md      converted Markdown
+    entries/<key>.json    metadata (engine, pdf hash, options, created)
+    entries/<key>.work.*  results that could not be written next to a
+                          read-only PDF (evicted like entries)
+    hashes.json           {pdf path: [size, mtime_ns, sha256]} stat memo
+    outputs.json          {output path: key} of outputs written by pdf2md
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+CACHE_FORMAT = 1
+DEFAULT_MAX_MB = 2048
+
+
+def default_cache_dir() -> Path:
+    if os.environ.get("PDF2MD_CACHE_DIR"):
+        return Path(os.environ["PDF2MD_CACHE_DIR"]).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pdf2md"
+
+
+def engine_version() -> str:
+    """Version string that invalidates entries when the converter changes."""
+    try:
+        from importlib.metadata import version
+        marker = version("marker-pdf")
+    except Exception:
+        marker = "none"
+    return f"pdf2md-{CACHE_FORMAT}/marker-{marker}"
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Atomic replace so concurrent batch workers never see a torn file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+class ConversionCache:
+    """Shared on-disk cache of converted Markdown with LRU size eviction."""
+
+    def __init__(self, root: Path | None = None, max_mb: int | None = None):
+        self.root = Path(root) if root else default_cache_dir()
+        if max_mb is None:
+            max_mb = int(os.environ.get("PDF2MD_CACHE_SIZE_MB", DEFAULT_MAX_MB))
+        self.max_bytes = max_mb * 1024 * 1024
+        self.entries = self.root / "entries"
+        self.entries.mkdir(parents=True, exist_ok=True)
+
+    # -- keys ---------------------------------------------------------------
+
+    def file_digest(self, pdf: Path) -> str:
+        """SHA-256 of the PDF; re-hashed only when its size or mtime changes."""
+        st = pdf.stat()
+        memo_path = self.root / "hashes.json"
+        memo = _read_json(memo_path)
+        hit = memo.get(str(pdf))
+        if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            return hit[2]
+
+        h = hashlib.sha256()
+        with open(pdf, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        memo[str(pdf)] = [st.st_size, st.st_mtime_ns, digest]
+        _write_json(memo_path, memo)
+        return digest
+
+    def key(self, pdf: Path, options: dict) -> str:
+        """Entry key for this PDF content, these options and this engine."""
+        material = json.dumps({"pdf": self.file_digest(pdf), "options": options,
+                               "engine": engine_version()}, sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    # -- entries ------------------------------------------------------------
+
+    def get(self, key: str) -> tuple[Path, dict] | None:
+        """Cached Markdown path and metadata, marking the entry recently used."""
+        path = self.entries / f"{key}.md"
+        meta = _read_json(self.entries / f"{key}.json")
+        if not path.exists() or not meta:
+            return None
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        return path, meta
+
+    def put(self, key: str, src: Path, meta: dict) -> Path:
+        """Store a copy of src under key, then evict down to the size limit."""
+        path = self.entries / f"{key}.md"
+        fd, tmp = tempfile.mkstemp(dir=self.entries, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, path)
+        _write_json(self.entries / f"{key}.json", {**meta, "created": time.time()})
+        self.evict(keep=key)
+        return path
+
+    def scratch_path(self, key: str) -> Path:
+        """Work file inside the cache, for outputs that cannot be written in place."""
+        return self.entries / f"{key}.work.md"
+
+    def evict(self, keep: str | None = None) -> int:
+        """Drop least-recently-used entries and scratch files until under max size; returns count."""
+        files = []
+        total = 0
+        for path in self.entries.iterdir():
+            if path.suffix != ".md" and ".work." not in path.name:
+                continue  # metadata and indexes go with their entry
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if path.name.split(".", 1)[0] == keep:
+                continue
+            path.unlink(missing_ok=True)
+            if ".work." not in path.name:
+                path.with_suffix(".json").unlink(missing_ok=True)
+                path.with_suffix(".index.json").unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    # -- outputs written next to PDFs -----------------------------------------
+
+    def output_key(self, output: Path) -> str | None:
+        """Key of the conversion that last wrote output, if pdf2md recorded one."""
+        return _read_json(self.root / "outputs.json").get(str(output))
+
+    def record_output(self, output: Path, key: str) -> None:
+        path = self.root / "outputs.json"
+        outputs = _read_json(path)
+        outputs[str(output)] = key
+        _write_json(path, outputs)
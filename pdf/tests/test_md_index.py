@@ -0,0 +1,53 @@
+"""Section index in md_index.py: display math must not swallow what follows it."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from md_index import build_index, find_section  # noqa: E402
+
+PAPER = r"""# 3 Method
+
+The objective is
+
+$$
+\begin{aligned}
+L &= a + b \\
+R &= c + d
+\end{aligned}
+$$
+
+# 4 Experiments
+
+| model | score |
+|-------|-------|
+| ours  | 1.0   |
+
+\begin{align}
+x &= 1 \\
+\end{align}
+
+# References
+
+[1] A. Author. A paper.
+"""
+
+
+def test_aligned_block_inside_dollars_is_one_equation():
+    index = build_index(PAPER)
+    assert [(e["line"], e["end_line"]) for e in index["equations"]] == [(5, 10), (18, 20)]
+
+
+def test_heading_table_and_references_after_math_are_indexed():
+    index = build_index(PAPER)
+    assert [h["title"] for h in index["headings"]] == ["3 Method", "4 Experiments", "References"]
+    assert len(index["tables"]) == 1 and index["tables"][0]["section"] == "4 Experiments"
+    assert index["references"]["entries"] == 1
+    assert find_section(index, "Experiments")["line"] == 12
+
+
+def test_one_line_equations_close_on_their_own_delimiter():
+    text = "$$ x = 1 $$\n\n\\begin{equation} y \\end{equation}\n\n# After\n"
+    index = build_index(text)
+    assert [(e["line"], e["end_line"]) for e in index["equations"]] == [(1, 1), (3, 3)]
+    assert [h["title"] for h in index["headings"]] == ["After"]
@@ -0,0 +1,45 @@
+"""Chunk stitching in pdf2md.py: boundary repeats are dropped, structure is not."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from pdf2md import Stitcher, stitch_chunks  # noqa: E402
+
+PARAGRAPH = "The encoder maps every token to a 512-dimensional embedding vector."
+
+
+def test_math_block_across_boundary_keeps_both_delimiters():
+    first = "# Method\n\nThe loss is\n\n$$\nL = a + b\n$$"
+    second = "$$\nR = c + d\n$$\n\nwhich we minimise."
+    out = stitch_chunks([first, second])
+    assert out.count("$$") == 4
+    assert "L = a + b\n$$\n\n$$\nR = c + d" in out
+
+
+def test_rules_and_table_separators_are_not_repeats():
+    first = "| a | b |\n|---|---|\n| 1 | 2 |\n\n---"
+    second = "---\n\n| c | d |\n|---|---|\n| 3 | 4 |"
+    out = stitch_chunks([first, second])
+    assert out.count("|---|---|") == 2
+    assert out.count("\n---\n") == 2
+
+
+def test_short_overlap_is_kept():
+    out = stitch_chunks(["Intro text.\n\nResults", "Results\n\nMore text."])
+    assert out.count("Results") == 2
+
+
+def test_carried_over_paragraph_is_dropped_once():
+    first = f"# Intro\n\nSome text.\n\n{PARAGRAPH}"
+    second = f"{PARAGRAPH}\n\nNext paragraph."
+    out = stitch_chunks([first, second])
+    assert out.count(PARAGRAPH) == 1
+    assert out.endswith("Next paragraph.\n")
+
+
+def test_streamed_pieces_match_stitch_chunks():
+    chunks = [f"# A\n\n{PARAGRAPH}", f"{PARAGRAPH}\n\n$$\nx\n$$", "$$\ny\n$$"]
+    stitcher = Stitcher()
+    streamed = "".join(stitcher.add(c) for c in chunks) + "\n"
+    assert streamed == stitch_chunks(chunks)